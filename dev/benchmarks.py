@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""Benchmark suite for template rendering, generation, icons and config saves.
+
+Each benchmark times one operation many times and reports the minimum,
+median, mean and standard deviation. Results are written as JSON together
+with the commit, Python and library versions, so runs from different
+releases can be compared:
+
+    python dev/benchmarks.py                        # run all, write JSON
+    python dev/benchmarks.py -k icon                # only matching benchmarks
+    python dev/benchmarks.py --compare old.json     # flag regressions
+
+With ``--compare`` the exit status is 1 if any benchmark's median got slower
+than the baseline by more than ``--threshold`` (default 25%).
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the src directory to Python path (go up one level from dev folder)
+DEV_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(DEV_DIR, '..', 'src'))
+
+RESULTS_DIR = os.path.join(DEV_DIR, "benchmark_results")
+
+BENCHMARKS = []
+
+CONTEXT = {
+    'project_name': "Bench App",
+    'sanitized_name': "bench_app",
+    'package_name': "bench_app",
+    'project_desc': "Benchmark project",
+    'python_version': "3.11",
+    'author_info': {"name": "Bench Author", "email": "bench@example.com"},
+    'os_type': 'unix',
+    'git_init': True,
+    'has_icon': False,
+}
+
+AUTHOR_INFO = {"name": "Bench Author", "email": "bench@example.com"}
+
+
+def benchmark(name, repeat=30, warmup=1):
+    """Register a benchmark.
+
+    The decorated function receives a scratch directory, does its setup and
+    returns the callable that is timed.
+    """
+    def decorator(func):
+        BENCHMARKS.append((name, repeat, warmup, func))
+        return func
+    return decorator
+
+
+def _counter_dir(root, prefix):
+    """Return a function giving a fresh, not yet existing path on each call."""
+    count = [0]
+
+    def next_dir():
+        count[0] += 1
+        return os.path.join(root, f"{prefix}_{count[0]}")
+    return next_dir
+
+
+# --- Template loading -------------------------------------------------------
+
+@benchmark("template.load.cold")
+def bench_template_cold(workdir):
+    """New loader without caches: parse and compile on first render."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    def step():
+        TemplateLoader(use_cache=False).load_template('README.md.template', **CONTEXT)
+    return step
+
+
+@benchmark("template.load.cold_bytecode")
+def bench_template_cold_bytecode(workdir):
+    """New loader with a populated bytecode cache."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    TemplateLoader(cache_dir=workdir).load_template('README.md.template', **CONTEXT)
+
+    def step():
+        TemplateLoader(cache_dir=workdir).load_template('README.md.template', **CONTEXT)
+    return step
+
+
+@benchmark("template.load.cold_precompiled")
+def bench_template_cold_precompiled(workdir):
+    """New frozen loader reading a precompiled template bundle."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    bundle = TemplateLoader(use_cache=False).compile_bundle(
+        os.path.join(workdir, "bundle")
+    )
+
+    def step():
+        TemplateLoader(precompiled_dir=bundle, frozen=True).load_template(
+            'README.md.template', **CONTEXT
+        )
+    return step
+
+
+@benchmark("template.load.warm", repeat=200)
+def bench_template_warm(workdir):
+    """Repeated render on one loader (template already compiled)."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    loader = TemplateLoader(use_cache=False, render_cache_size=0)
+
+    def step():
+        loader.load_template('README.md.template', **CONTEXT)
+    return step
+
+
+@benchmark("template.load.frozen", repeat=200)
+def bench_template_frozen(workdir):
+    """Repeated render on a frozen loader (no reload checks)."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    loader = TemplateLoader(use_cache=False, render_cache_size=0, frozen=True)
+
+    def step():
+        loader.load_template('README.md.template', **CONTEXT)
+    return step
+
+
+@benchmark("template.load.memoized", repeat=200)
+def bench_template_memoized(workdir):
+    """Repeated render served from the render cache."""
+    from template_project.generators.template_loader import TemplateLoader
+
+    loader = TemplateLoader(use_cache=False)
+
+    def step():
+        loader.load_template('README.md.template', **CONTEXT)
+    return step
+
+
+# --- Full generation --------------------------------------------------------
+
+def _generation(workdir, icon, git_init, **generator_options):
+    from template_project.generators.project_generator import ProjectGenerator
+
+    generator = ProjectGenerator(**generator_options)
+    icon_path = _make_image(workdir, 512) if icon else None
+    next_dir = _counter_dir(workdir, "project")
+
+    def step():
+        generator.create_project_structure(
+            project_dir=next_dir(),
+            project_name="Bench App",
+            project_desc="Benchmark project",
+            icon_path=icon_path,
+            author_info=AUTHOR_INFO,
+            git_init=git_init
+        )
+    return step
+
+
+@benchmark("generate.plain")
+def bench_generate_plain(workdir):
+    return _generation(workdir, icon=False, git_init=False)
+
+
+@benchmark("generate.icon")
+def bench_generate_icon(workdir):
+    return _generation(workdir, icon=True, git_init=False, use_icon_cache=False)
+
+
+@benchmark("generate.icon_cached")
+def bench_generate_icon_cached(workdir):
+    return _generation(workdir, icon=True, git_init=False)
+
+
+@benchmark("generate.dedup_hardlink")
+def bench_generate_dedup_hardlink(workdir):
+    """Repeated generation cloning identical files from the dedup store."""
+    return _generation(workdir, icon=False, git_init=False, dedup='hardlink')
+
+
+@benchmark("generate.git", repeat=15)
+def bench_generate_git(workdir):
+    if shutil.which("git") is None:
+        return None
+    return _generation(workdir, icon=False, git_init=True)
+
+
+@benchmark("generate.git_fast_import", repeat=15)
+def bench_generate_git_fast_import(workdir):
+    if shutil.which("git") is None:
+        return None
+    return _generation(workdir, icon=False, git_init=True, git_backend='fast-import')
+
+
+@benchmark("generate.icon_git", repeat=15)
+def bench_generate_icon_git(workdir):
+    if shutil.which("git") is None:
+        return None
+    return _generation(workdir, icon=True, git_init=True, use_icon_cache=False)
+
+
+def _large_tree(workdir, frozen):
+    """Plan and render a project from a tree of 400 extra templates."""
+    from template_project.generators.project_generator import ProjectGenerator
+
+    tree_dir = os.path.join(workdir, "large_tree")
+    if not os.path.isdir(tree_dir):
+        for module in range(20):
+            directory = os.path.join(tree_dir, "src", "{{ package_name }}",
+                                     f"module_{module}")
+            os.makedirs(directory)
+            for index in range(20):
+                path = os.path.join(directory, f"part_{index}.py.template")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write('"""Part {{ index }} of {{ project_name }}."""\n')
+    generator = ProjectGenerator(template_pack=tree_dir, frozen_templates=frozen)
+
+    def step():
+        plan = generator.build_plan("Bench App", "Benchmark project",
+                                    author_info=AUTHOR_INFO, git_init=False)
+        plan.resolve()
+    return step
+
+
+@benchmark("plan.large_tree")
+def bench_plan_large_tree(workdir):
+    return _large_tree(workdir, frozen=False)
+
+
+@benchmark("plan.large_tree_frozen")
+def bench_plan_large_tree_frozen(workdir):
+    return _large_tree(workdir, frozen=True)
+
+
+# --- Icon conversion --------------------------------------------------------
+
+def _make_image(workdir, size):
+    from PIL import Image
+
+    path = os.path.join(workdir, f"icon_{size}.png")
+    if not os.path.exists(path):
+        image = Image.new("RGB", (size, size * 3 // 4))
+        pixels = image.load()
+        for x in range(0, image.width, 7):
+            for y in range(0, image.height, 5):
+                pixels[x, y] = (x % 256, y % 256, (x * y) % 256)
+        image.save(path)
+    return path
+
+
+def _icon_conversion(workdir, size, use_icon_cache):
+    from template_project.generators.project_generator import ProjectGenerator
+    from template_project.generators.project_plan import ProjectPlan
+
+    generator = ProjectGenerator(use_icon_cache=use_icon_cache)
+    icon_path = _make_image(workdir, size)
+
+    def step():
+        plan = ProjectPlan()
+        generator._process_icon(icon_path, plan, "bench_app")
+        plan.resolve()
+    return step
+
+
+@benchmark("icon.small")
+def bench_icon_small(workdir):
+    return _icon_conversion(workdir, 64, use_icon_cache=False)
+
+
+@benchmark("icon.large", repeat=10)
+def bench_icon_large(workdir):
+    return _icon_conversion(workdir, 4096, use_icon_cache=False)
+
+
+@benchmark("icon.large_cached", repeat=10)
+def bench_icon_large_cached(workdir):
+    return _icon_conversion(workdir, 4096, use_icon_cache=True)
+
+
+# --- Config saves -----------------------------------------------------------
+
+@benchmark("config.save_keystrokes", repeat=10)
+def bench_config_keystrokes(workdir):
+    """Typing a 30 character project name: one save per keystroke."""
+    try:
+        from template_project.utils import ConfigManager
+    except ImportError:
+        # tkinter is not available
+        return None
+
+    config_manager = ConfigManager(os.path.join(workdir, "config.json"))
+    name = "My Keyboard Benchmark Project!"
+
+    def step():
+        for i in range(1, len(name) + 1):
+            config_manager.save_config({"project_name": name[:i]})
+        flush = getattr(config_manager, "flush", None)
+        if flush is not None:
+            flush()
+    return step
+
+
+# --- Runner -----------------------------------------------------------------
+
+def run_benchmark(name, repeat, warmup, func, scale=1.0):
+    """Run one benchmark in its own scratch directory.
+
+    Returns:
+        dict or None: Timing statistics in seconds, None if skipped
+    """
+    workdir = tempfile.mkdtemp(prefix="tp-bench-")
+    try:
+        step = func(workdir)
+        if step is None:
+            return None
+        for _ in range(warmup):
+            step()
+        times = []
+        for _ in range(max(3, int(repeat * scale))):
+            start = time.perf_counter()
+            step()
+            times.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        'repeat': len(times),
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def environment_info():
+    """Describe the machine and code the results were measured on."""
+    import jinja2
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=DEV_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import PIL
+        pillow = PIL.__version__
+    except ImportError:
+        pillow = None
+    return {
+        'commit': commit,
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'jinja2': jinja2.__version__,
+        'pillow': pillow,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print the change of each median against a baseline run.
+
+    Returns:
+        list: Names of benchmarks slower than ``threshold``
+    """
+    regressions = []
+    print(f"\n{'benchmark':32} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in results.items():
+        old = baseline.get('results', {}).get(name)
+        if not current or not old:
+            continue
+        change = current['median'] / old['median'] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        old_ms, current_ms = old['median'] * 1000, current['median'] * 1000
+        print(f"{name:32} {old_ms:9.3f}ms {current_ms:9.3f}ms {change:+7.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="*",
+                        help="Only run benchmarks matching this glob (default: all)")
+    parser.add_argument(
+        "-o", "--output",
+        help="Result file (default: dev/benchmark_results/<commit>.json)")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="Compare against an earlier result file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Slowdown counted as a regression (default: 0.25)")
+    parser.add_argument("--quick", action="store_true",
+                        help="Fewer repetitions, for smoke testing")
+    args = parser.parse_args(argv)
+
+    # Keep the user's caches out of the measurements
+    cache_root = tempfile.mkdtemp(prefix="tp-bench-cache-")
+    os.environ["TEMPLATE_PROJECT_CACHE_DIR"] = cache_root
+    pattern = args.pattern
+    if not any(c in pattern for c in "*?["):
+        pattern = f"*{pattern}*"
+
+    results = {}
+    try:
+        for name, repeat, warmup, func in BENCHMARKS:
+            if not fnmatch.fnmatch(name, pattern):
+                continue
+            stats = run_benchmark(name, repeat, warmup, func,
+                                  scale=0.2 if args.quick else 1.0)
+            results[name] = stats
+            if stats is None:
+                print(f"{name:32} skipped")
+            else:
+                print(f"{name:32} median {stats['median'] * 1000:9.3f}ms  "
+                      f"min {stats['min'] * 1000:9.3f}ms  (n={stats['repeat']})")
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+
+    report = {'environment': environment_info(), 'results': results}
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        label = report['environment']['commit'] or time.strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{label}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Test script for the asyncio generation API."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PIL import Image
+
+from template_project.generators import ProjectGenerator
+from template_project.generators.async_generator import AsyncProjectGenerator
+
+AUTHOR = {"name": "Async Tester", "email": "async@example.com"}
+
+
+def _read_tree(root):
+    files = {}
+    for dirpath, dirnames, names in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name != ".git"]
+        for name in names:
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+
+def test_many_generations_on_one_loop():
+    """Generations overlap up to the limit while the loop keeps running."""
+    print("Testing concurrent async generations...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, "icon.png")
+        Image.new("RGB", (300, 200), (200, 50, 50)).save(icon_path)
+        in_flight = []
+        peak = []
+
+        def track(event):
+            if event['kind'] == 'run_start':
+                in_flight.append(event['run'])
+                peak.append(len(in_flight))
+            elif event['kind'] == 'run':
+                in_flight.remove(event['run'])
+
+        async def main():
+            generator = AsyncProjectGenerator(max_concurrent=3,
+                                              git_backend='fast-import')
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            try:
+                await asyncio.gather(*(
+                    generator.create_project_structure(
+                        os.path.join(temp_dir, f"app_{i}"), f"App {i}", "Async test",
+                        icon_path=icon_path, author_info=AUTHOR, git_init=(i == 0),
+                        on_event=track,
+                    )
+                    for i in range(8)
+                ))
+            finally:
+                ticking.cancel()
+                await generator.close()
+            return ticks
+
+        ticks = asyncio.run(main())
+        assert max(peak) == 3, peak
+        assert ticks > 8, ticks
+        print(f"✓ 8 projects with at most 3 in flight; "
+              f"loop ran {ticks} times meanwhile")
+
+        sync_dir = os.path.join(temp_dir, "sync_app")
+        ProjectGenerator().create_project_structure(
+            sync_dir, "App 1", "Async test", icon_path=icon_path, author_info=AUTHOR,
+            git_init=False, staged=True)
+        expected = _read_tree(sync_dir)
+        actual = _read_tree(os.path.join(temp_dir, "app_1"))
+        lock = ".template_project.lock"
+        assert expected.keys() == actual.keys()
+        assert all(actual[path] == data
+                   for path, data in expected.items() if path != lock)
+        run_sh = os.path.join(temp_dir, "app_1", "run.sh")
+        assert os.access(run_sh, os.X_OK) or os.name == 'nt'
+        print("✓ Same files as the synchronous generator")
+
+        if shutil.which("git"):
+            app_dir = os.path.join(temp_dir, "app_0")
+            log = subprocess.run(["git", "log", "--format=%an"], cwd=app_dir,
+                                 capture_output=True, text=True, check=True).stdout
+            status = subprocess.run(["git", "status", "--porcelain"], cwd=app_dir,
+                                    capture_output=True, text=True, check=True).stdout
+            assert log.strip() == AUTHOR["name"] and status == "", (log, status)
+            print("✓ Initial commit created with async git processes")
+
+
+def test_cancellation_leaves_nothing_behind():
+    """Cancelling the task in any phase removes the staged project."""
+    print("Testing async cancellation...")
+    phases = ["plan", "render", "write", "git_init", "git_commit"]
+    if not shutil.which("git"):
+        phases = phases[:3]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async def cancel_in(phase):
+            generator = AsyncProjectGenerator()
+            task = None
+
+            def cancel_on(event):
+                if event['kind'] == 'phase_start' and event['name'] == phase:
+                    task.cancel()
+
+            task = asyncio.create_task(generator.create_project_structure(
+                os.path.join(temp_dir, f"cancelled_{phase}"), "Cancelled", "",
+                author_info=AUTHOR, on_event=cancel_on))
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            finally:
+                await generator.close()
+            return False
+
+        for phase in phases:
+            assert asyncio.run(cancel_in(phase)), phase
+            assert os.listdir(temp_dir) == [], (phase, os.listdir(temp_dir))
+    print(f"✓ Cancelled during {', '.join(phases)} without leftovers")
+
+
+if __name__ == "__main__":
+    print("=== Async Generator Test ===\n")
+    try:
+        test_many_generations_on_one_loop()
+        test_cancellation_leaves_nothing_behind()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
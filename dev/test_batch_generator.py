@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Test script for batch generation from JSONL and CSV manifests."""
+
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.batch_generator import BatchGenerator
+
+
+def _write(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def test_manifest_parsing():
+    """JSONL and CSV manifests become specs; author columns are folded in."""
+    print("Testing manifest parsing...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jsonl = _write(os.path.join(temp_dir, "projects.jsonl"),
+                       '# comment\n{"project_name": "One"}\n\n'
+                       '{"project_name": "Two", "git_init": false}\n')
+        assert BatchGenerator.load_manifest(jsonl) == [
+            {'project_name': "One"}, {'project_name': "Two", 'git_init': False},
+        ]
+
+        csv_path = _write(os.path.join(temp_dir, "projects.csv"),
+                          "project_name,author_name,email,git_init\n"
+                          "Alpha,Jane,jane@example.com,no\n"
+                          "Beta,,,\n")
+        specs = BatchGenerator.load_manifest(csv_path)
+        assert specs[1] == {'project_name': "Beta"}, "empty cells are dropped"
+        kwargs = BatchGenerator(output_dir=temp_dir).normalize_spec(specs[0])
+        assert kwargs['author_info'] == {'name': "Jane", 'email': "jane@example.com"}
+        assert kwargs['git_init'] is False
+        assert kwargs['project_dir'] == os.path.join(os.path.abspath(temp_dir), "alpha")
+
+        broken = _write(os.path.join(temp_dir, "broken.jsonl"), '{"project_name": \n')
+        try:
+            BatchGenerator.load_manifest(broken)
+            raise AssertionError("invalid JSON should be rejected")
+        except ValueError as e:
+            assert "broken.jsonl:1" in str(e)
+        try:
+            BatchGenerator().normalize_spec({'project_desc': "no name"})
+            raise AssertionError("a spec without a name should be rejected")
+        except ValueError as e:
+            assert "project_name" in str(e)
+    print("✓ JSONL and CSV manifests parsed and normalized")
+
+
+def test_invalid_rows_do_not_stop_fail_fast():
+    """A bad manifest row fails on its own; the valid projects still run."""
+    print("Testing invalid rows with fail-fast...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        specs = [{'project_name': f"App {i}", 'git_init': False} for i in range(3)]
+        specs.insert(1, {'project_desc': "missing name"})
+        batch = BatchGenerator(workers=1, output_dir=temp_dir, fail_fast=True)
+        report = batch.run(specs)
+        assert report.succeeded == 3, report.to_dict()
+        assert not any(result.skipped for result in report.results)
+        failed = [result for result in report.results if not result.ok]
+        assert [result.index for result in failed] == [1]
+        assert "Invalid entry 2" in failed[0].error
+        assert sorted(os.listdir(temp_dir)) == ["app_0", "app_1", "app_2"]
+    print("✓ 3 of 4 projects generated, the bad row reported")
+
+
+def test_fail_fast_skips_after_a_generation_failure():
+    """After a project fails to generate, the rest are skipped."""
+    print("Testing fail-fast after a failed generation...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "app_1"))
+        specs = [{'project_name': f"App {i}", 'git_init': False} for i in range(4)]
+        batch = BatchGenerator(workers=1, output_dir=temp_dir, fail_fast=True)
+        report = batch.run(specs)
+        outcome = [(result.ok, result.skipped) for result in report.results]
+        assert outcome == [(True, False), (False, False), (False, True),
+                           (False, True)], outcome
+        assert "FileExistsError" in report.results[1].error
+
+        # Without fail-fast every other project is still generated
+        report = BatchGenerator(workers=1, output_dir=temp_dir).run(
+            [{'project_name': f"App {i}", 'git_init': False} for i in range(1, 4)]
+        )
+        assert report.succeeded == 2 and report.failed == 1, report.to_dict()
+    print("✓ Remaining projects skipped after the first failure")
+
+
+if __name__ == "__main__":
+    print("=== Batch Generator Test ===\n")
+    try:
+        test_manifest_parsing()
+        test_invalid_rows_do_not_stop_fail_fast()
+        test_fail_fast_skips_after_a_generation_failure()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
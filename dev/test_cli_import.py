@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Import-time regression test for the headless ``generate`` command.
+
+Runs ``python -X importtime -m template_project generate ...`` in a clean
+interpreter and checks that no GUI or imaging module is imported and that the
+package import stays inside a time budget. Also checks that a failing
+generation ends with an error message rather than a traceback.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Top-level modules the CLI must never import when no icon is given
+FORBIDDEN_MODULES = ('tkinter', '_tkinter', 'ttkbootstrap', 'PIL')
+
+# Cumulative import time budget for the template_project package, in seconds.
+# Generous enough for slow CI machines, small enough to catch a GUI import.
+IMPORT_BUDGET = float(os.environ.get('CLI_IMPORT_BUDGET', '0.5'))
+
+
+def _parse_importtime(stderr):
+    """Return {module: cumulative_seconds} from ``-X importtime`` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative) / 1_000_000
+    return modules
+
+
+def test_generate_import_graph():
+    """The generate command loads Jinja2 and the generator core only."""
+    print("Testing CLI import graph...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-m', 'template_project',
+             'generate', 'Import Check', '--output-dir', temp_dir, '--no-git'],
+            capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert os.path.exists(os.path.join(temp_dir, 'import_check', 'pyproject.toml'))
+
+    modules = _parse_importtime(result.stderr)
+    loaded = sorted(
+        name for name in modules if name.split('.')[0] in FORBIDDEN_MODULES
+    )
+    assert not loaded, f"GUI/imaging modules imported by the CLI: {loaded}"
+    print("✓ No tkinter, ttkbootstrap or Pillow modules imported")
+
+    package_time = max(
+        seconds for name, seconds in modules.items()
+        if name.split('.')[0] == 'template_project'
+    )
+    assert package_time < IMPORT_BUDGET, (
+        f"template_project import took {package_time:.3f}s "
+        f"(budget {IMPORT_BUDGET:.3f}s)"
+    )
+    print(f"✓ template_project imported in {package_time * 1000:.1f} ms")
+
+
+def test_generate_reports_errors():
+    """A bad icon or an invalid template pack exits with a short error message."""
+    print("Testing CLI error reporting...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, 'icon.png')
+        with open(icon_path, 'w', encoding='utf-8') as f:
+            f.write("not an image\n")
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        result = subprocess.run(
+            [sys.executable, '-m', 'template_project', 'generate', 'Bad Icon',
+             '--output-dir', temp_dir, '--icon', icon_path, '--no-git'],
+            capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 1, result.stderr[-2000:]
+        assert result.stderr.startswith("Error:"), result.stderr[-2000:]
+        assert "Traceback" not in result.stderr, result.stderr[-2000:]
+        assert not os.path.exists(os.path.join(temp_dir, 'bad_icon'))
+    print("✓ Bad icon reported without a traceback")
+
+
+if __name__ == "__main__":
+    print("=== CLI Import Test ===\n")
+    try:
+        test_generate_import_graph()
+        test_generate_reports_errors()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Stress test running many generations concurrently on one ProjectGenerator."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+
+GENERATIONS = int(os.environ.get("CONCURRENT_GENERATIONS", "16"))
+
+
+def _list_files(root):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for filename in filenames:
+            files.append(os.path.relpath(os.path.join(dirpath, filename), root))
+    return sorted(files)
+
+
+def _generate(generator, temp_dir, index, git_init):
+    project_dir = os.path.join(temp_dir, f"app_{index}")
+    generator.create_project_structure(
+        project_dir=project_dir,
+        project_name="Stress App",
+        project_desc=f"Concurrent project {index}",
+        author_info={"name": "Test Author", "email": "test@example.com"},
+        git_init=git_init,
+        staged=index % 2 == 0
+    )
+    return project_dir
+
+
+def _run_stress(generator, git_init):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reference_dir = os.path.join(temp_dir, "reference")
+        ProjectGenerator().create_project_structure(
+            project_dir=reference_dir,
+            project_name="Stress App",
+            project_desc="Reference",
+            git_init=False
+        )
+        expected = _list_files(reference_dir)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            project_dirs = list(pool.map(
+                lambda index: _generate(generator, temp_dir, index, git_init),
+                range(GENERATIONS)
+            ))
+
+        assert os.getcwd() == cwd, "working directory changed"
+        leftovers = [name for name in os.listdir(temp_dir) if name.startswith(".")]
+        assert leftovers == [], leftovers
+        for index, project_dir in enumerate(project_dirs):
+            assert _list_files(project_dir) == expected, project_dir
+            with open(os.path.join(project_dir, "README.md"), encoding="utf-8") as f:
+                assert f"Concurrent project {index}" in f.read(), project_dir
+            if git_init:
+                status = subprocess.run(
+                    ["git", "status", "--porcelain"], cwd=project_dir,
+                    check=True, capture_output=True, text=True
+                ).stdout
+                assert status == "", (project_dir, status)
+
+
+def test_concurrent_generations():
+    """Generations sharing one generator do not interfere with each other."""
+    print(f"Testing {GENERATIONS} concurrent generations...")
+    _run_stress(ProjectGenerator(), git_init=False)
+    print("✓ Shared sequential generator")
+
+    generator = ProjectGenerator(concurrent=True)
+    try:
+        _run_stress(generator, git_init=False)
+    finally:
+        generator.close()
+    print("✓ Shared concurrent generator")
+
+    if shutil.which("git") is None:
+        print("Git not available, skipping git backends")
+        return
+    for backend in ("subprocess", "fast-import"):
+        _run_stress(ProjectGenerator(git_backend=backend), git_init=True)
+        print(f"✓ Shared generator with the {backend} git backend")
+
+
+if __name__ == "__main__":
+    print("=== Concurrent Generation Test ===\n")
+    try:
+        test_concurrent_generations()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Test script for the concurrent (thread pool) mode of a single generation."""
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PIL import Image
+
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import TemplateRenderError
+
+AUTHOR_INFO = {"name": "Test Author", "email": "test@example.com"}
+
+
+def _read_tree(root):
+    """Return {relative path: (bytes, executable)} for every file but .git."""
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                data = f.read()
+            executable = bool(os.stat(path).st_mode & stat.S_IXUSR)
+            tree[os.path.relpath(path, root)] = (data, executable)
+    return tree
+
+
+def _generate(generator, project_dir, icon_path, git_init):
+    try:
+        generator.create_project_structure(
+            project_dir=project_dir, project_name="Concurrent App",
+            project_desc="Concurrent mode test", icon_path=icon_path,
+            author_info=AUTHOR_INFO, git_init=git_init,
+        )
+    finally:
+        generator.close()
+
+
+def test_concurrent_output_matches_sequential():
+    """Concurrent mode writes exactly what a sequential generation writes."""
+    print("Testing concurrent output against sequential output...")
+    git_init = shutil.which("git") is not None
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, "icon.png")
+        Image.new("RGB", (300, 200), (200, 40, 40)).save(icon_path)
+
+        sequential_dir = os.path.join(temp_dir, "sequential")
+        concurrent_dir = os.path.join(temp_dir, "concurrent")
+        sequential_generator = ProjectGenerator(use_icon_cache=False)
+        concurrent_generator = ProjectGenerator(concurrent=True, max_workers=4,
+                                                use_icon_cache=False)
+        _generate(sequential_generator, sequential_dir, icon_path, git_init)
+        _generate(concurrent_generator, concurrent_dir, icon_path, git_init)
+
+        assert os.getcwd() == cwd, "working directory changed"
+        sequential = _read_tree(sequential_dir)
+        concurrent = _read_tree(concurrent_dir)
+        assert sorted(concurrent) == sorted(sequential)
+        for path, content in sequential.items():
+            assert concurrent[path] == content, path
+        assert concurrent[os.path.join("src", "concurrent_app", "assets", "icon.ico")]
+        assert concurrent["run.sh"][1], "run.sh should be executable"
+
+        if git_init:
+            status = subprocess.run(["git", "status", "--porcelain"],
+                                    cwd=concurrent_dir, capture_output=True,
+                                    text=True, check=True)
+            assert status.stdout == "", status.stdout
+            log = subprocess.run(["git", "log", "--oneline"], cwd=concurrent_dir,
+                                 capture_output=True, text=True, check=True)
+            assert len(log.stdout.splitlines()) == 1
+    print(f"✓ {len(concurrent)} files identical to a sequential run")
+
+
+def test_concurrent_failure_leaves_nothing_behind():
+    """A failing render stops a concurrent staged generation cleanly."""
+    print("Testing a failing render in concurrent mode...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = os.path.join(temp_dir, "broken_pack")
+        os.makedirs(pack_dir)
+        license_path = os.path.join(pack_dir, "LICENSE.template")
+        with open(license_path, "w", encoding="utf-8") as f:
+            f.write("{{ unclosed\n")
+        generator = ProjectGenerator(concurrent=True, strict=True,
+                                     template_pack=pack_dir)
+        out_dir = os.path.join(temp_dir, "out")
+        try:
+            generator.create_project_structure(
+                project_dir=os.path.join(out_dir, "broken_app"),
+                project_name="Broken App", project_desc="", git_init=False, staged=True,
+            )
+            raise AssertionError("the broken template should fail the generation")
+        except TemplateRenderError as e:
+            assert "LICENSE.template" in str(e)
+        finally:
+            generator.close()
+        assert not os.path.exists(out_dir) or os.listdir(out_dir) == [], \
+            os.listdir(out_dir)
+    print("✓ Render error raised and no project left behind")
+
+
+if __name__ == "__main__":
+    print("=== Concurrent Mode Test ===\n")
+    try:
+        test_concurrent_output_matches_sequential()
+        test_concurrent_failure_leaves_nothing_behind()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test script for the write-behind ConfigManager."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.utils import ConfigManager
+
+
+def test_saves_are_coalesced():
+    """A burst of saves results in one atomic write of the final state."""
+    print("Testing write-behind config saves...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_file, debounce=0.2)
+        flushes = []
+        flush = config_manager.flush
+
+        def counting_flush():
+            flushes.append(bool(config_manager._pending))
+            flush()
+
+        config_manager.flush = counting_flush
+
+        path = "/home/user/projects/some/rather/long/path"
+        for i in range(1, len(path) + 1):
+            config_manager.save_config({"output_dir": path[:i]})
+        assert not os.path.exists(config_file)
+        assert config_manager.get("output_dir") == path
+        print("✓ Saves update the in-memory copy without touching the disk")
+
+        time.sleep(0.5)
+        with open(config_file, encoding="utf-8") as f:
+            assert json.load(f)["output_dir"] == path
+        assert flushes == [True], flushes
+        assert os.listdir(temp_dir) == ["config.json"]
+        print("✓ Burst written once after the debounce window")
+
+        config_manager.save_config({"project_name": "Closing"})
+        config_manager.close()
+        assert ConfigManager(config_file).get("project_name") == "Closing"
+        print("✓ close() writes pending changes")
+
+
+def test_reads_are_cached_until_the_file_changes():
+    """Reads come from memory; an external write is picked up by mtime/size."""
+    print("Testing cached config reads...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = os.path.join(temp_dir, "config.json")
+        with open(config_file, "w", encoding="utf-8") as f:
+            json.dump({"author_name": "First"}, f)
+        config_manager = ConfigManager(config_file)
+        reads = []
+        read_config = config_manager._read_config
+
+        def counting_read():
+            reads.append(1)
+            return read_config()
+
+        config_manager._read_config = counting_read
+        for _ in range(100):
+            assert config_manager.get("author_name") == "First"
+        assert len(reads) == 1, reads
+        print("✓ Repeated reads parse the file once")
+
+        config_manager.save_config({"email": "me@example.com"})
+        with open(config_file, "w", encoding="utf-8") as f:
+            json.dump({"author_name": "Second writer"}, f)
+        assert config_manager.get("author_name") == "Second writer"
+        assert config_manager.get("email") == "me@example.com"
+        config_manager.close()
+        with open(config_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["author_name"] == "Second writer"
+        assert saved["email"] == "me@example.com"
+        print("✓ External changes reloaded, pending changes kept")
+
+        assert ConfigManager.shared(config_file) is ConfigManager.shared(config_file)
+        print("✓ One shared instance per config file")
+
+
+if __name__ == "__main__":
+    print("=== Config Manager Test ===\n")
+    try:
+        test_saves_are_coalesced()
+        test_reads_are_cached_until_the_file_changes()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Test script for deduplicated output (identical files cloned or hard-linked)."""
+
+import os
+import stat
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PIL import Image
+
+from template_project.generators.batch_generator import BatchGenerator
+from template_project.generators.project_generator import ProjectGenerator
+
+
+def _specs(count):
+    return [{'project_name': f"Dedup App {i}", 'author_name': "Jane", 'git_init': False}
+            for i in range(count)]
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _walk_files(root):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            yield os.path.join(dirpath, filename)
+
+
+def test_hardlink_batch_keeps_text_files_writable():
+    """Text files are never hard-linked: each project gets writable copies."""
+    print("Testing hard-link deduplication of text files...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plain_dir = os.path.join(temp_dir, "plain")
+        dedup_dir = os.path.join(temp_dir, "dedup")
+        BatchGenerator(workers=1, output_dir=plain_dir).run(_specs(3))
+        batch = BatchGenerator(workers=1, output_dir=dedup_dir, dedup='hardlink')
+        report = batch.run(_specs(3))
+        assert report.failed == 0, report.to_dict()
+        assert sorted(os.listdir(dedup_dir)) == sorted(os.listdir(plain_dir)), \
+            "dedup object directory left behind"
+
+        for plain in _walk_files(plain_dir):
+            deduped = os.path.join(dedup_dir, os.path.relpath(plain, plain_dir))
+            assert _read(plain) == _read(deduped), deduped
+            assert os.access(deduped, os.X_OK) == os.access(plain, os.X_OK), deduped
+            mode = os.stat(deduped).st_mode
+            assert mode & stat.S_IWUSR, f"{deduped} should stay writable"
+            assert os.stat(deduped).st_nlink == 1, f"{deduped} is hard-linked"
+
+        # Editing one project's file leaves the others alone
+        gitignore = os.path.join(dedup_dir, "dedup_app_0", ".gitignore")
+        with open(gitignore, "a", encoding="utf-8") as f:
+            f.write("local/\n")
+        other = os.path.join(dedup_dir, "dedup_app_1", ".gitignore")
+        assert not _read(other).endswith(b"local/\n")
+    print("✓ Generated text files writable and independent")
+
+
+def test_hardlink_shares_binary_assets():
+    """Identical icons share one read-only inode where the filesystem allows."""
+    print("Testing hard-link deduplication of icons...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, "icon.png")
+        Image.new("RGB", (64, 64), (20, 120, 200)).save(icon_path)
+        out_dir = os.path.join(temp_dir, "out")
+        generator = ProjectGenerator(dedup='hardlink', use_icon_cache=False)
+        try:
+            for name in ("one", "two"):
+                generator.create_project_structure(
+                    project_dir=os.path.join(out_dir, name), project_name="Icon App",
+                    project_desc="", icon_path=icon_path, git_init=False
+                )
+        finally:
+            generator.close()
+        assert sorted(os.listdir(out_dir)) == ["one", "two"], os.listdir(out_dir)
+
+        icon = os.path.join("src", "icon_app", "assets", "icon.ico")
+        first = os.stat(os.path.join(out_dir, "one", icon))
+        second = os.stat(os.path.join(out_dir, "two", icon))
+        if first.st_ino == second.st_ino:
+            assert not first.st_mode & stat.S_IWUSR, "shared file must be read-only"
+            print("✓ Identical icons hard-linked and read-only")
+        else:
+            print("✓ Filesystem cannot link here; icons written normally")
+        for path in _walk_files(out_dir):
+            if not path.endswith(".ico"):
+                assert os.stat(path).st_mode & stat.S_IWUSR, path
+
+
+def test_cached_icons_linked_without_extra_copies():
+    """Icons from the icon cache are linked; nothing is stored just to copy it."""
+    print("Testing hard-link deduplication with the icon cache...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        previous = os.environ.get("TEMPLATE_PROJECT_CACHE_DIR")
+        os.environ["TEMPLATE_PROJECT_CACHE_DIR"] = os.path.join(temp_dir, "cache")
+        try:
+            icon_path = os.path.join(temp_dir, "icon.png")
+            Image.new("RGB", (64, 64), (200, 120, 20)).save(icon_path)
+            out_dir = os.path.join(temp_dir, "out")
+            generator = ProjectGenerator(dedup='hardlink')
+            try:
+                for name in ("one", "two", "three"):
+                    generator.create_project_structure(
+                        project_dir=os.path.join(out_dir, name),
+                        project_name="Cached App", project_desc="",
+                        icon_path=icon_path, git_init=False
+                    )
+                stats = dict(generator.dedup_store.stats)
+            finally:
+                generator.close()
+        finally:
+            if previous is None:
+                os.environ.pop("TEMPLATE_PROJECT_CACHE_DIR", None)
+            else:
+                os.environ["TEMPLATE_PROJECT_CACHE_DIR"] = previous
+
+        assert stats['copy'] == 0, stats
+        icon = os.path.join("src", "cached_app", "assets", "icon.ico")
+        links = [os.stat(os.path.join(out_dir, name, icon)).st_nlink
+                 for name in ("one", "two", "three")]
+        if stats['reflink'] == 0:
+            # No reflinks here: only the icon was stored, text went straight out
+            assert stats['objects'] == 1 and stats['hardlink'] == 3, stats
+            assert all(count > 1 for count in links), links
+            print(f"✓ Cached icon hard-linked ({links}), text written directly")
+        else:
+            print(f"✓ Files reflinked without copies ({stats})")
+
+
+def test_update_never_writes_through_a_link():
+    """Updating one project replaces its linked files instead of editing them."""
+    print("Testing update of a deduplicated project...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = ProjectGenerator(dedup='hardlink')
+        for name in ("one", "two"):
+            generator.create_project_structure(
+                project_dir=os.path.join(temp_dir, name), project_name="Same App",
+                project_desc="", git_init=False
+            )
+        generator.close()
+        assert sorted(os.listdir(temp_dir)) == ["one", "two"], os.listdir(temp_dir)
+
+        before = _read(os.path.join(temp_dir, "two", "run.sh"))
+        generator = ProjectGenerator()
+        result = generator.update_project(os.path.join(temp_dir, "one"),
+                                          python_version="3.12")
+        assert "run.sh" in result.updated, result.updated
+        assert _read(os.path.join(temp_dir, "two", "run.sh")) == before
+        assert _read(os.path.join(temp_dir, "one", "run.sh")) != before
+    print("✓ Other projects unaffected by an update")
+
+
+if __name__ == "__main__":
+    print("=== Dedup Test ===\n")
+    try:
+        test_hardlink_batch_keeps_text_files_writable()
+        test_hardlink_shares_binary_assets()
+        test_cached_icons_linked_without_extra_copies()
+        test_update_never_writes_through_a_link()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
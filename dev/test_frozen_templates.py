@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test script for frozen (production) template loading."""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import TemplateLoader
+
+CONTEXT = {
+    'project_name': "Frozen App",
+    'sanitized_name': "frozen_app",
+    'package_name': "frozen_app",
+    'project_desc': "Frozen template test",
+    'python_version': "3.11",
+    'author_info': {'name': "Jane Doe"},
+    'os_type': 'unix',
+    'git_init': True,
+    'has_icon': False,
+}
+
+
+def _copy_templates(temp_dir):
+    template_dir = os.path.join(temp_dir, "templates")
+    shutil.copytree(TemplateLoader().template_dir, template_dir)
+    return template_dir
+
+
+def test_frozen_loader_never_touches_the_files():
+    """A frozen loader renders the same output after its directory is gone."""
+    print("Testing frozen template loader...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_dir = _copy_templates(temp_dir)
+        reloading = TemplateLoader(template_dir=template_dir, use_cache=False)
+        frozen = TemplateLoader(template_dir=template_dir, use_cache=False, frozen=True)
+        names = frozen.list_templates()
+        assert sorted(names) == sorted(reloading.list_templates())
+        expected = {name: reloading.render_template(name, **CONTEXT) for name in names}
+        hashes = {name: reloading.source_hash(name) for name in names}
+
+        shutil.rmtree(template_dir)
+        frozen.clear_render_cache()
+        for name in names:
+            assert frozen.render_template(name, **CONTEXT) == expected[name], name
+            assert frozen.source_hash(name) == hashes[name], name
+        assert 'project_name' in frozen.template_inputs('README.md.template')
+    print(f"✓ {len(names)} templates rendered from memory with the directory removed")
+
+
+def test_reload_only_without_freezing():
+    """Edits are picked up by the default loader but not by a frozen one."""
+    print("Testing reload in development mode...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_dir = _copy_templates(temp_dir)
+        reloading = TemplateLoader(template_dir=template_dir, use_cache=False)
+        frozen = TemplateLoader(template_dir=template_dir, use_cache=False, frozen=True)
+        original = frozen.render_template('LICENSE.template', **CONTEXT)
+        reloading.render_template('LICENSE.template', **CONTEXT)
+
+        path = os.path.join(template_dir, 'LICENSE.template')
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Edited license for {{ project_name }}\n")
+        # Make sure the modification time differs on coarse filesystems
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 2))
+
+        assert reloading.render_template('LICENSE.template', **CONTEXT) == \
+            "Edited license for Frozen App\n"
+        assert frozen.render_template('LICENSE.template', **CONTEXT) == original
+    print("✓ Default loader reloads edits, frozen loader keeps its snapshot")
+
+
+def test_frozen_generator_and_environment_switch():
+    """ProjectGenerator takes frozen_templates, and the env var sets the default."""
+    print("Testing frozen generation...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = ProjectGenerator(frozen_templates=True)
+        assert generator.template_loader.frozen
+        project_dir = os.path.join(temp_dir, "frozen_app")
+        generator.create_project_structure(project_dir, "Frozen App", "",
+                                           git_init=False, staged=True)
+        assert os.path.isfile(os.path.join(project_dir, "README.md"))
+
+        previous = os.environ.get("TEMPLATE_PROJECT_FROZEN_TEMPLATES")
+        os.environ["TEMPLATE_PROJECT_FROZEN_TEMPLATES"] = "1"
+        try:
+            assert TemplateLoader(use_cache=False).frozen
+            assert not TemplateLoader(use_cache=False, frozen=False).frozen
+        finally:
+            if previous is None:
+                del os.environ["TEMPLATE_PROJECT_FROZEN_TEMPLATES"]
+            else:
+                os.environ["TEMPLATE_PROJECT_FROZEN_TEMPLATES"] = previous
+        assert not TemplateLoader(use_cache=False).frozen
+    print("✓ Frozen generator works and the environment switch is honoured")
+
+
+if __name__ == "__main__":
+    print("=== Frozen Templates Test ===\n")
+    try:
+        test_frozen_loader_never_touches_the_files()
+        test_reload_only_without_freezing()
+        test_frozen_generator_and_environment_switch()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
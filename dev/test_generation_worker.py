@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test script for cancellable, queued background generation (GUI worker)."""
+
+import os
+import sys
+import tempfile
+import threading
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators import GenerationCancelled, ProjectGenerator
+from template_project.generators.instrumentation import Tracer
+from template_project.gui.generation_worker import GenerationWorker
+
+
+def _drain(worker):
+    """Wait for the worker to go idle and return its events."""
+    events = []
+    while True:
+        kind, job, payload = worker.events.get(timeout=60)
+        events.append((kind, job, payload))
+        if kind in ('finished', 'failed', 'cancelled') and not worker.busy \
+                and worker.events.empty():
+            return events
+
+
+def test_cancel_mid_generation_leaves_nothing():
+    """Cancelling after the first rendered file removes the staged build."""
+    print("Testing cancellation during generation...")
+    cancel = threading.Event()
+
+    def cancel_on_first_file(record):
+        if record['kind'] == 'file':
+            cancel.set()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = ProjectGenerator(tracer=Tracer(sinks=[cancel_on_first_file]))
+        try:
+            generator.create_project_structure(
+                project_dir=os.path.join(temp_dir, "cancelled_app"),
+                project_name="Cancelled App",
+                project_desc="",
+                git_init=False,
+                staged=True,
+                cancel=cancel
+            )
+        except GenerationCancelled:
+            pass
+        else:
+            raise AssertionError("Expected GenerationCancelled")
+        assert os.listdir(temp_dir) == [], os.listdir(temp_dir)
+    print("✓ Cancelled generation left nothing behind")
+
+
+def test_worker_runs_queue_and_reports_progress():
+    """Queued jobs run one after another and report per-file progress."""
+    print("Testing queued background generation...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        worker = GenerationWorker()
+        jobs = [
+            worker.submit(project_dir=os.path.join(temp_dir, f"app_{i}"),
+                          project_name=f"App {i}", project_desc="",
+                          git_init=False, staged=True)
+            for i in range(3)
+        ]
+        events = _drain(worker)
+        worker.shutdown()
+
+        finished = [job for kind, job, _ in events if kind == 'finished']
+        assert finished == jobs, events
+        for job in jobs:
+            progress = [p for kind, j, p in events if kind == 'progress' and j is job]
+            plan = next(e for e in progress
+                        if e['kind'] == 'phase' and e['name'] == 'plan')
+            assert plan['files'] > 0
+            assert any(e['kind'] == 'file' for e in progress)
+            assert os.path.isfile(os.path.join(job.project_dir, "README.md"))
+    print("✓ Three queued projects generated in order")
+
+
+def test_worker_cancel_all_drops_queue():
+    """cancel_all stops the running job and skips the queued ones."""
+    print("Testing cancelling the queue...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        worker = GenerationWorker()
+        for i in range(3):
+            worker.submit(project_dir=os.path.join(temp_dir, f"app_{i}"),
+                          project_name=f"App {i}", project_desc="",
+                          git_init=False, staged=True)
+        worker.cancel_all()
+        events = _drain(worker)
+        worker.shutdown()
+
+        assert [kind for kind, _, _ in events if kind != 'progress'][-1] == 'cancelled'
+        assert all(kind != 'failed' for kind, _, _ in events), events
+        assert os.listdir(temp_dir) == [], os.listdir(temp_dir)
+    print("✓ Queue cancelled without leftovers")
+
+
+if __name__ == "__main__":
+    print("=== Generation Worker Test ===\n")
+    try:
+        test_cancel_mid_generation_leaves_nothing()
+        test_worker_runs_queue_and_reports_progress()
+        test_worker_cancel_all_drops_queue()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
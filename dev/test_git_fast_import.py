@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Test script comparing the fast-import git backend with plain git commands."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+
+
+def _git(project_dir, *args):
+    return subprocess.run(
+        ["git", *args], cwd=project_dir, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_fast_import_matches_subprocess_backend():
+    """Both backends commit the same tree with the same author."""
+    print("Testing git fast-import backend...")
+    if shutil.which("git") is None:
+        print("Git not available, skipping")
+        return
+
+    author_info = {"name": "Test Author", "email": "test@example.com"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        trees = {}
+        for backend in ("subprocess", "fast-import"):
+            project_dir = os.path.join(temp_dir, backend)
+            ProjectGenerator(git_backend=backend).create_project_structure(
+                project_dir=project_dir,
+                project_name="Git App",
+                project_desc="Compare git backends",
+                author_info=author_info
+            )
+            trees[backend] = _git(project_dir, "ls-tree", "-r", "HEAD")
+            assert _git(project_dir, "status", "--porcelain") == ""
+            assert _git(project_dir, "log", "--format=%an <%ae>") == \
+                "Test Author <test@example.com>\n"
+
+        assert trees["subprocess"] == trees["fast-import"], trees
+        assert "dev/README.md" not in trees["fast-import"]
+        assert "100755" in trees["fast-import"]  # run.sh
+    print("✓ fast-import commit matches `git add . && git commit`")
+
+
+# Paths a pack's .gitignore must treat exactly as git does
+PACK_GITIGNORE = "**/build\nfoo/*.txt\na/**/b\nlogs/\n!logs/keep.txt\n"
+PACK_FILES = (
+    "build/x.txt", "src/build/y.txt", "foo/y.txt", "foo/bar/y.txt",
+    "a/b/f.txt", "a/x/y/b/f.txt", "a/bb/f.txt", "logs/keep.txt", "kept.txt",
+)
+
+
+def test_pack_gitignore_matches_git():
+    """Patterns of a pack's .gitignore are applied with git's own rules."""
+    print("Testing .gitignore patterns with the fast-import backend...")
+    if shutil.which("git") is None:
+        print("Git not available, skipping")
+        return
+
+    author_info = {"name": "Test Author", "email": "test@example.com"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = os.path.join(temp_dir, "ignore_pack")
+        for path in (".gitignore", *PACK_FILES):
+            template_path = os.path.join(pack_dir, *f"{path}.template".split("/"))
+            os.makedirs(os.path.dirname(template_path), exist_ok=True)
+            with open(template_path, "w", encoding="utf-8") as f:
+                f.write(PACK_GITIGNORE if path == ".gitignore" else f"{path}\n")
+
+        trees = {}
+        for backend in ("subprocess", "fast-import"):
+            project_dir = os.path.join(temp_dir, backend)
+            generator = ProjectGenerator(git_backend=backend, template_pack=pack_dir)
+            generator.create_project_structure(
+                project_dir=project_dir, project_name="Ignore App",
+                project_desc="", author_info=author_info
+            )
+            trees[backend] = _git(project_dir, "ls-files")
+            # Nothing the commit left out shows up as untracked afterwards
+            assert _git(project_dir, "status", "--porcelain") == "", backend
+
+        assert trees["subprocess"] == trees["fast-import"], trees
+        committed = set(trees["fast-import"].splitlines())
+        assert committed & set(PACK_FILES) == {"foo/bar/y.txt", "a/bb/f.txt",
+                                               "kept.txt"}, committed
+    print("✓ **/build, foo/*.txt, a/**/b and negations match `git add .`")
+
+
+if __name__ == "__main__":
+    print("=== Git fast-import Test ===\n")
+    try:
+        test_fast_import_matches_subprocess_backend()
+        test_pack_gitignore_matches_git()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
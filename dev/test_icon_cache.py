@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Test script for the content-addressed icon cache."""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.icon_cache import IconCache
+from template_project.generators.project_generator import ProjectGenerator
+
+
+def test_icon_cache_reuses_conversion():
+    """A second generation with the same image is served from the cache."""
+    print("Testing icon cache...")
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, "logo.png")
+        Image.new("RGBA", (300, 200), (200, 40, 40, 255)).save(icon_path)
+
+        generator = ProjectGenerator()
+        generator.icon_cache = IconCache(os.path.join(temp_dir, "cache"))
+        calls = []
+        convert_icon = generator._convert_icon
+
+        def counting_convert(path):
+            calls.append(path)
+            return convert_icon(path)
+
+        generator._convert_icon = counting_convert
+
+        icons = []
+        for name in ("first", "second"):
+            generator.create_project_structure(
+                project_dir=os.path.join(temp_dir, name),
+                project_name="Icon App",
+                project_desc="Icon cache test",
+                icon_path=icon_path,
+                git_init=False
+            )
+            with open(os.path.join(temp_dir, name, "src", "icon_app", "assets",
+                                   "icon.ico"), "rb") as f:
+                icons.append(f.read())
+
+        assert len(calls) == 1, calls
+        assert icons[0] == icons[1] and icons[0][:4] == b"\x00\x00\x01\x00"
+        assert len(os.listdir(generator.icon_cache.directory)) == 1
+        print("✓ Second generation reused the cached icon")
+
+
+def test_icon_cache_evicts_least_recently_used():
+    """Entries beyond the size limit are evicted oldest first."""
+    print("Testing icon cache eviction...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = IconCache(temp_dir, max_bytes=250)
+        now = time.time()
+        for index, key in enumerate(("a", "b")):
+            cache.put(key, b"x" * 100)
+            os.utime(cache.path(key), (now - 100 + index, now - 100 + index))
+        assert cache.get("a") is not None  # "a" becomes the most recent
+        cache.put("c", b"x" * 100)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        print("✓ Least recently used entry evicted")
+
+
+if __name__ == "__main__":
+    print("=== Icon Cache Test ===\n")
+    try:
+        test_icon_cache_reuses_conversion()
+        test_icon_cache_evicts_least_recently_used()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Test script for generation timing spans and profiling hooks."""
+
+import json
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.instrumentation import (
+    JsonLinesSink,
+    MemorySink,
+    Tracer,
+)
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import (
+    TemplateLoader,
+    TemplateRenderError,
+)
+
+
+def test_spans_cover_phases_and_files():
+    """A traced generation reports every phase and every rendered file."""
+    print("Testing instrumentation spans...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory = MemorySink()
+        spans_path = os.path.join(temp_dir, "spans.jsonl")
+        profile_dir = os.path.join(temp_dir, "profiles")
+        tracer = Tracer(sinks=[memory, JsonLinesSink(spans_path)],
+                        profile_dir=profile_dir)
+        generator = ProjectGenerator(tracer=tracer)
+        generator.create_project_structure(
+            project_dir=os.path.join(temp_dir, "traced"),
+            project_name="Traced App",
+            project_desc="Instrumentation test",
+            git_init=False,
+            staged=True
+        )
+        tracer.close()
+
+        phases = [r['name'] for r in memory.records if r['kind'] == 'phase']
+        assert phases == ["plan", "mkdir", "render", "write", "publish"], phases
+        files = {r['name']: r for r in memory.records if r['kind'] == 'file'}
+        plan_span = next(r for r in memory.records
+                         if r['kind'] == 'phase' and r['name'] == 'plan')
+        written = sum(len(names)
+                      for _, _, names in os.walk(os.path.join(temp_dir, "traced")))
+        assert plan_span['files'] == written, (plan_span, written)
+        assert files["README.md"]['template'] == "README.md.template"
+        with open(os.path.join(temp_dir, "traced", "README.md"), "rb") as f:
+            assert files["README.md"]['bytes'] == len(f.read())
+        runs = [r for r in memory.records if r['kind'] == 'run']
+        assert len(runs) == 1 and runs[0]['status'] == 'ok'
+        assert {r['run'] for r in memory.records} == {runs[0]['run']}
+        print("✓ Phase, file and run spans recorded")
+
+        with open(spans_path, encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == memory.records
+        print("✓ JSON-lines sink matches")
+
+        profiles = os.listdir(profile_dir)
+        assert len(profiles) == 1, profiles
+        pstats.Stats(os.path.join(profile_dir, profiles[0]))
+        print("✓ cProfile dump written")
+
+
+def test_event_stream_reports_progress():
+    """iter_events yields start/end events and the bytes written."""
+    print("Testing progress event stream...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_dir = os.path.join(temp_dir, "events")
+        events = list(ProjectGenerator().iter_events(
+            project_dir=project_dir, project_name="Events App",
+            project_desc="", git_init=False, staged=True
+        ))
+        kinds = [e['kind'] for e in events]
+        assert kinds[0] == 'run_start' and kinds[-1] == 'run', kinds
+        starts = [e['name'] for e in events if e['kind'] == 'phase_start']
+        ends = [e['name'] for e in events if e['kind'] == 'phase']
+        assert starts == ends == ["plan", "mkdir", "render", "write", "publish"], \
+            (starts, ends)
+        write = next(e for e in events if e['kind'] == 'phase' and e['name'] == 'write')
+        on_disk = sum(os.path.getsize(os.path.join(root, name))
+                      for root, _, names in os.walk(project_dir) for name in names)
+        assert write['bytes'] == on_disk, (write, on_disk)
+    print("✓ Phase start/end events and bytes written reported")
+
+
+def _broken_generator(temp_dir, strict):
+    """A generator whose README template has a syntax error."""
+    template_dir = os.path.join(temp_dir, "templates")
+    shutil.copytree(TemplateLoader().template_dir, template_dir, dirs_exist_ok=True)
+    with open(os.path.join(template_dir, "README.md.template"), "w") as f:
+        f.write("{{ broken ")
+    generator = ProjectGenerator(strict=strict)
+    generator.template_loader = TemplateLoader(template_dir=template_dir,
+                                               use_cache=False, strict=strict)
+    return generator
+
+
+def test_template_errors_warn_or_fail():
+    """A broken template is a warning by default and an error when strict."""
+    print("Testing template error reporting...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = _broken_generator(temp_dir, strict=False)
+        events = list(generator.iter_events(
+            project_dir=os.path.join(temp_dir, "lenient"), project_name="Lenient",
+            project_desc="", git_init=False, staged=True
+        ))
+        warnings = [e for e in events if e['kind'] == 'warning']
+        assert [w['name'] for w in warnings] == ["README.md"], warnings
+        assert os.path.getsize(os.path.join(temp_dir, "lenient", "README.md")) == 0
+        print("✓ Lenient mode reports a warning and writes an empty file")
+
+        generator = _broken_generator(temp_dir, strict=True)
+        events = []
+        try:
+            for event in generator.iter_events(
+                    project_dir=os.path.join(temp_dir, "strict"), project_name="Strict",
+                    project_desc="", git_init=False, staged=True):
+                events.append(event)
+        except TemplateRenderError as e:
+            assert e.template == "README.md.template"
+        else:
+            raise AssertionError("Expected TemplateRenderError")
+        errors = [e for e in events if e['kind'] == 'error']
+        assert len(errors) == 1 and errors[0]['error'] == 'TemplateRenderError', errors
+        assert not os.path.exists(os.path.join(temp_dir, "strict"))
+        print("✓ Strict mode stops with an error event and leaves nothing behind")
+
+
+if __name__ == "__main__":
+    print("=== Instrumentation Test ===\n")
+    try:
+        test_spans_cover_phases_and_files()
+        test_event_stream_reports_progress()
+        test_template_errors_warn_or_fail()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
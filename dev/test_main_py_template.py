@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from template_project.generators.template_loader import TemplateLoader
 
+MAIN_TEMPLATE = 'src/{{ package_name }}/main.py.template'
 
 def test_main_py_template():
     """Test the main.py template for correct indentation."""
@@ -33,7 +34,8 @@ def test_main_py_template():
     try:
         # Test with icon
         print("\n=== Testing with icon ===")
-        main_content_with_icon = loader.load_template('main.py.template', **test_context_with_icon)
+        main_content_with_icon = loader.load_template(MAIN_TEMPLATE,
+                                                      **test_context_with_icon)
 
         # Check for syntax errors by trying to compile
         compile(main_content_with_icon, '<string>', 'exec')
@@ -41,7 +43,8 @@ def test_main_py_template():
 
         # Test without icon
         print("\n=== Testing without icon ===")
-        main_content_no_icon = loader.load_template('main.py.template', **test_context_no_icon)
+        main_content_no_icon = loader.load_template(MAIN_TEMPLATE,
+                                                    **test_context_no_icon)
 
         # Check for syntax errors by trying to compile
         compile(main_content_no_icon, '<string>', 'exec')
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Test script for generating projects into archives and other output sinks."""
+
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import zipfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PIL import Image
+
+from template_project.generators import ProjectGenerator
+from template_project.generators.outputs import (
+    DirectoryOutput,
+    MemoryOutput,
+    ProjectOutput,
+    TarOutput,
+    ZipOutput,
+    open_archive,
+)
+
+
+class _Pipe(io.RawIOBase):
+    """A write-only stream that cannot seek or tell, like a pipe or socket."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+
+def _generate(output, icon_path=None):
+    return ProjectGenerator().generate_to(
+        output, "Archive App", "Output sink test", icon_path=icon_path
+    )
+
+
+def test_archives_keep_icon_and_executable_bits():
+    """Archives hold the project below its folder, with run.sh executable."""
+    print("Testing archive outputs...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        icon_path = os.path.join(temp_dir, "icon.png")
+        Image.new("RGBA", (64, 64), (0, 128, 255, 255)).save(icon_path)
+
+        tar_path = os.path.join(temp_dir, "archive_app.tar.gz")
+        with open_archive(tar_path, "archive_app") as output:
+            written = _generate(output, icon_path)
+        with tarfile.open(tar_path) as tar:
+            members = {m.name: m for m in tar.getmembers()}
+            assert all(name.startswith("archive_app") for name in members), members
+            assert members["archive_app/src"].isdir()
+            assert members["archive_app/run.sh"].mode == 0o755
+            assert members["archive_app/run.bat"].mode == 0o644
+            assert members["archive_app/src/archive_app/assets/icon.ico"].size > 0
+            assert sum(m.size for m in members.values() if m.isfile()) == written
+        print("✓ tar.gz archive has the icon and an executable run.sh")
+
+        zip_path = os.path.join(temp_dir, "archive_app.zip")
+        with open_archive(zip_path, "archive_app") as output:
+            _generate(output, icon_path)
+        with zipfile.ZipFile(zip_path) as archive:
+            infos = {info.filename: info for info in archive.infolist()}
+            assert infos["archive_app/run.sh"].external_attr >> 16 & 0o777 == 0o755
+            assert "archive_app/src/archive_app/assets/icon.ico" in infos
+            with tarfile.open(tar_path) as tar:
+                readme = tar.extractfile("archive_app/README.md").read()
+            assert archive.read("archive_app/README.md") == readme
+        print("✓ zip archive matches the tar.gz content")
+
+        try:
+            open_archive(os.path.join(temp_dir, "archive_app.rar"))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for an unknown extension")
+        assert not os.path.exists(os.path.join(temp_dir, "archive_app.rar"))
+
+
+def test_memory_output_matches_directory():
+    """In-memory output holds exactly what a directory output writes."""
+    print("Testing in-memory output...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory = MemoryOutput()
+        _generate(memory)
+        project_dir = os.path.join(temp_dir, "archive_app")
+        with DirectoryOutput(project_dir) as output:
+            _generate(output)
+
+        on_disk = {}
+        for root, _, names in os.walk(project_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                relative = os.path.relpath(path, project_dir).replace(os.sep, '/')
+                with open(path, "rb") as f:
+                    on_disk[relative] = f.read()
+        assert on_disk.keys() == memory.files.keys(), \
+            (on_disk.keys(), memory.files.keys())
+        lock = ".template_project.lock"
+        assert all(on_disk[path] == data
+                   for path, data in memory.files.items() if path != lock)
+        assert memory.executables == {"run.sh"}
+        if os.name != 'nt':
+            assert os.access(os.path.join(project_dir, "run.sh"), os.X_OK)
+    print("✓ Memory and directory outputs agree")
+
+
+def test_streams_to_non_seekable_target():
+    """Both archive formats can be written to a stream that cannot seek."""
+    print("Testing non-seekable streams...")
+    formats = ((TarOutput, tarfile.open), (ZipOutput, zipfile.ZipFile))
+    for output_class, reader in formats:
+        pipe = _Pipe()
+        with output_class(pipe, "archive_app") as output:
+            _generate(output)
+        assert not pipe.closed
+        data = io.BytesIO(pipe.getvalue())
+        is_tar = reader is tarfile.open
+        with (reader(fileobj=data) if is_tar else reader(data)) as archive:
+            names = archive.getnames() if is_tar else archive.namelist()
+            assert "archive_app/pyproject.toml" in names, names
+    print("✓ tar.gz and zip streamed without seeking")
+
+
+def test_incomplete_sink_is_rejected():
+    """A sink class missing one of the abstract methods cannot be created."""
+    print("Testing incomplete output sinks...")
+
+    class DirectoriesOnly(ProjectOutput):
+        def add_directory(self, path):
+            pass
+
+    try:
+        DirectoriesOnly()
+        raise AssertionError("a sink without add_file should not instantiate")
+    except TypeError as e:
+        assert "add_file" in str(e)
+    print("✓ Sink without add_file rejected when created")
+
+
+if __name__ == "__main__":
+    print("=== Output Sink Test ===\n")
+    try:
+        test_archives_keep_icon_and_executable_bits()
+        test_memory_output_matches_directory()
+        test_streams_to_non_seekable_target()
+        test_incomplete_sink_is_rejected()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test script for the SQLite profile store."""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.profile_store import ProfileStore
+from template_project.utils import ConfigManager
+
+
+def test_profiles_by_name_and_tag():
+    """Profiles are stored, listed by tag, replaced and deleted."""
+    print("Testing profile store...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ProfileStore(os.path.join(temp_dir, "profiles.db"))
+        store.save_profile("acme", {"author_name": "Acme", "python_version": "3.12",
+                                    "project_name": "not stored"}, tags=["acme", "web"])
+        store.save_profile("globex", {"author_name": "Globex"}, tags=["web"])
+        assert store.get_profile("acme") == {"author_name": "Acme",
+                                             "python_version": "3.12"}
+        assert store.list_profiles() == ["acme", "globex"]
+        assert store.list_profiles(tag="acme") == ["acme"]
+        assert store.list_profiles(tag="web") == ["acme", "globex"]
+        store.save_profile("acme", {"author_name": "Acme Inc"})
+        assert store.get_profile("acme") == {"author_name": "Acme Inc"}
+        assert store.get_tags("acme") == ["acme", "web"]
+        assert store.delete_profile("acme") and not store.delete_profile("acme")
+        assert store.list_tags() == ["web"]
+        store.close()
+        print("✓ Save, tag lookup, replace and delete")
+
+
+def test_concurrent_writers():
+    """Separate connections (e.g. GUI and batch job) can write at the same time."""
+    print("Testing concurrent profile writes...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "profiles.db")
+
+        def writer(worker):
+            store = ProfileStore(db_path)
+            for i in range(50):
+                store.save_profile(f"w{worker}-{i}", {"author_name": str(i)},
+                                   tags=[f"w{worker}"])
+            store.close()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(writer, range(4)))
+        store = ProfileStore(db_path)
+        assert len(store.list_profiles()) == 200
+        assert len(store.list_profiles(tag="w3")) == 50
+        store.close()
+        print("✓ 4 writers, 200 profiles, no lock errors")
+
+
+def test_config_manager_profiles():
+    """ConfigManager saves its current fields as a profile and applies one."""
+    print("Testing ConfigManager profiles...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_manager = ConfigManager(
+            os.path.join(temp_dir, "config.json"), debounce=0,
+            profiles_db=os.path.join(temp_dir, "profiles.db")
+        )
+        config_manager.save_config({"author_name": "Jane", "project_name": "One"})
+        config_manager.save_profile("jane")
+        config_manager.save_config({"author_name": "Someone else"})
+        config_manager.apply_profile("jane")
+        assert config_manager.get("author_name") == "Jane"
+        assert config_manager.get("project_name") == "One"
+        config_manager.close()
+        print("✓ Profile round trip through ConfigManager")
+
+
+if __name__ == "__main__":
+    print("=== Profile Store Test ===\n")
+    try:
+        test_profiles_by_name_and_tag()
+        test_concurrent_writers()
+        test_config_manager_profiles()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
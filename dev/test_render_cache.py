@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Test script for the render cache keyed on the variables templates use."""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.template_loader import TemplateLoader
+
+
+def _write(template_dir, name, source):
+    with open(os.path.join(template_dir, name), "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+def test_inputs_follow_includes_and_inheritance():
+    """Static analysis sees variables of included and parent templates."""
+    print("Testing template input analysis...")
+    with tempfile.TemporaryDirectory() as template_dir:
+        _write(template_dir, "base.template",
+               "{{ title }}{% block body %}{% endblock %}")
+        _write(template_dir, "part.template", "{{ author }}")
+        _write(template_dir, "child.template",
+               "{% extends 'base.template' %}{% block body %}"
+               "{% include 'part.template' %}{{ name }}{% endblock %}")
+        _write(template_dir, "clock.template", "{{ now() }}")
+        _write(template_dir, "dynamic.template", "{% include name %}")
+        loader = TemplateLoader(template_dir=template_dir, use_cache=False)
+
+        assert loader.template_inputs("child.template") == {"title", "author", "name"}
+        assert loader.template_inputs("clock.template") is None
+        assert loader.template_inputs("dynamic.template") is None
+    print("✓ Inputs include inherited and included templates; volatile ones excluded")
+
+
+def test_renders_once_per_distinct_inputs():
+    """Unused variables do not affect the key; used ones and edits do."""
+    print("Testing render memoization...")
+    with tempfile.TemporaryDirectory() as template_dir:
+        _write(template_dir, "license.template", "(c) {{ author_info.name }}")
+        loader = TemplateLoader(template_dir=template_dir, use_cache=False)
+        author = {"name": "Jane"}
+
+        for i in range(5):
+            content = loader.load_template("license.template",
+                                           project_name=f"App {i}", author_info=author)
+            assert content == "(c) Jane"
+        assert (loader.render_cache_hits, loader.render_cache_misses) == (4, 1)
+
+        joe = {"name": "Joe"}
+        assert loader.load_template("license.template", author_info=joe) == "(c) Joe"
+        assert loader.render_cache_misses == 2
+
+        # Editing the template invalidates its cached outputs
+        _write(template_dir, "license.template", "Copyright {{ author_info.name }}")
+        os.utime(os.path.join(template_dir, "license.template"),
+                 (time.time() + 5, time.time() + 5))
+        assert loader.load_template("license.template", author_info=author) == \
+            "Copyright Jane"
+    print("✓ One render per distinct input values, invalidated by edits")
+
+
+def test_cache_is_bounded():
+    """The least recently used outputs are evicted."""
+    print("Testing render cache eviction...")
+    with tempfile.TemporaryDirectory() as template_dir:
+        _write(template_dir, "name.template", "{{ name }}")
+        loader = TemplateLoader(template_dir=template_dir, use_cache=False,
+                                render_cache_size=8)
+        for i in range(50):
+            assert loader.load_template("name.template", name=i) == str(i)
+        assert len(loader._render_cache) == 8
+        loader.load_template("name.template", name=True)
+        assert loader.load_template("name.template", name=1) == "1"
+    print("✓ Cache stays within its bound")
+
+
+def test_precompiled_loader_reads_sources():
+    """Hashing and analysis work when templates come from a bundle."""
+    print("Testing render cache with a precompiled bundle...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle_path = os.path.join(temp_dir, "bundle")
+        bundle = TemplateLoader(use_cache=False).compile_bundle(bundle_path)
+        loader = TemplateLoader(precompiled_dir=bundle, frozen=True)
+        assert loader.precompiled_dir == bundle
+        assert loader.source_hash("LICENSE.template")
+        assert loader.template_inputs("LICENSE.template") == {"author_info"}
+    print("✓ Precompiled loader analyses the template sources")
+
+
+def test_reloading_loader_ignores_bundles():
+    """After a bundle is compiled, edits still reach a reloading loader."""
+    print("Testing edits after compiling a bundle...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_dir = os.path.join(temp_dir, "templates")
+        cache_dir = os.path.join(temp_dir, "cache")
+        os.makedirs(template_dir)
+        _write(template_dir, "version.template", "v1 {{ name }}")
+        TemplateLoader(template_dir=template_dir, cache_dir=cache_dir).compile_bundle()
+        frozen = TemplateLoader(template_dir=template_dir, cache_dir=cache_dir,
+                                frozen=True)
+        assert frozen.precompiled_dir is not None, "frozen loader should use the bundle"
+
+        loader = TemplateLoader(template_dir=template_dir, cache_dir=cache_dir)
+        assert loader.precompiled_dir is None
+        assert loader.load_template("version.template", name="x") == "v1 x"
+        path = os.path.join(template_dir, "version.template")
+        _write(template_dir, "version.template", "v2 {{ name }}")
+        # Make sure the modification time differs on coarse filesystems
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 2))
+        assert loader.load_template("version.template", name="x") == "v2 x"
+        fresh = TemplateLoader(template_dir=template_dir, cache_dir=cache_dir)
+        assert fresh.load_template("version.template", name="x") == "v2 x"
+
+        # The bundle of the old sources no longer matches a frozen loader
+        frozen = TemplateLoader(template_dir=template_dir, cache_dir=cache_dir,
+                                frozen=True)
+        assert frozen.precompiled_dir is None
+        assert frozen.load_template("version.template", name="x") == "v2 x"
+    print("✓ Edited templates render their new content")
+
+
+if __name__ == "__main__":
+    print("=== Render Cache Test ===\n")
+    try:
+        test_inputs_follow_includes_and_inheritance()
+        test_renders_once_per_distinct_inputs()
+        test_cache_is_bounded()
+        test_precompiled_loader_reads_sources()
+        test_reloading_loader_ignores_bundles()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Test script for the local generation service (HTTP and Unix socket)."""
+
+import asyncio
+import io
+import json
+import os
+import socket
+import sys
+import tarfile
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PIL import Image
+
+from template_project.generators import ProjectGenerator
+from template_project.server import GenerationServer
+
+
+class _BlockingGenerator(ProjectGenerator):
+    """Holds every archive generation until ``release`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def generate_to(self, output, *args, **kwargs):
+        self.entered.set()
+        self.release.wait(30)
+        return super().generate_to(output, *args, **kwargs)
+
+
+class _RunningServer:
+    """A ``GenerationServer`` running on its own event loop thread."""
+
+    def __init__(self, **options):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = GenerationServer(**options)
+        self._call(self.server.start(port=0))
+        host, port = self.server.address
+        self.url = f"http://{host}:{port}"
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(60)
+
+    def request(self, path, spec=None):
+        """Return ``(status, headers, body)``."""
+        data = None if spec is None else json.dumps(spec).encode("utf-8")
+        try:
+            url = self.url + path
+            with urllib.request.urlopen(url, data=data, timeout=60) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def close(self):
+        self._call(self.server.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def test_streams_archives_and_writes_directories():
+    """Specs come back as a tar.gz stream or land below the output root."""
+    print("Testing HTTP generation service...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        running = _RunningServer(output_root=temp_dir)
+        try:
+            status, _, body = running.request("/health")
+            assert status == 200 and json.loads(body)['status'] == 'ok'
+
+            status, headers, body = running.request(
+                "/generate", {"project_name": "Served App", "author_name": "Jane"})
+            assert status == 200 and headers['Content-Type'] == 'application/gzip'
+            with tarfile.open(fileobj=io.BytesIO(body)) as tar:
+                assert tar.getmember("served_app/run.sh").mode == 0o755
+                readme = tar.extractfile("served_app/README.md").read().decode("utf-8")
+            assert "Served App" in readme and "Jane" in readme
+            print("✓ Project streamed back as tar.gz")
+
+            served_app = {"project_name": "Served App", "git_init": False}
+            status, _, body = running.request("/generate?format=dir", served_app)
+            summary = json.loads(body)
+            assert status == 200, summary
+            assert summary['project_dir'] == os.path.join(temp_dir, "served_app")
+            assert os.path.isfile(os.path.join(summary['project_dir'], "README.md"))
+            assert summary['files'] > 0 and summary['bytes'] > 0
+            status, _, _ = running.request("/generate?format=dir", served_app)
+            assert status == 409
+            status, _, _ = running.request(
+                "/generate?format=dir",
+                {"project_name": "Escape", "project_dir": "../escape"})
+            assert status == 403
+            escape = os.path.join(os.path.dirname(temp_dir), "escape")
+            assert not os.path.exists(escape)
+            print("✓ Directory output confined to the output root")
+
+            assert running.request("/generate", {"project_desc": "no name"})[0] == 400
+            status = running.request("/generate?format=rar", {"project_name": "X"})[0]
+            assert status == 400
+            assert running.request("/nowhere")[0] == 404
+            stats = json.loads(running.request("/stats")[2])
+            assert stats['generated'] == 2 and stats['failed'] == 0, stats
+            assert stats['render_cache']['hits'] > 0, stats
+            print("✓ Bad requests rejected, stats reported")
+        finally:
+            running.close()
+
+
+def test_bounded_concurrency_rejects_overflow():
+    """With every slot busy and the queue full, new requests get 503."""
+    print("Testing bounded concurrency...")
+    generator = _BlockingGenerator()
+    running = _RunningServer(generator=generator, max_concurrent=1, max_queue=0,
+                             warm=False)
+    try:
+        results = []
+        first = threading.Thread(target=lambda: results.append(
+            running.request("/generate", {"project_name": "First"})))
+        first.start()
+        assert generator.entered.wait(30)
+        status, headers, _ = running.request("/generate", {"project_name": "Second"})
+        assert status == 503 and headers['Retry-After'] == '1', status
+        stats = json.loads(running.request("/stats")[2])
+        assert stats['active'] == 1 and stats['rejected'] == 1, stats
+        generator.release.set()
+        first.join(60)
+        assert results[0][0] == 200
+        print("✓ Overflow request rejected while the slot was busy")
+    finally:
+        generator.release.set()
+        running.close()
+        generator.close()
+
+
+def test_unix_socket():
+    """The service also listens on a Unix socket."""
+    if not hasattr(socket, 'AF_UNIX'):
+        print("- Unix sockets not available, skipped")
+        return
+    print("Testing Unix socket service...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "generator.sock")
+        loop = asyncio.new_event_loop()
+        server = GenerationServer(warm=False)
+        try:
+            loop.run_until_complete(server.start(unix_socket=path))
+
+            async def get_health():
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                response = await reader.read()
+                writer.close()
+                return response
+
+            response = loop.run_until_complete(get_health())
+            assert response.startswith(b"HTTP/1.1 200 OK"), response
+            assert json.loads(response.split(b"\r\n\r\n", 1)[1])['status'] == 'ok'
+        finally:
+            loop.run_until_complete(server.close())
+            loop.close()
+        assert not os.path.exists(path)
+    print("✓ Health check answered over a Unix socket")
+
+
+def test_spec_fields_and_icons_are_restricted():
+    """Only project fields are accepted; icons must come from the output root."""
+    print("Testing spec validation...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = os.path.join(temp_dir, "root")
+        os.makedirs(root)
+        Image.new("RGB", (32, 32), (0, 128, 0)).save(os.path.join(root, "logo.png"))
+        outside = os.path.join(temp_dir, "secret.png")
+        Image.new("RGB", (32, 32), (128, 0, 0)).save(outside)
+        running = _RunningServer(output_root=root)
+        try:
+            for field, value in (('staged', False), ('lazy', True),
+                                 ('executor', None), ('trace', "spans.jsonl")):
+                status, _, body = running.request(
+                    "/generate", {"project_name": "X", field: value})
+                assert status == 400 and field in json.loads(body)['error'], body
+
+            for icon_path in (outside, "../secret.png", "missing.png"):
+                status, _, _ = running.request(
+                    "/generate", {"project_name": "X", "icon_path": icon_path})
+                assert status == 403, (icon_path, status)
+
+            status, _, body = running.request(
+                "/generate", {"project_name": "Logo App", "icon_path": "logo.png"})
+            assert status == 200, body
+            with tarfile.open(fileobj=io.BytesIO(body)) as tar:
+                assert "logo_app/src/logo_app/assets/icon.ico" in tar.getnames()
+        finally:
+            running.close()
+
+        running = _RunningServer(warm=False)
+        try:
+            status, _, _ = running.request(
+                "/generate", {"project_name": "X", "icon_path": outside})
+            assert status == 403
+        finally:
+            running.close()
+    print("✓ Unknown fields rejected, icons confined to the output root")
+
+
+def test_symlinks_cannot_escape_output_root():
+    """A symlink below the output root does not let a project land outside it."""
+    print("Testing symlinks out of the output root...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = os.path.join(temp_dir, "root")
+        outside = os.path.join(temp_dir, "outside")
+        os.makedirs(root)
+        os.makedirs(outside)
+        os.symlink(outside, os.path.join(root, "link"))
+        running = _RunningServer(output_root=root)
+        try:
+            for spec in ({"project_dir": "link/escape"},
+                         {"output_dir": "link"},
+                         {"project_dir": "link"}):
+                status, _, body = running.request(
+                    "/generate?format=dir",
+                    {"project_name": "Escape", "git_init": False, **spec})
+                assert status == 403, (spec, status, body)
+            assert os.listdir(outside) == [], os.listdir(outside)
+
+            status, _, body = running.request(
+                "/generate?format=dir", {"project_name": "Inside", "git_init": False,
+                                         "output_dir": "nested/dir"})
+            assert status == 200, body
+        finally:
+            running.close()
+    print("✓ Symlinked targets outside the output root rejected")
+
+
+if __name__ == "__main__":
+    print("=== Generation Server Test ===\n")
+    try:
+        test_streams_archives_and_writes_directories()
+        test_bounded_concurrency_rejects_overflow()
+        test_spec_fields_and_icons_are_restricted()
+        test_symlinks_cannot_escape_output_root()
+        test_unix_socket()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
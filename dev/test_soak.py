@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Soak test: many generations on one ProjectGenerator, watching for leaks.
+
+Drives a single long-lived ``ProjectGenerator`` through thousands of
+generations (each project is deleted again right away) and samples, at a
+fixed interval:
+
+* resident set size (RSS),
+* ``tracemalloc`` traced memory and the top allocating lines,
+* the number of open file descriptors,
+* the size of the Jinja2 template cache, the template hash cache, the
+  render cache and the on-disk caches.
+
+After a warm-up the samples must level off: the run fails if traced memory,
+RSS or open file descriptors keep growing, or if a cache grows past its
+bound. The pytest case runs a short soak; for the real thing use e.g.
+
+    python dev/test_soak.py --iterations 20000 --icon --git --concurrent \\
+        --report soak.jsonl
+"""
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import DEFAULT_RENDER_CACHE_SIZE
+
+# Growth allowed between the first sample after warm-up and the last one
+MAX_TRACED_GROWTH = 2 * 1024 * 1024
+MAX_RSS_GROWTH = 16 * 1024 * 1024
+MAX_FD_GROWTH = 2
+
+
+def rss_bytes():
+    """Current resident set size, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def open_fds():
+    """Number of open file descriptors, or None where it cannot be counted."""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir)) - 1  # minus the listdir handle
+        except OSError:
+            continue
+    return None
+
+
+def _dir_entries(path):
+    total = 0
+    for _, _, filenames in os.walk(path):
+        total += len(filenames)
+    return total
+
+
+class SoakRun:
+    """Generates projects in a loop and records resource samples."""
+
+    def __init__(self, workdir, icon=False, git=False, concurrent=False):
+        self.workdir = workdir
+        self.generator = ProjectGenerator(
+            concurrent=concurrent, git_backend='fast-import'
+        )
+        self.git = git
+        self.icon_path = None
+        if icon:
+            from PIL import Image
+
+            self.icon_path = os.path.join(workdir, "icon.png")
+            Image.new("RGB", (320, 240), (30, 90, 160)).save(self.icon_path)
+        self.samples = []
+        self.iterations = 0
+
+    def generate(self):
+        project_dir = os.path.join(self.workdir, f"soak_{self.iterations}")
+        self.generator.create_project_structure(
+            project_dir=project_dir,
+            project_name=f"Soak App {self.iterations}",
+            project_desc=f"Soak iteration {self.iterations}",
+            icon_path=self.icon_path,
+            author_info={"name": "Soak", "email": "soak@example.com"},
+            git_init=self.git,
+            staged=self.iterations % 2 == 0
+        )
+        shutil.rmtree(project_dir)
+        self.iterations += 1
+
+    def sample(self):
+        gc.collect()
+        traced, _ = tracemalloc.get_traced_memory()
+        loader = self.generator.template_loader
+        record = {
+            'iteration': self.iterations,
+            'time': time.time(),
+            'rss': rss_bytes(),
+            'traced': traced,
+            'fds': open_fds(),
+            'jinja_cache': len(loader.env.cache) if loader.env.cache is not None else 0,
+            'source_hashes': len(loader._source_hashes),
+            'render_cache': len(loader._render_cache),
+            'cache_files': _dir_entries(loader.cache_dir),
+        }
+        self.samples.append(record)
+        return record
+
+    def top_allocators(self, baseline, limit=10):
+        """Lines that allocated the most memory since ``baseline`` snapshot."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        stats = snapshot.compare_to(baseline, "lineno")
+        stats.sort(key=lambda stat: stat.size_diff, reverse=True)
+        return [str(stat) for stat in stats[:limit]]
+
+    def close(self):
+        self.generator.close()
+
+
+def check_growth(samples):
+    """Return a list of problems found in the samples after warm-up."""
+    first, last = samples[0], samples[-1]
+    problems = []
+    if last['traced'] - first['traced'] > MAX_TRACED_GROWTH:
+        problems.append(
+            f"traced memory grew by {(last['traced'] - first['traced']) / 1024:.0f} KiB"
+        )
+    if first['rss'] is not None and last['rss'] - first['rss'] > MAX_RSS_GROWTH:
+        problems.append(f"RSS grew by {(last['rss'] - first['rss']) / 1024:.0f} KiB")
+    if first['fds'] is not None and last['fds'] - first['fds'] > MAX_FD_GROWTH:
+        problems.append(
+            f"open file descriptors grew from {first['fds']} to {last['fds']}"
+        )
+    # The in-memory caches are bounded by the number of templates
+    for key in ('jinja_cache', 'source_hashes'):
+        if last[key] > first[key]:
+            problems.append(f"{key} grew from {first[key]} to {last[key]}")
+    if last['render_cache'] > DEFAULT_RENDER_CACHE_SIZE:
+        problems.append(f"render cache grew past its bound to {last['render_cache']}")
+    # Bytecode and icon caches hold one entry per template/icon
+    if last['cache_files'] > first['cache_files']:
+        problems.append(f"on-disk cache grew from {first['cache_files']} "
+                        f"to {last['cache_files']} files")
+    return problems
+
+
+def soak(iterations, warmup=50, interval=50, icon=False, git=False,
+         concurrent=False, report=None, verbose=False):
+    """Run a soak and return ``(samples, problems, top_allocators)``."""
+    old_cache_dir = os.environ.get("TEMPLATE_PROJECT_CACHE_DIR")
+    workdir = tempfile.mkdtemp(prefix="tp-soak-")
+    os.environ["TEMPLATE_PROJECT_CACHE_DIR"] = os.path.join(workdir, "cache")
+    tracemalloc.start()
+    run = SoakRun(workdir, icon=icon, git=git, concurrent=concurrent)
+    report_file = open(report, "w", encoding="utf-8") if report else None
+    try:
+        for _ in range(warmup):
+            run.generate()
+        baseline = tracemalloc.take_snapshot()
+        run.sample()
+        while run.iterations < warmup + iterations:
+            run.generate()
+            if (run.iterations - warmup) % interval == 0:
+                record = run.sample()
+                if report_file:
+                    report_file.write(json.dumps(record) + "\n")
+                    report_file.flush()
+                if verbose:
+                    rss = record['rss'] or 0
+                    print(f"  {record['iteration']:>7} it  rss {rss:>11,}  "
+                          f"traced {record['traced']:>10,}  fds {record['fds']}")
+        top = run.top_allocators(baseline)
+    finally:
+        run.close()
+        tracemalloc.stop()
+        if report_file:
+            report_file.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+        if old_cache_dir is None:
+            os.environ.pop("TEMPLATE_PROJECT_CACHE_DIR", None)
+        else:
+            os.environ["TEMPLATE_PROJECT_CACHE_DIR"] = old_cache_dir
+    return run.samples, check_growth(run.samples), top
+
+
+def test_soak_short():
+    """A few hundred generations leave memory, fds and caches flat."""
+    print("Running short soak...")
+    samples, problems, top = soak(
+        iterations=int(os.environ.get("SOAK_ITERATIONS", "200")), icon=True
+    )
+    assert not problems, "\n".join(problems + ["Top allocators:"] + top)
+    print(f"✓ {samples[-1]['iteration']} generations without resource growth")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak test for ProjectGenerator")
+    parser.add_argument("-n", "--iterations", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--interval", type=int, default=250,
+                        help="Generations between samples")
+    parser.add_argument("--icon", action="store_true", help="Convert an icon each time")
+    parser.add_argument("--git", action="store_true", help="Create git repositories")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="Use the generator's concurrent mode")
+    parser.add_argument("--report", help="Write samples to this JSON-lines file")
+    args = parser.parse_args(argv)
+
+    print("=== Soak Test ===\n")
+    start = time.perf_counter()
+    samples, problems, top = soak(
+        args.iterations, warmup=args.warmup, interval=args.interval,
+        icon=args.icon, git=args.git, concurrent=args.concurrent,
+        report=args.report, verbose=True
+    )
+    elapsed = time.perf_counter() - start
+    print(f"\n{args.iterations} generations in {elapsed:.1f}s")
+    print("Top allocators since warm-up:")
+    for line in top:
+        print(f"  {line}")
+    if problems:
+        for problem in problems:
+            print(f"✗ {problem}")
+        return 1
+    print("\n=== Test PASSED ===")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
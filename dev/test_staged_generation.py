@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test script for staged (transactional) project generation."""
+
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+
+
+def test_staged_generation_publishes_complete_project():
+    """A staged build ends up in place with no staging leftovers."""
+    print("Testing staged generation...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_dir = os.path.join(temp_dir, "staged_app")
+        ProjectGenerator().create_project_structure(
+            project_dir=project_dir,
+            project_name="Staged App",
+            project_desc="A staged project",
+            git_init=False,
+            staged=True
+        )
+        assert os.path.isfile(os.path.join(project_dir, "pyproject.toml"))
+        assert os.path.isdir(os.path.join(project_dir, "src", "staged_app", "assets"))
+        assert os.listdir(temp_dir) == ["staged_app"], os.listdir(temp_dir)
+    print("✓ Staged project published")
+
+
+def test_failed_staged_generation_leaves_nothing():
+    """A failure while building never leaves a half-built directory."""
+    print("Testing staged generation failure cleanup...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bad_icon = os.path.join(temp_dir, "broken.png")
+        with open(bad_icon, "wb") as f:
+            f.write(b"not an image")
+        project_dir = os.path.join(temp_dir, "out", "broken_app")
+        try:
+            ProjectGenerator().create_project_structure(
+                project_dir=project_dir,
+                project_name="Broken App",
+                project_desc="Fails on the icon",
+                icon_path=bad_icon,
+                git_init=False,
+                staged=True
+            )
+        except Exception:
+            pass
+        else:
+            raise AssertionError("Expected the icon conversion to fail")
+        leftovers = os.listdir(os.path.join(temp_dir, "out")) \
+            if os.path.isdir(os.path.join(temp_dir, "out")) else []
+        assert leftovers == [], leftovers
+    print("✓ No partial project left behind")
+
+
+def test_staged_overwrite_replaces_existing_project():
+    """Overwriting swaps in the new project and removes the old one."""
+    print("Testing staged overwrite...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_dir = os.path.join(temp_dir, "app")
+        os.makedirs(project_dir)
+        stale_file = os.path.join(project_dir, "stale.txt")
+        with open(stale_file, "w") as f:
+            f.write("old")
+
+        generator = ProjectGenerator()
+        try:
+            generator.create_project_structure(
+                project_dir=project_dir, project_name="App", project_desc="",
+                git_init=False, staged=True
+            )
+        except FileExistsError:
+            pass
+        else:
+            raise AssertionError("Expected FileExistsError without overwrite")
+
+        generator.create_project_structure(
+            project_dir=project_dir, project_name="App", project_desc="",
+            git_init=False, staged=True, overwrite=True
+        )
+        assert not os.path.exists(stale_file)
+        assert os.path.isfile(os.path.join(project_dir, "README.md"))
+        assert sorted(os.listdir(temp_dir)) == ["app"], os.listdir(temp_dir)
+    print("✓ Existing project replaced")
+
+
+if __name__ == "__main__":
+    print("=== Staged Generation Test ===\n")
+    try:
+        test_staged_generation_publishes_complete_project()
+        test_failed_staged_generation_leaves_nothing()
+        test_staged_overwrite_replaces_existing_project()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Test script for template packs loaded from directories, zips and packages."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import zipfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import TemplateLoader
+from template_project.generators.template_packs import (
+    INDEX_FILENAME,
+    TemplatePack,
+    build_index,
+    load_pack,
+)
+
+CONTEXT = {
+    'project_name': "Pack App",
+    'sanitized_name': "pack_app",
+    'package_name': "pack_app",
+    'project_desc': "Template pack test",
+    'python_version': "3.11",
+    'author_info': {'name': "Jane Doe"},
+    'os_type': 'unix',
+    'git_init': True,
+    'has_icon': False,
+}
+LICENSE_OVERRIDE = "Acme license for {{ project_name }}\n"
+
+
+def _make_pack(temp_dir, name="acme"):
+    """Create a pack directory overriding LICENSE.template and index it."""
+    pack_dir = os.path.join(temp_dir, name)
+    os.makedirs(pack_dir)
+    with open(os.path.join(pack_dir, "LICENSE.template"), "w", encoding="utf-8") as f:
+        f.write(LICENSE_OVERRIDE)
+    build_index(pack_dir, version="1.0", description="Acme templates")
+    return pack_dir
+
+
+def _zip_directory(directory, zip_path, prefix=""):
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        for filename in sorted(os.listdir(directory)):
+            archive.write(os.path.join(directory, filename),
+                          '/'.join(part for part in (prefix, filename) if part))
+    return zip_path
+
+
+def test_zip_pack_overrides_builtin_templates():
+    """A zipped pack overrides its templates; the rest stay built in."""
+    print("Testing zip template pack...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = _make_pack(temp_dir)
+        zip_path = _zip_directory(pack_dir, os.path.join(temp_dir, "acme.zip"))
+        builtin = TemplateLoader(use_cache=False)
+        loader = TemplateLoader(use_cache=False, pack=zip_path)
+        assert loader.pack.name == "acme" and loader.pack.version == "1.0"
+
+        assert loader.render_template('LICENSE.template', **CONTEXT) == \
+            "Acme license for Pack App\n"
+        assert loader.render_template('README.md.template', **CONTEXT) == \
+            builtin.render_template('README.md.template', **CONTEXT)
+        assert sorted(loader.list_templates()) == sorted(builtin.list_templates())
+        # Source hashes come straight from the index
+        expected = hashlib.sha256(LICENSE_OVERRIDE.encode("utf-8")).hexdigest()
+        assert loader.source_hash('LICENSE.template') == expected
+        assert load_pack(zip_path) is loader.pack
+        assert loader.pack.verify() == []
+    print("✓ Zip pack overrides LICENSE and keeps the built-in templates")
+
+
+def test_pack_index_is_required_and_verified():
+    """Archives without an index are rejected and edits are detected."""
+    print("Testing pack index checks...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = _make_pack(temp_dir, "broken")
+        os.unlink(os.path.join(pack_dir, INDEX_FILENAME))
+        zip_path = _zip_directory(pack_dir, os.path.join(temp_dir, "broken.zip"))
+        try:
+            load_pack(zip_path)
+            raise AssertionError("a pack without an index should be rejected")
+        except ValueError as e:
+            assert INDEX_FILENAME in str(e)
+        try:
+            load_pack(os.path.join(temp_dir, "missing-pack"))
+            raise AssertionError("an unknown pack should be rejected")
+        except ValueError:
+            pass
+
+        # A directory without an index is indexed on the fly
+        pack = TemplatePack.from_directory(pack_dir)
+        assert list(pack.files) == ['LICENSE.template']
+        build_index(pack_dir)
+        license_path = os.path.join(pack_dir, "LICENSE.template")
+        with open(license_path, "a", encoding="utf-8") as f:
+            f.write("Edited\n")
+        assert TemplatePack.from_directory(pack_dir).verify() == ['LICENSE.template']
+    print("✓ Missing indexes are rejected and stale ones detected")
+
+
+def test_package_pack_imported_from_zip():
+    """A pack shipped as a package is read through importlib.resources."""
+    print("Testing package template pack...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = _make_pack(temp_dir, "acme_templates")
+        with open(os.path.join(pack_dir, "__init__.py"), "w", encoding="utf-8") as f:
+            f.write("")
+        build_index(pack_dir, name="acme")
+        # Like a wheel: the package is a top-level directory of the archive
+        zip_path = _zip_directory(pack_dir, os.path.join(temp_dir, "acme.whl"),
+                                  prefix="acme_templates")
+        sys.path.insert(0, zip_path)
+        try:
+            pack = TemplatePack.from_package("acme_templates")
+            assert pack.name == "acme"
+            loader = TemplateLoader(use_cache=False, pack=pack)
+            assert loader.render_template('LICENSE.template', **CONTEXT) == \
+                "Acme license for Pack App\n"
+        finally:
+            sys.path.remove(zip_path)
+            sys.modules.pop("acme_templates", None)
+        # The same archive also loads as a file
+        assert load_pack(zip_path).name == "acme"
+    print("✓ Package pack loaded from a zip import")
+
+
+def test_generation_with_pack():
+    """Projects generated with a pack use its templates, frozen or not."""
+    print("Testing generation with a template pack...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = _make_pack(temp_dir)
+        for frozen in (False, True):
+            generator = ProjectGenerator(template_pack=pack_dir,
+                                         frozen_templates=frozen)
+            project_dir = os.path.join(temp_dir, f"pack_app_{frozen}")
+            try:
+                generator.create_project_structure(project_dir, "Pack App", "",
+                                                   git_init=False, staged=True)
+            finally:
+                generator.close()
+            with open(os.path.join(project_dir, "LICENSE"), encoding="utf-8") as f:
+                assert f.read() == "Acme license for Pack App\n"
+            assert os.path.isfile(os.path.join(project_dir, "README.md"))
+    print("✓ Generated projects use the pack's LICENSE")
+
+
+if __name__ == "__main__":
+    print("=== Template Packs Test ===\n")
+    try:
+        test_zip_pack_overrides_builtin_templates()
+        test_pack_index_is_required_and_verified()
+        test_package_pack_imported_from_zip()
+        test_generation_with_pack()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Test script for the template tree with templated directory and file names."""
+
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.outputs import MemoryOutput
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_cache import list_template_files
+from template_project.generators.template_loader import (
+    TemplateLoader,
+    TemplateRenderError,
+)
+
+# Files of a generated project without an icon (besides the lock file)
+EXPECTED_FILES = {
+    ".github/.copilot-instructions.md", ".gitignore", "LICENSE", "README.md",
+    "dev/README.md", "pyproject.toml", "run.bat", "run.sh",
+    "src/tree_app/__init__.py", "src/tree_app/__main__.py",
+    "src/tree_app/config.py", "src/tree_app/main.py", "src/tree_app/gui/__init__.py",
+    "src/tree_app/gui/home_tab.py", "src/tree_app/gui/settings_tab.py",
+    "tests/test_main.py",
+}
+
+
+def _write(root, name, content=""):
+    path = os.path.join(root, *name.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def test_builtin_tree():
+    """The built-in templates form a tree mirroring the generated project."""
+    print("Testing the built-in template tree...")
+    loader = TemplateLoader(use_cache=False)
+    names = loader.project_templates()
+    assert 'src/{{ package_name }}/gui/home_tab.py.template' in names
+    assert not any(name.startswith('_') for name in names)
+    assert '_shared/INSTRUCTIONS.md.template' in loader.list_templates()
+    home_tab = 'src/{{ package_name }}/gui/home_tab.py.template'
+    assert loader.render_path(home_tab, {'package_name': "my_app"}) == \
+        "src/my_app/gui/home_tab.py"
+    assert loader.render_path('LICENSE.template', {}) == "LICENSE"
+
+    output = MemoryOutput()
+    ProjectGenerator().generate_to(output, "Tree App", "")
+    assert set(output.files) - {".template_project.lock"} == EXPECTED_FILES, \
+        sorted(output.files)
+    assert output.executables == {"run.sh"}
+    assert "src/tree_app/assets" in output.directories
+    assert output.files["src/tree_app/__init__.py"] == b""
+    print(f"✓ {len(EXPECTED_FILES)} files generated from the tree")
+
+
+def test_scandir_walk():
+    """Template files are found in subdirectories; caches are skipped."""
+    print("Testing the template directory walk...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write(temp_dir, "a.template")
+        _write(temp_dir, "b/c/d.txt.template")
+        _write(temp_dir, "b/notes.txt")
+        _write(temp_dir, "b/__pycache__/x.template")
+        assert list_template_files(temp_dir) == ["a.template", "b/c/d.txt.template"]
+        assert list_template_files(os.path.join(temp_dir, "missing")) == []
+    print("✓ Nested templates found with os.scandir")
+
+
+def test_templated_paths_from_a_pack():
+    """Pack templates add files; names render, conditional names drop files."""
+    print("Testing templated paths...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = os.path.join(temp_dir, "pack")
+        _write(pack_dir, "docs/{{ package_name|kebab_case }}.md.template",
+               "# {{ project_name }}\n")
+        _write(pack_dir,
+               "src/{{ package_name }}/plugins/{{ plugin }}/__init__.py.template",
+               "NAME = '{{ plugin }}'\n")
+        _write(pack_dir, "{% if has_icon %}icons{% endif %}/README.md.template",
+               "Icons\n")
+        _write(pack_dir, "_macros/helpers.template",
+               "{% macro hello() %}hi{% endmacro %}")
+        _write(pack_dir, "scripts/deploy.sh.template",
+               "{% from '_macros/helpers.template' import hello %}"
+               "echo {{ hello() }}\n")
+
+        for frozen in (False, True):
+            generator = ProjectGenerator(template_pack=pack_dir,
+                                         frozen_templates=frozen, strict=True)
+            output = MemoryOutput()
+            generator.generate_to(output, "Tree App", "", plugin="billing")
+            files = output.files
+            assert files["docs/tree-app.md"] == b"# Tree App\n"
+            plugin = files["src/tree_app/plugins/billing/__init__.py"]
+            assert plugin == b"NAME = 'billing'\n"
+            assert files["scripts/deploy.sh"] == b"echo hi\n"
+            assert "scripts/deploy.sh" in output.executables
+            assert not any(path.startswith(("icons", "_macros")) for path in files)
+            assert EXPECTED_FILES <= set(files)
+
+            # Without the variable the segment is empty and the file left out
+            output = MemoryOutput()
+            generator.generate_to(output, "Tree App", "")
+            assert not any("plugins" in path for path in output.files)
+    print("✓ Templated directory and file names rendered, empty ones skipped")
+
+
+def test_unsafe_and_duplicate_paths():
+    """Names rendering outside the project or onto each other are rejected."""
+    print("Testing unsafe and duplicate paths...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = os.path.join(temp_dir, "pack")
+        _write(pack_dir, "{{ target }}/x.txt.template", "x\n")
+        generator = ProjectGenerator(template_pack=pack_dir, strict=True)
+        try:
+            generator.generate_to(MemoryOutput(), "Tree App", "", target="..")
+            raise AssertionError("a path leaving the project should be rejected")
+        except TemplateRenderError as e:
+            assert "unsafe" in str(e)
+
+        # Without strict the file is skipped with a warning
+        events = []
+        lenient = ProjectGenerator(template_pack=pack_dir)
+        output = MemoryOutput()
+        lenient.generate_to(output, "Tree App", "", target="..", on_event=events.append)
+        assert "x.txt" not in " ".join(output.files)
+        assert any(event['kind'] == 'warning' for event in events)
+
+        try:
+            generator.generate_to(MemoryOutput(), "Tree App", "",
+                                  target="tests/../tests")
+            raise AssertionError("'..' inside a rendered name should be rejected")
+        except TemplateRenderError:
+            pass
+
+        # Loaded packs are cached per process, so use a new one
+        other_dir = os.path.join(temp_dir, "other")
+        _write(other_dir, "{{ target }}/x.txt.template", "x\n")
+        _write(other_dir, "{{ other }}/x.txt.template", "y\n")
+        try:
+            generator = ProjectGenerator(template_pack=other_dir, strict=True)
+            generator.generate_to(MemoryOutput(), "Tree App", "", target="a", other="a")
+            raise AssertionError("two templates writing one file should be rejected")
+        except ValueError as e:
+            assert "a/x.txt" in str(e)
+    print("✓ Unsafe and conflicting paths rejected")
+
+
+if __name__ == "__main__":
+    print("=== Template Tree Test ===\n")
+    try:
+        test_builtin_tree()
+        test_scandir_walk()
+        test_templated_paths_from_a_pack()
+        test_unsafe_and_duplicate_paths()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Test script for lock-file driven project updates."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the src directory to Python path (go up one level from dev folder)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from template_project.generators.lockfile import LOCK_FILENAME
+from template_project.generators.project_generator import ProjectGenerator
+from template_project.generators.template_loader import TemplateLoader
+from template_project.generators.template_packs import build_index
+
+
+def test_update_rewrites_only_changed_files():
+    """Changing an input rewrites affected files and skips user edits."""
+    print("Testing incremental project update...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_dir = os.path.join(temp_dir, "update_app")
+        generator = ProjectGenerator()
+        generator.create_project_structure(
+            project_dir=project_dir,
+            project_name="Update App",
+            project_desc="Before",
+            git_init=False
+        )
+        with open(os.path.join(project_dir, LOCK_FILENAME), encoding="utf-8") as f:
+            lock = json.load(f)
+        assert lock['files']['README.md']['template'] == 'README.md.template'
+        print("✓ Lock file written")
+
+        result = generator.update_project(project_dir)
+        assert result.written == [] and result.modified == [], result.to_dict()
+        print("✓ Nothing rewritten when nothing changed")
+
+        license_path = os.path.join(project_dir, "LICENSE")
+        with open(license_path, "a", encoding="utf-8") as f:
+            f.write("\nLocal addition\n")
+
+        result = generator.update_project(project_dir, python_version="3.12")
+        assert "pyproject.toml" in result.updated, result.to_dict()
+        assert "LICENSE" not in result.written, result.to_dict()
+        assert "src/update_app/gui/home_tab.py" in result.unchanged
+        with open(os.path.join(project_dir, "pyproject.toml"), encoding="utf-8") as f:
+            assert "3.12" in f.read()
+        with open(license_path, encoding="utf-8") as f:
+            assert f.read().endswith("Local addition\n")
+        print("✓ Changed files rewritten, user edits preserved")
+
+
+def test_update_follows_included_templates():
+    """Editing an included template re-renders the files including it."""
+    print("Testing updates after editing an included template...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_dir = os.path.join(temp_dir, "templates")
+        shutil.copytree(TemplateLoader().template_dir, template_dir)
+        footer_path = os.path.join(template_dir, "_shared", "footer.template")
+        with open(footer_path, "w", encoding="utf-8") as f:
+            f.write("Footer v1\n")
+        license_path = os.path.join(template_dir, "LICENSE.template")
+        with open(license_path, "a", encoding="utf-8") as f:
+            f.write("{% include '_shared/footer.template' %}")
+
+        generator = ProjectGenerator()
+        generator.template_loader = TemplateLoader(template_dir, use_cache=False)
+        project_dir = os.path.join(temp_dir, "include_app")
+        generator.create_project_structure(project_dir, "Include App", "",
+                                           git_init=False)
+        with open(os.path.join(project_dir, "LICENSE"), encoding="utf-8") as f:
+            assert f.read().endswith("Footer v1\n")
+
+        with open(footer_path, "w", encoding="utf-8") as f:
+            f.write("Footer v2\n")
+        # Make sure the edit is seen even within the mtime resolution
+        os.utime(footer_path, (0, os.path.getmtime(footer_path) + 10))
+        result = generator.update_project(project_dir)
+        assert result.updated == ["LICENSE"], result.to_dict()
+        with open(os.path.join(project_dir, "LICENSE"), encoding="utf-8") as f:
+            assert f.read().endswith("Footer v2\n")
+    print("✓ LICENSE regenerated after its included footer changed")
+
+
+def test_update_uses_recorded_template_pack():
+    """A project generated with a pack is updated with that pack again."""
+    print("Testing updates of a project generated with a template pack...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_dir = os.path.join(temp_dir, "acme")
+        os.makedirs(pack_dir)
+        with open(os.path.join(pack_dir, "LICENSE.template"), "w",
+                  encoding="utf-8") as f:
+            f.write("Acme license for {{ project_name }}\n")
+        build_index(pack_dir, version="1.0")
+
+        project_dir = os.path.join(temp_dir, "pack_app")
+        generator = ProjectGenerator(template_pack=pack_dir)
+        generator.create_project_structure(project_dir, "Pack App", "",
+                                           git_init=False)
+        with open(os.path.join(project_dir, LOCK_FILENAME), encoding="utf-8") as f:
+            recorded = json.load(f)['template_pack']
+        assert recorded['spec'] == os.path.abspath(pack_dir), recorded
+        assert recorded['tree_hash'] == generator.template_loader.pack.tree_hash
+        print("✓ Template pack recorded in the lock file")
+
+        result = ProjectGenerator().update_project(project_dir,
+                                                   python_version="3.12")
+        assert "pyproject.toml" in result.updated, result.to_dict()
+        assert "LICENSE" in result.unchanged, result.to_dict()
+        assert result.modified == [], result.to_dict()
+        with open(os.path.join(project_dir, "LICENSE"), encoding="utf-8") as f:
+            assert f.read() == "Acme license for Pack App\n"
+        print("✓ Update without a pack renders with the recorded one")
+
+        # Loaded packs are cached per process, so record one never loaded
+        lock_path = os.path.join(project_dir, LOCK_FILENAME)
+        with open(lock_path, encoding="utf-8") as f:
+            lock = json.load(f)
+        lock['template_pack']['spec'] = os.path.join(temp_dir, "gone")
+        with open(lock_path, "w", encoding="utf-8") as f:
+            json.dump(lock, f)
+        try:
+            ProjectGenerator().update_project(project_dir, python_version="3.13")
+            raise AssertionError("an update with a missing pack should fail")
+        except ValueError as e:
+            assert "cannot be loaded" in str(e), e
+        with open(os.path.join(project_dir, "pyproject.toml"), encoding="utf-8") as f:
+            assert "3.13" not in f.read()
+    print("✓ Missing template pack reported instead of falling back")
+
+
+if __name__ == "__main__":
+    print("=== Project Update Test ===\n")
+    try:
+        test_update_rewrites_only_changed_files()
+        test_update_follows_included_templates()
+        test_update_uses_recorded_template_pack()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("\n=== Test PASSED ===")
@@ -0,0 +1,631 @@
+"""Command line interface for headless project generation.
+
+Only the standard library is imported at module level and every command
+imports what it needs, so the CLI never loads tkinter, ttkbootstrap or Pillow
+unless the GUI is opened (or an icon actually has to be converted).
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+# Profile fields settable with ``profiles save``
+PROFILE_OPTIONS = (
+    "author_name", "email", "github", "website", "python_version",
+    "output_dir", "icon_path", "theme",
+)
+
+
+def build_parser():
+    """Build the argument parser for the ``template_project`` command."""
+    parser = argparse.ArgumentParser(
+        prog="template_project",
+        description="Generate Python projects from templates. "
+                    "Run without a command to open the GUI.",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable debug logging"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    generate = subparsers.add_parser("generate", help="Generate a single project")
+    generate.add_argument("project_name", help="Name of the project")
+    generate.add_argument(
+        "-d", "--description", default="",
+        help="Project description",
+    )
+    generate.add_argument(
+        "-o", "--output-dir",
+        help="Parent directory of the new project (default: cwd)",
+    )
+    generate.add_argument(
+        "--project-dir",
+        help="Exact project directory (overrides --output-dir)",
+    )
+    generate.add_argument("--icon", help="Path to an icon image (.ico, .png, ...)")
+    generate.add_argument(
+        "--python-version", help="Minimum Python version (default: 3.9)"
+    )
+    generate.add_argument("--author-name", help="Author name")
+    generate.add_argument("--email", help="Author email")
+    generate.add_argument("--github", help="GitHub repository URL")
+    generate.add_argument("--website", help="Author website")
+    generate.add_argument(
+        "--no-git", dest="git_init", action="store_false", default=None,
+        help="Do not initialize a git repository",
+    )
+    _add_profile_arguments(generate)
+    _add_pack_argument(generate)
+    generate.add_argument(
+        "--archive", metavar="FILE",
+        help="Write the project into a .zip, .tar.gz or .tgz archive instead of a "
+             "directory ('-' streams a .tar.gz to stdout); implies --no-git",
+    )
+    generate.add_argument(
+        "--git-backend", choices=("subprocess", "fast-import"), default="subprocess",
+        help="How to create the initial commit (default: subprocess)",
+    )
+    generate.add_argument(
+        "--concurrent", action="store_true",
+        help="Render and write files on a thread pool (helps on network filesystems)",
+    )
+    generate.add_argument(
+        "--strict", action="store_true",
+        help="Fail on the first template error instead of writing an empty file",
+    )
+    generate.add_argument(
+        "--progress", action="store_true",
+        help="Print phases, rendered files and warnings to stderr as they happen",
+    )
+    generate.add_argument(
+        "--trace", metavar="FILE",
+        help="Append per-phase and per-file timing spans to FILE as JSON lines",
+    )
+    generate.add_argument(
+        "--profile-dir", metavar="DIR",
+        help="Write a cProfile dump of the generation to DIR",
+    )
+    generate.set_defaults(func=run_generate)
+
+    batch = subparsers.add_parser(
+        "batch", help="Generate every project listed in a JSONL, CSV or TOML manifest"
+    )
+    batch.add_argument("manifest", help="Path to the manifest file")
+    batch.add_argument(
+        "-o", "--output-dir",
+        help="Parent directory for projects that do not set one (default: cwd)",
+    )
+    batch.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="Number of worker processes (default: CPU count, 1 = in-process)",
+    )
+    batch.add_argument(
+        "--git-backend", choices=("subprocess", "fast-import"), default="fast-import",
+        help="How to create each initial commit (default: fast-import)",
+    )
+    batch.add_argument(
+        "--strict", action="store_true",
+        help="Fail projects whose templates do not render instead of writing "
+             "empty files",
+    )
+    batch.add_argument(
+        "--fail-fast", action="store_true",
+        help="Stop at the first failed project and skip the rest",
+    )
+    batch.add_argument(
+        "--dedup", choices=("reflink", "hardlink"),
+        help="Write identical files once and clone them into each project "
+             "(hardlink also links binary files such as icons where reflinks "
+             "are unsupported; linked files are read-only)",
+    )
+    batch.add_argument(
+        "--json", action="store_true", help="Print the batch report as JSON"
+    )
+    _add_profile_arguments(batch)
+    _add_pack_argument(batch)
+    batch.set_defaults(func=run_batch)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a local generation service with warm templates "
+             "(HTTP or Unix socket)",
+    )
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)"
+    )
+    serve.add_argument(
+        "--port", type=int, default=8765, help="TCP port (default: 8765)"
+    )
+    serve.add_argument(
+        "--unix-socket", metavar="PATH", help="Listen on a Unix socket instead of TCP"
+    )
+    serve.add_argument(
+        "--max-concurrent", type=int, default=2,
+        help="Generations running at the same time (default: 2)",
+    )
+    serve.add_argument(
+        "--max-queue", type=int, default=16,
+        help="Requests waiting for a free slot before new ones get 503 (default: 16)",
+    )
+    serve.add_argument(
+        "--output-root", metavar="DIR",
+        help="Allow format=dir requests to write projects below DIR and "
+             "icon_path to name icons inside it",
+    )
+    _add_profile_arguments(serve)
+    _add_pack_argument(serve)
+    serve.set_defaults(func=run_serve)
+
+    update = subparsers.add_parser(
+        "update",
+        help="Re-render files of existing projects whose templates or inputs changed",
+    )
+    update.add_argument(
+        "project_dirs", nargs="+", metavar="project_dir",
+        help="Project directories containing a .template_project.lock file",
+    )
+    update.add_argument("--python-version", help="Change the Python version")
+    update.add_argument("--description", help="Change the project description")
+    update.add_argument(
+        "--dry-run", action="store_true", help="Only report what would change"
+    )
+    update.add_argument(
+        "--json", action="store_true", help="Print the results as JSON"
+    )
+    _add_pack_argument(update)
+    update.set_defaults(func=run_update)
+
+    compile_cmd = subparsers.add_parser(
+        "compile-templates",
+        help="Precompile the templates so later runs skip Jinja2 compilation",
+    )
+    compile_cmd.add_argument(
+        "--output",
+        help="Write the bundle to this directory instead of the user cache",
+    )
+    _add_pack_argument(compile_cmd)
+    compile_cmd.set_defaults(func=run_compile_templates)
+
+    profiles = subparsers.add_parser(
+        "profiles", help="Manage saved generation profiles"
+    )
+    profiles.add_argument(
+        "--profiles-db", help="Profile database (default: ./profiles.db)"
+    )
+    profiles_cmd = profiles.add_subparsers(dest="profiles_command", required=True)
+    profiles_list = profiles_cmd.add_parser("list", help="List profile names")
+    profiles_list.add_argument("--tag", help="Only profiles with this tag")
+    profiles_show = profiles_cmd.add_parser("show", help="Print a profile as JSON")
+    profiles_show.add_argument("name")
+    profiles_save = profiles_cmd.add_parser(
+        "save", help="Create or replace a profile from options or a JSON file"
+    )
+    profiles_save.add_argument("name")
+    profiles_save.add_argument(
+        "--from-json", metavar="FILE",
+        help="Read the fields from a JSON file (e.g. config.json)",
+    )
+    profiles_save.add_argument("--tag", action="append", dest="tags",
+                               help="Tag the profile (repeatable)")
+    for field in PROFILE_OPTIONS:
+        profiles_save.add_argument(f"--{field.replace('_', '-')}", dest=field)
+    profiles_delete = profiles_cmd.add_parser("delete", help="Delete a profile")
+    profiles_delete.add_argument("name")
+    profiles.set_defaults(func=run_profiles)
+
+    packs = subparsers.add_parser("packs", help="List, index and verify template packs")
+    packs_cmd = packs.add_subparsers(dest="packs_command", required=True)
+    packs_cmd.add_parser("list", help="List installed template packs")
+    packs_index = packs_cmd.add_parser(
+        "index", help="Write template-pack.json into a pack directory"
+    )
+    packs_index.add_argument("directory")
+    packs_index.add_argument("--name", help="Pack name (default: the directory name)")
+    packs_index.add_argument("--version", help="Pack version")
+    packs_index.add_argument("--description", help="Short description")
+    packs_verify = packs_cmd.add_parser(
+        "verify", help="Check a pack's templates against its index"
+    )
+    packs_verify.add_argument(
+        "pack", help="Installed pack name, .zip file or directory"
+    )
+    packs.set_defaults(func=run_packs)
+
+    return parser
+
+
+def _add_profile_arguments(parser):
+    parser.add_argument(
+        "--profile",
+        help="Use the author, Python version, output dir and icon of a saved "
+             "profile (explicit options still win)",
+    )
+    parser.add_argument(
+        "--profiles-db", help="Profile database (default: ./profiles.db)"
+    )
+
+
+def _add_pack_argument(parser):
+    parser.add_argument(
+        "--template-pack", metavar="PACK",
+        help="Override templates with an installed pack, a .zip file or a directory",
+    )
+
+
+def load_profile(args):
+    """Return the fields of ``args.profile``, or {} if no profile was given.
+
+    Raises:
+        KeyError: If the profile does not exist
+    """
+    if not getattr(args, "profile", None):
+        return {}
+    from .profile_store import ProfileStore
+
+    store = ProfileStore(args.profiles_db)
+    try:
+        fields = store.get_profile(args.profile)
+    finally:
+        store.close()
+    if fields is None:
+        raise KeyError(f"No such profile: {args.profile}")
+    return fields
+
+
+def load_template_pack(args):
+    """Load ``args.template_pack`` early, so a bad pack fails before any work.
+
+    Raises:
+        ValueError: If the pack does not exist or has no valid index
+    """
+    if args.template_pack:
+        from .generators.template_packs import load_pack
+
+        load_pack(args.template_pack)
+
+
+def run_generate(args):
+    """Run the ``generate`` command."""
+    from .generators.project_generator import ProjectGenerator
+    from .generators.template_loader import TemplateRenderError
+
+    try:
+        profile = load_profile(args)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 2
+    # Explicit options win over the profile, the profile over the defaults
+    for arg, key, default in (
+        ("output_dir", "output_dir", "."),
+        ("icon", "icon_path", None),
+        ("python_version", "python_version", "3.9"),
+        ("author_name", "author_name", ""),
+        ("email", "email", ""),
+        ("github", "github", ""),
+        ("website", "website", ""),
+        ("git_init", "git_init", True),
+    ):
+        if getattr(args, arg) is None:
+            value = profile.get(key)
+            setattr(args, arg, default if value in (None, "") else value)
+
+    try:
+        load_template_pack(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if args.icon and not os.path.exists(args.icon):
+        print(f"Error: icon file does not exist: {args.icon}", file=sys.stderr)
+        return 2
+
+    project_dir = args.project_dir or os.path.join(
+        args.output_dir, ProjectGenerator.sanitize_project_name(args.project_name)
+    )
+    if args.archive:
+        project_dir = None
+    elif os.path.exists(project_dir):
+        print(f"Error: directory already exists: {project_dir}", file=sys.stderr)
+        return 2
+
+    author_info = {
+        "name": args.author_name,
+        "github": args.github,
+        "email": args.email,
+        "website": args.website,
+    }
+    tracer = None
+    if args.trace or args.profile_dir:
+        from .generators.instrumentation import JsonLinesSink, Tracer
+
+        sinks = [JsonLinesSink(args.trace)] if args.trace else []
+        tracer = Tracer(sinks=sinks, profile_dir=args.profile_dir)
+
+    generator = ProjectGenerator(
+        concurrent=args.concurrent, git_backend=args.git_backend, tracer=tracer,
+        strict=args.strict, template_pack=args.template_pack,
+    )
+    options = dict(
+        project_name=args.project_name,
+        project_desc=args.description or "A Python application built with ttkbootstrap",
+        icon_path=args.icon,
+        author_info=author_info,
+        python_version=args.python_version,
+        on_event=print_event if args.progress else None,
+    )
+    try:
+        if args.archive:
+            return write_archive(generator, args.archive, options)
+        generator.create_project_structure(
+            project_dir=project_dir, git_init=args.git_init, staged=True, **options
+        )
+    except (TemplateRenderError, OSError, ValueError) as e:
+        # E.g. the target appeared meanwhile, the staged rename failed or the
+        # icon is not an image
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        generator.close()
+        if tracer is not None:
+            tracer.close()
+    print(f"Project created at: {os.path.abspath(project_dir)}")
+    return 0
+
+
+def write_archive(generator, path, options):
+    """Generate a project straight into an archive file (or stdout for '-')."""
+    from .generators.outputs import TarOutput, open_archive
+
+    prefix = generator.sanitize_project_name(options['project_name'])
+    if path == "-":
+        with TarOutput(sys.stdout.buffer, prefix) as output:
+            generator.generate_to(output, **options)
+        sys.stdout.buffer.flush()
+        return 0
+    if os.path.exists(path):
+        print(f"Error: file already exists: {path}", file=sys.stderr)
+        return 2
+    try:
+        output = open_archive(path, prefix)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    with output:
+        written = generator.generate_to(output, **options)
+    print(f"Project archived at: {os.path.abspath(path)} "
+          f"({written} bytes before compression)")
+    return 0
+
+
+def print_event(event):
+    """Print a generation progress event to stderr."""
+    kind, name = event['kind'], event['name']
+    if kind == 'phase_start':
+        line = f"{name}..."
+    elif kind == 'file':
+        line = f"  {name} ({event['bytes']} bytes, {event['duration'] * 1000:.1f}ms)"
+    elif kind == 'phase' and name == 'write':
+        line = f"  {event['files']} files, {event['bytes']} bytes written"
+    elif kind in ('warning', 'error'):
+        line = f"{kind}: {name}: {event['message']}"
+    else:
+        return
+    print(line, file=sys.stderr, flush=True)
+
+
+def run_batch(args):
+    """Run the ``batch`` command."""
+    from .generators.batch_generator import BatchGenerator
+
+    try:
+        profile = load_profile(args)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 2
+    if args.output_dir:
+        profile.pop("output_dir", None)
+    try:
+        load_template_pack(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    batch = BatchGenerator(
+        workers=args.workers, output_dir=args.output_dir,
+        defaults=profile, git_backend=args.git_backend,
+        strict=args.strict, fail_fast=args.fail_fast, dedup=args.dedup,
+        template_pack=args.template_pack,
+    )
+    try:
+        specs = batch.load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Error reading manifest: {e}", file=sys.stderr)
+        return 2
+
+    def print_result(result):
+        if result.ok:
+            print(f"ok      {result.project_name} -> {result.project_dir}", flush=True)
+        else:
+            print(f"FAILED  {result.project_name}: {result.error}", flush=True)
+
+    # Results are printed as projects finish, not once the batch is done
+    report = batch.run(specs, on_result=None if args.json else print_result)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        for result in report.results:
+            if result.skipped:
+                print(f"skipped {result.project_name}")
+        print(
+            f"{report.succeeded}/{len(report.results)} projects generated in "
+            f"{report.elapsed:.2f}s ({report.throughput:.1f} projects/s)"
+        )
+    return 0 if report.failed == 0 else 1
+
+
+def run_serve(args):
+    """Run the ``serve`` command."""
+    from .server import serve
+
+    try:
+        profile = load_profile(args)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 2
+    # Requests choose their directory below --output-root
+    profile.pop("output_dir", None)
+    try:
+        load_template_pack(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    address = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"Serving project generation on {address} (Ctrl+C to stop)",
+          file=sys.stderr, flush=True)
+    serve(
+        host=args.host, port=args.port, unix_socket=args.unix_socket,
+        max_concurrent=args.max_concurrent, max_queue=args.max_queue,
+        output_root=args.output_root, defaults=profile,
+        template_pack=args.template_pack,
+    )
+    return 0
+
+
+def run_update(args):
+    """Run the ``update`` command."""
+    from .generators.project_generator import ProjectGenerator
+
+    overrides = {}
+    if args.python_version:
+        overrides["python_version"] = args.python_version
+    if args.description is not None:
+        overrides["project_desc"] = args.description
+
+    try:
+        generator = ProjectGenerator(template_pack=args.template_pack)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    status = 0
+    results = []
+    for project_dir in args.project_dirs:
+        try:
+            result = generator.update_project(
+                project_dir, dry_run=args.dry_run, **overrides
+            )
+        except (OSError, ValueError) as e:
+            print(f"FAILED  {project_dir}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        results.append(result.to_dict())
+        if not args.json:
+            print(
+                f"{project_dir}: {len(result.updated)} updated, "
+                f"{len(result.added)} added, {len(result.unchanged)} unchanged"
+            )
+            for path in result.modified + result.conflicts:
+                print(f"  skipped {path} (modified locally)")
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return status
+
+
+def run_profiles(args):
+    """Run the ``profiles`` command."""
+    from .profile_store import ProfileStore
+
+    store = ProfileStore(args.profiles_db)
+    try:
+        if args.profiles_command == "list":
+            for name in store.list_profiles(tag=args.tag):
+                print(name)
+        elif args.profiles_command == "show":
+            fields = store.get_profile(args.name)
+            if fields is None:
+                print(f"Error: No such profile: {args.name}", file=sys.stderr)
+                return 1
+            print(json.dumps({**fields, "tags": store.get_tags(args.name)}, indent=2))
+        elif args.profiles_command == "save":
+            fields = {}
+            if args.from_json:
+                with open(args.from_json, "r", encoding="utf-8") as f:
+                    fields.update(json.load(f))
+            for field in PROFILE_OPTIONS:
+                if getattr(args, field) is not None:
+                    fields[field] = getattr(args, field)
+            store.save_profile(args.name, fields, tags=args.tags)
+            print(f"Saved profile: {args.name}")
+        elif args.profiles_command == "delete":
+            if not store.delete_profile(args.name):
+                print(f"Error: No such profile: {args.name}", file=sys.stderr)
+                return 1
+            print(f"Deleted profile: {args.name}")
+    finally:
+        store.close()
+    return 0
+
+
+def run_compile_templates(args):
+    """Run the ``compile-templates`` command."""
+    from .generators.template_loader import TemplateLoader
+
+    try:
+        loader = TemplateLoader(pack=args.template_pack)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    path = loader.compile_bundle(args.output)
+    print(f"Precompiled templates written to: {path}")
+    return 0
+
+
+def run_packs(args):
+    """Run the ``packs`` command."""
+    from .generators import template_packs
+
+    if args.packs_command == "list":
+        for name, point in sorted(template_packs.installed_packs().items()):
+            print(f"{name}\t{point.value}")
+    elif args.packs_command == "index":
+        index = template_packs.build_index(
+            args.directory, name=args.name, version=args.version,
+            description=args.description,
+        )
+        print(f"Indexed {len(index['files'])} templates of pack {index['name']!r}")
+    elif args.packs_command == "verify":
+        try:
+            pack = template_packs.load_pack(args.pack)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        changed = pack.verify()
+        for name in changed:
+            print(f"changed {name}")
+        if changed:
+            print(f"Error: {pack.name}: {len(changed)} templates do not match "
+                  f"the index; run `packs index` again", file=sys.stderr)
+            return 1
+        print(f"{pack.name}: {len(pack.files)} templates match the index")
+    return 0
+
+
+def run_gui():
+    """Open the generator GUI."""
+    from .main import MainApplication
+
+    app = MainApplication(title="Python Project Generator", size=(800, 600))
+    app.mainloop()
+    return 0
+
+
+def main(argv=None):
+    """Entry point for ``python -m template_project``."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s",
+    )
+    if args.command is None:
+        return run_gui()
+    return args.func(args)
@@ -1,6 +1,13 @@
 """Project generator package."""
+from .batch_generator import BatchGenerator
 from .jinja2_template_loader import Jinja2TemplateLoader
+from .outputs import DirectoryOutput, MemoryOutput, TarOutput, ZipOutput, open_archive
 from .project_generator import ProjectGenerator
-from .template_loader import TemplateLoader
+from .project_plan import GenerationCancelled
+from .template_loader import TemplateLoader, TemplateRenderError
 
-__all__ = ['ProjectGenerator', 'TemplateLoader', 'Jinja2TemplateLoader']
+__all__ = [
+    'ProjectGenerator', 'TemplateLoader', 'Jinja2TemplateLoader', 'BatchGenerator',
+    'GenerationCancelled', 'TemplateRenderError',
+    'DirectoryOutput', 'MemoryOutput', 'TarOutput', 'ZipOutput', 'open_archive',
+]
@@ -0,0 +1,267 @@
+"""asyncio front end of ``ProjectGenerator``.
+
+``create_project_structure`` blocks on file I/O, Pillow and git processes,
+which stalls an event loop it is called from. ``AsyncProjectGenerator``
+runs the same generation as coroutines instead:
+
+* template rendering, icon conversion and file writes run on a thread pool,
+* git runs through ``asyncio.create_subprocess_exec``,
+* at most ``max_concurrent`` generations are in flight; others wait,
+* cancelling the awaiting task stops the generation at its next step, kills
+  a running git process and removes the staging directory, so a cancelled
+  project leaves nothing behind.
+
+Example::
+
+    generator = AsyncProjectGenerator(max_concurrent=8)
+    await asyncio.gather(*(
+        generator.create_project_structure(f"out/app_{i}", f"App {i}", "")
+        for i in range(100)
+    ))
+    await generator.close()
+"""
+import asyncio
+import functools
+import logging
+import os
+import shutil
+import subprocess
+import threading
+
+from . import git_fast_import
+from .project_generator import ProjectGenerator, _make_sibling_dir, _publish_directory
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+class AsyncProjectGenerator:
+    """Generates projects on an event loop without blocking it."""
+
+    def __init__(self, generator=None, max_concurrent=4, **options):
+        """
+        Args:
+            generator: ``ProjectGenerator`` providing templates, icon cache
+                and options; by default one created from ``options``
+            max_concurrent: Generations in flight at the same time
+            **options: Arguments for the default ``ProjectGenerator``
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._owns_generator = generator is None
+        if generator is None:
+            generator = ProjectGenerator(**options)
+        self.generator = generator
+        self.max_concurrent = max_concurrent
+        # Each generation runs one blocking step at a time
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent,
+                                            thread_name_prefix="async-generator")
+        # Created on first use, inside the running loop (Python 3.9)
+        self._semaphore = None
+
+    async def create_project_structure(self, project_dir, project_name, project_desc,
+                                       icon_path=None, author_info=None,
+                                       python_version="3.9", git_init=True,
+                                       overwrite=False, on_event=None, **kwargs):
+        """Create a project; the coroutine version of the synchronous method.
+
+        The project is always built in a staging directory and renamed into
+        place, as with ``staged=True``.
+
+        Args:
+            project_dir: Directory where the project will be created
+            project_name: Name of the project
+            project_desc: Description of the project
+            icon_path: Optional path to icon file
+            author_info: Dictionary with author information
+            python_version: Python version requirement
+            git_init: Whether to initialize a git repository
+            overwrite: Replace an existing ``project_dir``
+            on_event: Callable receiving progress events (see
+                ``ProjectGenerator.create_project_structure``); ``file``
+                events are reported from worker threads
+            **kwargs: Additional template variables
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled; the
+                project directory is left untouched
+        """
+        generator = self.generator
+        project_dir = os.path.abspath(project_dir)
+        if os.path.exists(project_dir) and not overwrite:
+            raise FileExistsError(f"Project directory already exists: {project_dir}")
+
+        git_backend = generator.git_backend if git_init else None
+        async with self._slot():
+            cancel = threading.Event()
+            with generator.tracer.run(project_name,
+                                      sinks=[on_event] if on_event else (),
+                                      project_dir=project_dir, staged=True,
+                                      asynchronous=True,
+                                      git_backend=git_backend) as trace:
+                with trace.span("plan") as span:
+                    # Lazy: templates and icon are rendered by resolve() below
+                    plan = await self._call(
+                        cancel, generator.build_plan, project_name, project_desc,
+                        icon_path=icon_path, author_info=author_info,
+                        python_version=python_version, git_init=git_init,
+                        lazy=True, trace=trace, cancel=cancel, **kwargs
+                    )
+                    span['files'] = len(plan.files)
+                plan.dedup = generator.dedup_store
+
+                with trace.span("mkdir"):
+                    staging_dir = await self._call(None, _make_sibling_dir, project_dir,
+                                                   "staging")
+                try:
+                    with trace.span("render"):
+                        await self._call(cancel, plan.resolve)
+                    with trace.span("write", files=len(plan.files)) as span:
+                        span['bytes'] = await self._call(cancel, plan.write_to,
+                                                         staging_dir)
+                    if git_init:
+                        plan.check_cancelled()
+                        await self._init_git(staging_dir, author_info, plan)
+                    plan.check_cancelled()
+                    with trace.span("publish"):
+                        await self._call(None, _publish_directory, staging_dir,
+                                         project_dir, overwrite)
+                except BaseException:
+                    # Shielded so that a cancellation still cleans up
+                    cleanup = asyncio.get_running_loop().run_in_executor(
+                        self._executor, functools.partial(shutil.rmtree, staging_dir,
+                                                          ignore_errors=True)
+                    )
+                    await _wait_quietly(cleanup)
+                    raise
+
+    async def generate_to(self, output, project_name, project_desc, **kwargs):
+        """Render a project into an output sink; see ``ProjectGenerator.generate_to``.
+
+        Returns:
+            int: Number of bytes handed to the sink
+        """
+        async with self._slot():
+            cancel = threading.Event()
+            return await self._call(cancel, self.generator.generate_to, output,
+                                    project_name, project_desc, cancel=cancel, **kwargs)
+
+    async def close(self):
+        """Wait for the worker threads and close the default generator."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        if self._owns_generator:
+            self.generator.close()
+
+    def _slot(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def _call(self, cancel_event, func, *args, **kwargs):
+        """Run a blocking step on the thread pool.
+
+        If the awaiting task is cancelled, ``cancel_event`` is set and the step is
+        waited for, so nothing still writes once the caller cleans up.
+        """
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if cancel_event is not None:
+                cancel_event.set()
+            await _wait_quietly(future)
+            raise
+
+    async def _init_git(self, project_dir, author_info, plan):
+        """Create the repository and the initial commit with async git processes."""
+        trace = plan.trace
+        with trace.span("git_init"):
+            initialized = await self._git_step('git_init', trace,
+                                               self._git_init_repository,
+                                               project_dir, author_info)
+        if initialized:
+            with trace.span("git_commit"):
+                await self._git_step('git_commit', trace, self._git_commit_all,
+                                     project_dir, author_info, plan)
+
+    async def _git_step(self, name, trace, step, *args):
+        """Run a git step; like the synchronous generator, failures only warn."""
+        try:
+            await step(*args)
+            return True
+        except subprocess.CalledProcessError as e:
+            message = (e.stderr or b"").decode("utf-8", "replace").strip() or str(e)
+            logger.warning(f"Failed to initialize git repository: {message}")
+            trace.event('warning', name, message=message)
+        except FileNotFoundError:
+            logger.warning("Git not found in PATH. Skipping git initialization.")
+            trace.event('warning', name, message="git not found in PATH")
+        return False
+
+    async def _git_init_repository(self, project_dir, author_info):
+        logger.info(f"Initializing git repository in {project_dir}")
+        await _run_git(project_dir, "init")
+        if self.generator.git_backend == 'fast-import':
+            await self._call(None, git_fast_import.write_user_config, project_dir,
+                             author_info)
+        elif author_info:
+            for key in ("name", "email"):
+                if author_info.get(key):
+                    await _run_git(project_dir, "config", f"user.{key}",
+                                   author_info[key])
+
+    async def _git_commit_all(self, project_dir, author_info, plan):
+        if self.generator.git_backend != 'fast-import':
+            await _run_git(project_dir, "add", ".")
+            await _run_git(project_dir, "commit", "-m", git_fast_import.COMMIT_MESSAGE)
+            return
+        identity = git_fast_import.author_identity(author_info)
+        if identity is None:
+            output = await _run_git(project_dir, "var", "GIT_COMMITTER_IDENT")
+            identity = output.decode("utf-8").strip()
+        ref = await self._call(None, git_fast_import.current_branch_ref, project_dir)
+        ignored = await self._call(None, git_fast_import.ignored_paths, project_dir,
+                                   [planned.path for planned in plan.files])
+        stream = await self._call(None, git_fast_import.build_stream, plan, ref,
+                                  identity, git_fast_import.COMMIT_MESSAGE, ignored)
+        await _run_git(project_dir, *git_fast_import.FAST_IMPORT_ARGS, input=stream)
+        await _run_git(project_dir, "read-tree", ref)
+
+
+async def _run_git(project_dir, *args, input=None):
+    """Run a git command inside ``project_dir`` without blocking the loop.
+
+    Returns:
+        bytes: The command's standard output
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git", *args, cwd=project_dir,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await process.communicate(input)
+    except asyncio.CancelledError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await _wait_quietly(asyncio.ensure_future(process.wait()))
+        raise
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, ["git", *args],
+                                            stdout, stderr)
+    return stdout
+
+
+async def _wait_quietly(future):
+    """Wait for ``future`` to finish without raising its exception."""
+    await asyncio.wait({future})
+    if not future.cancelled():
+        # Mark the exception as retrieved; the caller raises its own
+        future.exception()
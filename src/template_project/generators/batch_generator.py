@@ -0,0 +1,357 @@
+"""Headless batch generation of many projects from a manifest file."""
+import csv
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from .project_generator import ProjectGenerator
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Flat manifest columns that are folded into ``author_info``. The names match
+# the keys the GUI stores in config.json so a saved config can seed a manifest.
+AUTHOR_FIELDS = {
+    'author_name': 'name',
+    'email': 'email',
+    'github': 'github',
+    'website': 'website',
+}
+
+# Per-process generator, created lazily so every pool worker keeps one warm
+# Jinja2 environment for all the projects it is handed.
+_worker_generator = None
+
+
+class BatchResult:
+    """Outcome of generating a single project in a batch."""
+
+    def __init__(self, index, project_name, project_dir, error=None, duration=0.0,
+                 skipped=False):
+        self.index = index
+        self.project_name = project_name
+        self.project_dir = project_dir
+        self.error = error
+        self.duration = duration
+        # Never started because an earlier project failed (fail-fast)
+        self.skipped = skipped
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def to_dict(self):
+        return {
+            'index': self.index,
+            'project_name': self.project_name,
+            'project_dir': self.project_dir,
+            'ok': self.ok,
+            'error': self.error,
+            'duration': self.duration,
+            'skipped': self.skipped,
+        }
+
+
+class BatchReport:
+    """Collected results and throughput of a batch run."""
+
+    def __init__(self, results, elapsed):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self):
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self):
+        return len(self.results) - self.succeeded
+
+    @property
+    def throughput(self):
+        """Projects generated per second of wall-clock time."""
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.results) / self.elapsed
+
+    def to_dict(self):
+        return {
+            'total': len(self.results),
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'results': [result.to_dict() for result in self.results],
+        }
+
+
+class BatchGenerator:
+    """Runs ``ProjectGenerator.create_project_structure`` over many specs."""
+
+    def __init__(self, workers=None, output_dir=None, defaults=None,
+                 git_backend='fast-import', strict=False, fail_fast=False,
+                 dedup=None, template_pack=None):
+        """
+        Args:
+            workers: Number of worker processes. ``None`` uses the CPU count,
+                0 or 1 generates everything in the current process.
+            output_dir: Parent directory for specs that do not set
+                ``project_dir`` or ``output_dir`` themselves.
+            defaults: Values applied to every spec unless it overrides them.
+            git_backend: Git backend of the workers' ``ProjectGenerator``;
+                fast-import keeps process spawns per project to a minimum.
+            strict: Fail a project whose templates do not render instead of
+                writing empty files
+            fail_fast: Skip the remaining projects after the first project
+                that fails to generate. Invalid manifest entries are reported
+                as failed results of their own and never stop the batch.
+            dedup: ``'reflink'`` or ``'hardlink'`` to write every distinct
+                file once and clone it into the projects (see
+                ``dedup_store``). The objects live in a temporary directory
+                inside ``output_dir`` for the duration of ``run``.
+            template_pack: Template pack used for every project (name of an
+                installed pack, ``.zip`` file or directory)
+        """
+        self.workers = workers
+        self.output_dir = output_dir
+        self.defaults = defaults or {}
+        self.fail_fast = fail_fast
+        self.dedup = dedup
+        # Templates cannot change in the middle of a batch, so workers load
+        # them once instead of checking every file for edits on each render
+        self.generator_options = {'git_backend': git_backend, 'strict': strict,
+                                  'frozen_templates': True,
+                                  'template_pack': template_pack}
+
+    @staticmethod
+    def load_manifest(manifest_path):
+        """Read project specs from a JSONL, CSV or TOML manifest.
+
+        TOML manifests list projects as ``[[projects]]`` tables and may provide
+        a ``[defaults]`` table that is merged into every project.
+
+        Args:
+            manifest_path: Path to the manifest file
+
+        Returns:
+            list: List of spec dictionaries in manifest order
+        """
+        ext = os.path.splitext(manifest_path)[1].lower()
+        if ext in ('.jsonl', '.ndjson'):
+            specs = []
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    try:
+                        specs.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        raise ValueError(
+                            f"{manifest_path}:{line_no}: invalid JSON: {e}"
+                        ) from e
+            return specs
+        if ext == '.csv':
+            with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+                return [
+                    {key: value for key, value in row.items()
+                     if value not in (None, '')}
+                    for row in csv.DictReader(f)
+                ]
+        if ext == '.toml':
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                try:
+                    import tomli as tomllib
+                except ImportError as e:
+                    raise ValueError(
+                        "Reading TOML manifests requires Python 3.11+ or 'tomli'"
+                    ) from e
+            with open(manifest_path, "rb") as f:
+                data = tomllib.load(f)
+            defaults = data.get('defaults', {})
+            return [{**defaults, **project} for project in data.get('projects', [])]
+        raise ValueError(f"Unsupported manifest format: {manifest_path}")
+
+    def normalize_spec(self, spec):
+        """Turn a manifest entry into ``create_project_structure`` arguments.
+
+        Args:
+            spec: Dictionary read from a manifest
+
+        Returns:
+            dict: Keyword arguments for ``create_project_structure``
+        """
+        spec = {**self.defaults, **spec}
+        project_name = str(spec.pop('project_name', '') or '').strip()
+        if not project_name:
+            raise ValueError("Project spec is missing 'project_name'")
+
+        author_info = dict(spec.pop('author_info', None) or {})
+        for field, key in AUTHOR_FIELDS.items():
+            value = spec.pop(field, None)
+            if value:
+                author_info.setdefault(key, value)
+
+        output_dir = spec.pop('output_dir', None) or self.output_dir or os.getcwd()
+        project_dir = spec.pop('project_dir', None) or os.path.join(
+            output_dir, ProjectGenerator.sanitize_project_name(project_name)
+        )
+
+        git_init = spec.pop('git_init', True)
+        if isinstance(git_init, str):
+            git_init = git_init.strip().lower() not in ('0', 'false', 'no', 'off', '')
+
+        # GUI-only settings that may be present when a config.json is reused
+        for key in ('theme', 'mode'):
+            spec.pop(key, None)
+
+        return {
+            'project_dir': os.path.abspath(project_dir),
+            'project_name': project_name,
+            'project_desc': spec.pop('project_desc', '') or '',
+            'icon_path': spec.pop('icon_path', None) or None,
+            'author_info': author_info,
+            'python_version': str(spec.pop('python_version', '3.9')),
+            'git_init': git_init,
+            # Build each project in a temporary sibling so failures leave nothing behind
+            'staged': True,
+            **spec,
+        }
+
+    def run(self, specs, on_result=None):
+        """Generate every project, isolating failures per project.
+
+        Args:
+            specs: Iterable of spec dictionaries (see ``load_manifest``)
+            on_result: Callable receiving each ``BatchResult`` as soon as
+                its project is done (in completion order)
+
+        Returns:
+            BatchReport: Per-project results in input order plus throughput
+        """
+        start = time.perf_counter()
+        results = []
+        jobs = []
+
+        def record(result):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+            return result.ok or not self.fail_fast
+
+        for index, spec in enumerate(specs):
+            try:
+                jobs.append((index, self.normalize_spec(spec)))
+            except Exception as e:
+                # Reported for this entry only; the valid entries still run
+                name = spec.get('project_name', '') if isinstance(spec, dict) else ''
+                record(BatchResult(index, name, None,
+                                   error=f"Invalid entry {index + 1}: {e}"))
+
+        generator_options = self.generator_options
+        dedup_dir = None
+        if self.dedup and jobs:
+            # One object directory for all workers, on the output's filesystem
+            parent = self.output_dir or os.getcwd()
+            os.makedirs(parent, exist_ok=True)
+            dedup_dir = tempfile.mkdtemp(prefix=".template_project-dedup-", dir=parent)
+            generator_options = {**generator_options, 'dedup': self.dedup,
+                                 'dedup_dir': dedup_dir}
+        try:
+            self._generate(jobs, generator_options, record, results)
+        finally:
+            if dedup_dir is not None:
+                shutil.rmtree(dedup_dir, ignore_errors=True)
+
+        results.sort(key=lambda result: result.index)
+        report = BatchReport(results, time.perf_counter() - start)
+        logger.info(
+            f"Batch finished: {report.succeeded}/{len(results)} projects in "
+            f"{report.elapsed:.2f}s ({report.throughput:.1f} projects/s)"
+        )
+        return report
+
+    def _generate(self, jobs, generator_options, record, results):
+        """Generate the normalized jobs in-process or on a process pool."""
+        if self.workers is not None and self.workers <= 1:
+            # A private generator keeps in-process runs independent of any
+            # other BatchGenerator running in another thread
+            generator = ProjectGenerator(**generator_options)
+            try:
+                for position, (index, kwargs) in enumerate(jobs):
+                    if not record(_generate_one(index, kwargs, generator_options,
+                                                generator)):
+                        results.extend(_skipped(jobs[position + 1:]))
+                        break
+            finally:
+                generator.close()
+        elif jobs:
+            # Imported lazily: multiprocessing is a noticeable share of CLI startup
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            max_workers = min(self.workers or os.cpu_count() or 1, len(jobs))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_generate_one, index, kwargs,
+                                    generator_options): (index, kwargs)
+                    for index, kwargs in jobs
+                }
+                pending = dict(futures)
+                for future in as_completed(futures):
+                    if not record(_pool_result(future, *pending.pop(future))):
+                        # Queued projects are dropped, running ones finish
+                        cancelled = [pending.pop(f) for f in list(pending)
+                                     if f.cancel()]
+                        results.extend(_skipped(cancelled))
+                        for running, (index, kwargs) in pending.items():
+                            record(_pool_result(running, index, kwargs))
+                        break
+
+    def run_manifest(self, manifest_path):
+        """Load a manifest and generate every project in it."""
+        return self.run(self.load_manifest(manifest_path))
+
+
+def _pool_result(future, index, kwargs):
+    """Result of a project generated in a worker process."""
+    try:
+        return future.result()
+    except Exception as e:
+        # The worker process itself died (e.g. killed by the OS)
+        return BatchResult(index, kwargs['project_name'], kwargs['project_dir'],
+                           error=str(e))
+
+
+def _skipped(jobs):
+    """Results for jobs never started because an earlier project failed."""
+    return [
+        BatchResult(index, kwargs['project_name'], kwargs['project_dir'],
+                    error="Skipped after an earlier failure", skipped=True)
+        for index, kwargs in jobs
+    ]
+
+
+def _generate_one(index, kwargs, generator_options, generator=None):
+    """Generate one project inside a worker; never raises."""
+    global _worker_generator
+    if generator is None:
+        if _worker_generator is None:
+            _worker_generator = ProjectGenerator(**generator_options)
+        generator = _worker_generator
+
+    start = time.perf_counter()
+    error = None
+    try:
+        generator.create_project_structure(**kwargs)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        logger.warning(f"Failed to generate {kwargs['project_name']}: {error}")
+    return BatchResult(
+        index, kwargs['project_name'], kwargs['project_dir'],
+        error=error, duration=time.perf_counter() - start
+    )
@@ -0,0 +1,187 @@
+"""Deduplication of identical output files across many generations.
+
+Generating hundreds of projects writes the same ``.gitignore``, ``LICENSE``
+or ``run.sh`` hundreds of times. With a ``DedupStore`` every distinct file
+content is written once into a content-addressed object directory and each
+output file is cloned from that object:
+
+* ``'reflink'`` mode uses copy-on-write clones (FICLONE on Btrfs, XFS, ...),
+  which share disk blocks but behave like independent copies;
+* ``'hardlink'`` mode falls back to hard links for binary files (icons)
+  where reflinks are not available. Linked files share one inode, so the
+  objects are read-only to stop an in-place edit in one project from
+  changing them all. Text files are never linked: sources, scripts and
+  configuration are meant to be edited, so they are reflinked and stay
+  writable.
+
+The first project written to a filesystem probes it for reflink support.
+Files that cannot be cloned there are written straight to the project, never
+stored and copied, so a store costs nothing on filesystems that support
+neither reflinks nor (in ``'hardlink'`` mode, for binary files) hard links.
+
+By default the object directory is created next to the first project and
+removed by ``close()``; existing clones and links are unaffected.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+from .fileops import clone_file, reflink
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+DEDUP_MODES = ('reflink', 'hardlink')
+
+
+class DedupStore:
+    """Content-addressed objects that identical output files are cloned from."""
+
+    def __init__(self, directory=None, mode='reflink'):
+        """
+        Args:
+            directory: Object directory; should be on the same filesystem as
+                the output. Default: a temporary directory next to the first
+                project, removed by ``close()``.
+            mode: ``'reflink'`` or ``'hardlink'`` (reflink, else hard link
+                binary files; text files are copied)
+        """
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode: {mode!r}")
+        self.mode = mode
+        self.directory = directory
+        self._owns_directory = directory is None
+        self._lock = threading.Lock()
+        # Object names known to exist
+        self._objects = set()
+        # st_dev -> False for filesystems where clones fall back to copies
+        self._devices = {}
+        # st_dev -> whether objects can be reflinked onto that filesystem
+        self._reflinks = {}
+        self.stats = {'reflink': 0, 'hardlink': 0, 'copy': 0, 'objects': 0}
+
+    def usable(self, root):
+        """Which files written below ``root`` should go through the store.
+
+        Called before writing a project; creates the default object
+        directory next to ``root`` and probes its filesystem on first use.
+
+        Returns:
+            str or bool: ``'all'`` where objects can be reflinked,
+            ``'binary'`` where only binary files can be hard-linked, or
+            False to write every file normally
+        """
+        try:
+            device = os.stat(root).st_dev
+        except OSError:
+            return False
+        if not self._devices.get(device, True):
+            return False
+        if self.directory is None:
+            with self._lock:
+                if self.directory is None:
+                    parent = os.path.dirname(os.path.abspath(root))
+                    self.directory = tempfile.mkdtemp(
+                        prefix=".template_project-dedup-", dir=parent
+                    )
+        supported = self._reflinks.get(device)
+        if supported is None:
+            with self._lock:
+                supported = self._reflinks.get(device)
+                if supported is None:
+                    supported = self._reflinks[device] = self._probe_reflink(root)
+        if supported:
+            return 'all'
+        if self.mode == 'hardlink':
+            return 'binary'
+        if self._devices.get(device, True):
+            logger.info(f"Reflinks not supported below {root}; writing normally")
+            self._devices[device] = False
+        return False
+
+    def place(self, content, dest_path, executable=False):
+        """Create ``dest_path`` as a clone of the object holding ``content``.
+
+        Args:
+            content: File content (text is written as UTF-8)
+            dest_path: Destination path below a root passed to ``usable``;
+                its directory must exist
+            executable: Whether the file gets the executable bit
+
+        Returns:
+            tuple: ``(method, size)``, the clone method used and the size of
+            the file in bytes
+        """
+        data = content
+        binary = isinstance(content, bytes)
+        if not binary:
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{digest}.x" if executable else digest
+        path = os.path.join(self.directory, name[:2], name)
+        if name not in self._objects:
+            if not os.path.exists(path):
+                self._store(path, data, executable)
+            self._objects.add(name)
+
+        # A hard link would leave a text file read-only and shared, so
+        # callers only pass text where ``usable`` found reflink support
+        allow_hardlink = self.mode == 'hardlink' and binary
+        method = clone_file(path, dest_path, allow_hardlink=allow_hardlink)
+        with self._lock:
+            self.stats[method] += 1
+        if method == 'copy' and (allow_hardlink or self.mode == 'reflink'):
+            device = os.stat(dest_path).st_dev
+            if self._devices.get(device, True):
+                logger.info(f"Deduplication not supported for {dest_path}; "
+                            "writing normally")
+                self._devices[device] = False
+        return method, len(data)
+
+    def close(self):
+        """Remove the object directory if the store created it."""
+        with self._lock:
+            if self._owns_directory and self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+                self.directory = None
+            self._objects.clear()
+
+    def _probe_reflink(self, root):
+        """Whether an object can be reflinked into ``root``."""
+        source = os.path.join(self.directory, "reflink-probe")
+        if not os.path.exists(source):
+            # Atomic, as batch worker processes may share the directory
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"probe\n")
+            os.replace(tmp_path, source)
+        target = os.path.join(root, f".reflink-probe-{os.getpid()}")
+        try:
+            reflink(source, target)
+        except OSError:
+            return False
+        os.unlink(target)
+        return True
+
+    def _store(self, path, data, executable):
+        """Write an object atomically and make it read-only."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self.stats['objects'] += 1
@@ -0,0 +1,71 @@
+"""Low-level file placement helpers shared by the caches."""
+import errno
+import os
+import shutil
+import sys
+
+# ioctl request number of FICLONE on Linux (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+
+def reflink(src, dst):
+    """Create ``dst`` as a copy-on-write clone of ``src``.
+
+    Only supported on Linux filesystems with reflink support (Btrfs, XFS,
+    bcachefs, ...). ``dst`` must not exist.
+
+    Raises:
+        OSError: If the platform or filesystem cannot clone files
+    """
+    if not sys.platform.startswith('linux'):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform")
+    import fcntl
+
+    with open(src, "rb") as src_file:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            fcntl.ioctl(fd, FICLONE, src_file.fileno())
+        except OSError:
+            os.close(fd)
+            os.unlink(dst)
+            raise
+        os.close(fd)
+
+
+def clone_file(src, dst, allow_hardlink=False):
+    """Place a copy of ``src`` at ``dst`` as cheaply as the filesystem allows.
+
+    Tries a reflink first, then (if allowed) a hard link, then a regular
+    copy. An existing ``dst`` is replaced.
+
+    Args:
+        src: Existing file to copy
+        dst: Destination path
+        allow_hardlink: Allow sharing the inode with ``src``. Only safe when
+            neither file is ever modified in place.
+
+    Returns:
+        str: ``'reflink'``, ``'hardlink'`` or ``'copy'``
+
+    Raises:
+        OSError: If ``src`` cannot be read or ``dst`` cannot be written
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        reflink(src, dst)
+        return 'reflink'
+    except OSError as e:
+        if e.errno not in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV,
+                           errno.EINVAL, errno.ENOSYS, errno.EPERM):
+            raise
+    if allow_hardlink:
+        try:
+            os.link(src, dst)
+            return 'hardlink'
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK,
+                               errno.ENOTSUP, errno.EACCES):
+                raise
+    shutil.copyfile(src, dst)
+    return 'copy'
@@ -0,0 +1,146 @@
+"""Content-addressed cache of converted project icons.
+
+Converting an image to ICO means decoding it, cropping, resampling to
+256x256 and encoding again, which dominates the cost of a generation that
+uses an icon. The result only depends on the source image bytes and the
+conversion parameters, so it is stored under a hash of both in the user
+cache directory. A repeat generation with the same image is then a cache
+lookup plus a file clone.
+
+The cache is bounded in size: a hit refreshes the entry's modification
+time and, after every insert, the least recently used entries are removed
+until the total size is back under the limit. Entries are written
+atomically, so several processes can share one cache directory.
+"""
+import logging
+import os
+import threading
+
+from .lockfile import canonical_json, hash_text
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Bump when the conversion code changes in a way that alters its output
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class IconCache:
+    """Size-bounded LRU cache of converted icons on disk."""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Root cache directory (default: the user cache dir)
+            max_bytes: Total size the cached icons may occupy
+        """
+        if cache_dir is None:
+            from .template_cache import user_cache_dir
+
+            cache_dir = user_cache_dir()
+        self.directory = os.path.join(cache_dir, "icons")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source_hash, params):
+        """Return the cache key of a source image hash and conversion parameters."""
+        return hash_text(canonical_json({
+            'version': CACHE_VERSION,
+            'source': source_hash,
+            'params': params,
+        }))
+
+    def path(self, key):
+        """Return the path an entry is stored at."""
+        return os.path.join(self.directory, f"{key}.ico")
+
+    def get(self, key):
+        """Look up an entry and mark it as recently used.
+
+        Returns:
+            str or None: Path of the cached icon, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            # Read-only cache: still usable, just without LRU bookkeeping
+            logger.debug(f"Could not touch icon cache entry {path}: {e}")
+            if not os.path.isfile(path):
+                return None
+        return path
+
+    def put(self, key, data):
+        """Store an entry and evict old ones if the cache is over its limit.
+
+        Returns:
+            str or None: Path of the new entry, or None if it could not be stored
+        """
+        path = self.path(key)
+        tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write icon cache entry {path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+        self.evict()
+        return path
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its limit."""
+        with self._lock:
+            entries = []
+            total = 0
+            try:
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".ico"):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+            except FileNotFoundError:
+                return
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not evict icon cache entry {path}: {e}")
+                    continue
+                total -= size
+                logger.debug(f"Evicted icon cache entry {path}")
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            try:
+                names = os.listdir(self.directory)
+            except FileNotFoundError:
+                return
+            for name in names:
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
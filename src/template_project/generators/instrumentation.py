@@ -0,0 +1,306 @@
+"""Timing spans and profiling hooks for project generation.
+
+A ``Tracer`` is handed to ``ProjectGenerator``; every generation then opens a
+``Trace`` that reports timed spans to the tracer's sinks:
+
+* one ``run`` span per generation,
+* a ``phase`` span per step (planning, rendering, writing, git, publishing),
+* a ``file`` span per rendered file with its template and size in bytes.
+
+The same sinks also receive progress events as they happen: ``run_start``
+and ``phase_start`` when a run or phase begins, and ``warning`` and
+``error`` events (e.g. a template that failed to render). Together with the
+end-of-span records this is a live event stream for progress bars and
+fail-fast consumers; ``create_project_structure(on_event=...)`` and
+``ProjectGenerator.iter_events`` expose it per generation.
+
+Sinks are plain callables receiving one dict per span, so anything from a
+list to a metrics client can be plugged in; ``JsonLinesSink`` appends the
+spans to a JSON-lines file. A tracer can also dump a ``cProfile`` profile of
+every run.
+
+By default the generator uses ``NULL_TRACER``, whose traces skip all timing,
+so instrumentation costs next to nothing when it is not used.
+
+Example::
+
+    tracer = Tracer(sinks=[JsonLinesSink("spans.jsonl")], profile_dir="profiles")
+    generator = ProjectGenerator(tracer=tracer)
+"""
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+class JsonLinesSink:
+    """Append spans to a file, one JSON object per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __call__(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class MemorySink:
+    """Collect spans in a list (handy in tests and benchmarks)."""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.records.append(record)
+
+
+class Tracer:
+    """Source of ``Trace`` objects that report to a set of sinks."""
+
+    enabled = True
+
+    def __init__(self, sinks=(), profile_dir=None):
+        """
+        Args:
+            sinks: Callables each called with every span as a dict
+            profile_dir: Directory to write a ``cProfile`` dump of each run
+                to (``<run name>-<run id>.prof``, readable with ``pstats``).
+                Only the thread that runs the generation is profiled.
+        """
+        self.sinks = list(sinks)
+        self.profile_dir = profile_dir
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def emit(self, record):
+        """Send a span to every sink; a failing sink never breaks generation."""
+        _send(self.sinks, record)
+
+    def run(self, name, sinks=(), **attrs):
+        """Start a traced run; use as a context manager.
+
+        Args:
+            name: Name of the run (the project name)
+            sinks: Extra sinks receiving only this run's records
+            **attrs: Attributes included in the ``run`` records
+        """
+        return Trace(self, name, attrs, sinks)
+
+    def close(self):
+        """Close every sink that can be closed."""
+        for sink in self.sinks:
+            close = getattr(sink, "close", None)
+            if close is not None:
+                close()
+
+
+class Trace:
+    """Spans of a single run, e.g. one ``create_project_structure`` call."""
+
+    enabled = True
+
+    def __init__(self, tracer, name, attrs, sinks=()):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.sinks = list(sinks)
+        self.run_id = secrets.token_hex(4)
+        self._start = None
+        self._wall_start = None
+        self._profiler = None
+
+    def __enter__(self):
+        if self.tracer.profile_dir:
+            self._start_profiler()
+        self._wall_start = time.time()
+        self._start = time.perf_counter()
+        self._emit('run_start', self.name, self._wall_start, 0.0, **self.attrs)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._start
+        if self._profiler is not None:
+            self._stop_profiler()
+        if exc_type is not None:
+            self.event('error', self.name, error=exc_type.__name__, message=str(exc))
+        self._emit('run', self.name, self._wall_start, duration,
+                   status='ok' if exc_type is None else 'error', **self.attrs)
+        return False
+
+    def span(self, name, **attrs):
+        """Time a phase; use as a context manager.
+
+        The ``with`` target is a dict; entries added to it are included in the
+        span.
+        """
+        return _Span(self, name, attrs)
+
+    def call(self, name, func, *args, **kwargs):
+        """Call ``func`` inside a phase span named ``name``."""
+        with self.span(name):
+            return func(*args, **kwargs)
+
+    def event(self, kind, name, **attrs):
+        """Report an instantaneous event such as a ``warning``."""
+        self._emit(kind, name, time.time(), 0.0, **attrs)
+
+    def file(self, path, template, func):
+        """Call ``func`` to produce a file's content and record a file span."""
+        wall_start = time.time()
+        start = time.perf_counter()
+        content = func()
+        duration = time.perf_counter() - start
+        if isinstance(content, bytes):
+            size = len(content)
+        else:
+            size = len(content.encode("utf-8"))
+        self._emit('file', path, wall_start, duration, template=template, bytes=size)
+        return content
+
+    def _emit(self, kind, name, start, duration, **attrs):
+        record = {
+            'run': self.run_id,
+            'kind': kind,
+            'name': name,
+            'start': start,
+            'duration': duration,
+            'thread': threading.current_thread().name,
+        }
+        record.update(attrs)
+        self.tracer.emit(record)
+        if self.sinks:
+            _send(self.sinks, record)
+
+    def _start_profiler(self):
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler is already active in this thread
+            logger.warning(f"Could not start profiler: {e}")
+            return
+        self._profiler = profiler
+
+    def _stop_profiler(self):
+        self._profiler.disable()
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.name)
+        path = os.path.join(self.tracer.profile_dir, f"{safe_name}-{self.run_id}.prof")
+        try:
+            os.makedirs(self.tracer.profile_dir, exist_ok=True)
+            self._profiler.dump_stats(path)
+            logger.info(f"Profile written to {path}")
+        except OSError as e:
+            logger.warning(f"Could not write profile {path}: {e}")
+        self._profiler = None
+
+
+def _send(sinks, record):
+    for sink in sinks:
+        try:
+            sink(record)
+        except Exception as e:
+            logger.warning(f"Instrumentation sink {sink!r} failed: {e}")
+
+
+class _Span:
+    """Context manager timing one phase of a ``Trace``."""
+
+    __slots__ = ('trace', 'name', 'attrs', 'wall_start', 'start')
+
+    def __init__(self, trace, name, attrs):
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.wall_start = time.time()
+        self.trace._emit('phase_start', self.name, self.wall_start, 0.0)
+        self.start = time.perf_counter()
+        return self.attrs
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs['status'] = 'error'
+        self.trace._emit('phase', self.name, self.wall_start, duration, **self.attrs)
+        return False
+
+
+class _NullSpan:
+    """Span that records nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class NullTrace:
+    """Trace that records nothing; every method is a cheap pass-through."""
+
+    enabled = False
+    run_id = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def span(self, name, **attrs):
+        return _NULL_SPAN
+
+    def call(self, name, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def event(self, kind, name, **attrs):
+        pass
+
+    def file(self, path, template, func):
+        return func()
+
+
+class NullTracer:
+    """Tracer used when instrumentation is off."""
+
+    enabled = False
+    profile_dir = None
+
+    def run(self, name, sinks=(), **attrs):
+        if sinks:
+            # Per-run sinks still get their events without a global tracer
+            return Trace(self, name, attrs, sinks)
+        return NULL_TRACE
+
+    def emit(self, record):
+        pass
+
+    def close(self):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+NULL_TRACE = NullTrace()
+NULL_TRACER = NullTracer()
@@ -4,18 +4,30 @@ from datetime import datetime
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from .template_cache import create_bytecode_cache, list_template_files, user_cache_dir
+
 
 class Jinja2TemplateLoader:
     """Loads and processes template files using Jinja2."""
 
-    def __init__(self, template_dir=None):
+    # Autoescaping changes the compiled code, so keep a separate bytecode cache
+    CACHE_NAMESPACE = 'jinja2_template_loader'
+
+    def __init__(self, template_dir=None, cache_dir=None, use_cache=True):
         if template_dir is None:
             template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
         self.template_dir = os.path.abspath(template_dir)
 
+        bytecode_cache = None
+        if use_cache:
+            bytecode_cache = create_bytecode_cache(
+                cache_dir or user_cache_dir(), self.CACHE_NAMESPACE
+            )
+
         # Configure Jinja2 environment
         self.env = Environment(
             loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=bytecode_cache,
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
@@ -56,11 +68,7 @@ class Jinja2TemplateLoader:
         Returns:
             list: List of template filenames
         """
-        if not os.path.exists(self.template_dir):
-            return []
-
-        return [f for f in os.listdir(self.template_dir)
-                if f.endswith('.j2') or f.endswith('.template')]
+        return list_template_files(self.template_dir, ('.j2', '.template'))
 
     def _to_snake_case(self, text):
         """Convert text to snake_case."""
@@ -0,0 +1,169 @@
+"""Content-hash manifest (lock file) of a generated project.
+
+Every generated project gets a ``.template_project.lock`` file recording the
+inputs it was generated from and, per output file, the template name, a hash
+of the template source and of the templates it includes, imports or extends,
+a hash of the template context and a hash of the rendered output, plus the
+template pack the project was generated with, if any.
+``ProjectGenerator.update_project`` uses it to re-render only files whose
+inputs changed, with the same pack, and to leave files the user edited alone.
+"""
+import hashlib
+import json
+import os
+import threading
+
+LOCK_FILENAME = '.template_project.lock'
+LOCK_VERSION = 1
+
+
+def hash_bytes(data):
+    """Return the hex SHA-256 of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text):
+    """Return the hex SHA-256 of ``text`` encoded as UTF-8."""
+    return hash_bytes(text.encode("utf-8"))
+
+
+def hash_file(path):
+    """Return the hex SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def canonical_json(value):
+    """Serialize ``value`` deterministically (sorted keys, no whitespace)."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def hash_context(context):
+    """Return a stable hash of a template context."""
+    return hash_text(canonical_json(context))
+
+
+def hash_output(path, binary):
+    """Hash a file on disk the way its planned content is hashed.
+
+    Text files are read with universal newlines so a checkout with CRLF line
+    endings still matches the rendered LF content.
+
+    Returns:
+        str or None: The hash, or None if the file does not exist
+    """
+    try:
+        if binary:
+            return hash_file(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return hash_text(f.read())
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    except UnicodeDecodeError:
+        # Not valid UTF-8 any more, so it was certainly edited
+        return hash_file(path)
+
+
+def file_entry(planned):
+    """Build the lock entry of a resolved ``PlannedFile``."""
+    return {
+        'template': planned.template,
+        'template_hash': planned.input_hash,
+        'context_hash': planned.context_hash,
+        'rendered_hash': hash_bytes(planned.data),
+    }
+
+
+def pack_entry(pack):
+    """Build the lock entry of the ``TemplatePack`` a project was generated with.
+
+    Returns:
+        dict or None: Spec to load the pack again, its name, version and tree
+        hash, or None for the built-in templates
+    """
+    if pack is None:
+        return None
+    return {
+        'spec': pack.spec,
+        'name': pack.name,
+        'version': pack.version,
+        'tree_hash': pack.tree_hash,
+    }
+
+
+def render_lock(inputs, entries, template_pack=None):
+    """Serialize the lock file content.
+
+    Args:
+        inputs: Generation arguments needed to re-render the project
+        entries: Mapping of output path to its lock entry
+        template_pack: ``pack_entry`` of the template pack used, if any
+
+    Returns:
+        str: Lock file text
+    """
+    lock = {
+        'version': LOCK_VERSION,
+        'inputs': inputs,
+        'files': entries,
+        'template_pack': template_pack,
+    }
+    return json.dumps(lock, indent=2, sort_keys=True, default=str) + "\n"
+
+
+def read_lock(project_dir):
+    """Read the lock file of a generated project.
+
+    Raises:
+        FileNotFoundError: If the project has no lock file
+        ValueError: If the lock file is malformed or of an unknown version
+    """
+    path = os.path.join(project_dir, LOCK_FILENAME)
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            lock = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid lock file {path}: {e}") from e
+    if not isinstance(lock, dict) or lock.get('version') != LOCK_VERSION:
+        raise ValueError(f"Unsupported lock file version in {path}")
+    return lock
+
+
+def write_lock(project_dir, content):
+    """Atomically replace the lock file of a project."""
+    path = os.path.join(project_dir, LOCK_FILENAME)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+class UpdateResult:
+    """What ``ProjectGenerator.update_project`` did to each file."""
+
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+        self.updated = []    # Re-rendered and rewritten
+        self.added = []      # New in the templates, written
+        self.unchanged = []  # Inputs or output unchanged, not touched
+        self.modified = []   # Edited by the user, left alone
+        self.conflicts = []  # New in the templates, but a user file exists
+        self.removed = []    # No longer produced by the templates, left on disk
+
+    @property
+    def written(self):
+        return self.updated + self.added
+
+    def to_dict(self):
+        return {
+            'project_dir': self.project_dir,
+            'updated': self.updated,
+            'added': self.added,
+            'unchanged': self.unchanged,
+            'modified': self.modified,
+            'conflicts': self.conflicts,
+            'removed': self.removed,
+        }
@@ -0,0 +1,218 @@
+"""Output sinks that a generated project can be written into.
+
+``ProjectGenerator.generate_to`` renders a project and hands every directory
+and file straight to an output sink, so a project can go into an archive or
+into memory without first being written to disk and read back:
+
+* ``DirectoryOutput`` - a plain directory tree,
+* ``MemoryOutput`` - a dict of paths to bytes (tests, web services),
+* ``TarOutput`` - a streaming ``.tar.gz``,
+* ``ZipOutput`` - a ``.zip``; also works on non-seekable streams.
+
+Archives put the project below a top-level folder (``prefix``) and record
+executable bits, so ``run.sh`` stays executable when extracted. New sinks
+subclass ``ProjectOutput``, which refuses to instantiate a sink missing
+``add_directory`` or ``add_file``; any other object with
+``add_directory(path)``, ``add_file(path, data, executable)`` and
+``close()`` can be used as a sink too.
+"""
+import abc
+import io
+import os
+import stat
+import time
+
+from .project_plan import make_executable
+
+# Modes recorded in archives
+DIR_MODE = 0o755
+FILE_MODE = 0o644
+EXECUTABLE_MODE = 0o755
+
+
+class ProjectOutput(abc.ABC):
+    """Base class of output sinks; usable as a context manager."""
+
+    @abc.abstractmethod
+    def add_directory(self, path):
+        """Add a directory, given relative to the project root with '/'."""
+
+    @abc.abstractmethod
+    def add_file(self, path, data, executable=False):
+        """Add a file with ``data`` (bytes) as its content."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class DirectoryOutput(ProjectOutput):
+    """Write the project into a directory, which must not exist yet."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path)
+
+    def add_directory(self, path):
+        os.makedirs(self._native(path), exist_ok=True)
+
+    def add_file(self, path, data, executable=False):
+        dest_path = self._native(path)
+        with open(dest_path, "wb") as f:
+            f.write(data)
+        if executable:
+            make_executable(dest_path)
+
+    def _native(self, path):
+        return os.path.join(self.path, *path.split('/'))
+
+
+class MemoryOutput(ProjectOutput):
+    """Collect the project in memory: ``files`` maps paths to bytes."""
+
+    def __init__(self):
+        self.directories = []
+        self.files = {}
+        self.executables = set()
+
+    def add_directory(self, path):
+        self.directories.append(path)
+
+    def add_file(self, path, data, executable=False):
+        self.files[path] = data
+        if executable:
+            self.executables.add(path)
+
+
+class _ArchiveOutput(ProjectOutput):
+    """Shared handling of the archive target and top-level folder."""
+
+    def __init__(self, target, prefix=""):
+        """
+        Args:
+            target: Path of the archive, or a writable binary file object
+                (which is left open)
+            prefix: Top-level folder the project is placed in, e.g. the
+                sanitized project name; empty for none
+        """
+        self._owns_file = isinstance(target, (str, os.PathLike))
+        self.path = target if self._owns_file else None
+        self.fileobj = open(target, "wb") if self._owns_file else target
+        self.prefix = prefix.strip('/')
+        self.mtime = int(time.time())
+        self._closed = False
+
+    def _name(self, path):
+        return '/'.join(part for part in (self.prefix, path) if part)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._close_archive()
+        finally:
+            if self._owns_file:
+                self.fileobj.close()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None and self.path is not None:
+            # Never leave a truncated archive behind
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+        return False
+
+
+class TarOutput(_ArchiveOutput):
+    """Stream the project into a gzip-compressed tar archive."""
+
+    def __init__(self, target, prefix="", compresslevel=6):
+        import gzip
+        import tarfile
+
+        super().__init__(target, prefix)
+        # Stream mode never seeks, so the target can be a pipe or socket
+        self._gzip = gzip.GzipFile(fileobj=self.fileobj, mode="wb",
+                                   compresslevel=compresslevel, mtime=self.mtime)
+        self._tar = tarfile.open(fileobj=self._gzip, mode="w|")
+        self._tarfile = tarfile
+        if self.prefix:
+            self.add_directory("")
+
+    def add_directory(self, path):
+        info = self._tarfile.TarInfo(self._name(path) + '/')
+        info.type = self._tarfile.DIRTYPE
+        info.mode = DIR_MODE
+        info.mtime = self.mtime
+        self._tar.addfile(info)
+
+    def add_file(self, path, data, executable=False):
+        info = self._tarfile.TarInfo(self._name(path))
+        info.size = len(data)
+        info.mode = EXECUTABLE_MODE if executable else FILE_MODE
+        info.mtime = self.mtime
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def _close_archive(self):
+        try:
+            self._tar.close()
+        finally:
+            self._gzip.close()
+
+
+class ZipOutput(_ArchiveOutput):
+    """Write the project into a deflate-compressed zip archive."""
+
+    def __init__(self, target, prefix=""):
+        import zipfile
+
+        super().__init__(target, prefix)
+        self._zipfile = zipfile
+        self._zip = zipfile.ZipFile(self.fileobj, "w", zipfile.ZIP_DEFLATED)
+        if self.prefix:
+            self.add_directory("")
+
+    def add_directory(self, path):
+        info = self._zipfile.ZipInfo(self._name(path) + '/', self._date_time())
+        info.external_attr = (stat.S_IFDIR | DIR_MODE) << 16 | 0x10
+        self._zip.writestr(info, b"")
+
+    def add_file(self, path, data, executable=False):
+        info = self._zipfile.ZipInfo(self._name(path), self._date_time())
+        info.compress_type = self._zipfile.ZIP_DEFLATED
+        mode = EXECUTABLE_MODE if executable else FILE_MODE
+        info.external_attr = (stat.S_IFREG | mode) << 16
+        self._zip.writestr(info, data)
+
+    def _date_time(self):
+        return time.localtime(self.mtime)[:6]
+
+    def _close_archive(self):
+        self._zip.close()
+
+
+def open_archive(path, prefix=""):
+    """Return a ``TarOutput`` or ``ZipOutput`` chosen by the file extension.
+
+    Args:
+        path: ``.zip``, ``.tar.gz`` or ``.tgz`` file to create
+        prefix: Top-level folder inside the archive
+
+    Raises:
+        ValueError: For any other extension
+    """
+    lower = str(path).lower()
+    if lower.endswith(".zip"):
+        return ZipOutput(path, prefix)
+    if lower.endswith((".tar.gz", ".tgz")):
+        return TarOutput(path, prefix)
+    raise ValueError(f"Unsupported archive format: {path} (use .zip, .tar.gz or .tgz)")
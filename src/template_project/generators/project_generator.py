@@ -1,21 +1,55 @@
 """Project generator module for creating new Python projects."""
+import functools
+import io
 import logging
 import os
+import queue
+import secrets
 import shutil
 import subprocess
-
-from PIL import Image
-
-from .template_loader import TemplateLoader
+import threading
+
+from . import git_fast_import
+from .icon_cache import IconCache
+from .instrumentation import NULL_TRACE, NULL_TRACER
+from .lockfile import (
+    LOCK_FILENAME,
+    UpdateResult,
+    file_entry,
+    hash_context,
+    hash_file,
+    hash_output,
+    pack_entry,
+    read_lock,
+    render_lock,
+    write_lock,
+)
+from .project_plan import DeferredContent, ProjectPlan
+from .template_loader import TemplateLoader, TemplateRenderError
+from .template_packs import load_pack
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Parameters of the icon conversion; part of the icon's lock entry
+ICON_PARAMS = {'size': 256, 'format': 'ICO', 'resample': 'LANCZOS'}
+
+# Ways of creating the initial git commit
+GIT_BACKENDS = ('subprocess', 'fast-import')
+
+# Generated files that get the executable bit
+EXECUTABLE_SUFFIXES = ('.sh',)
 
 
 class ProjectGenerator:
 
-    """Handles generation of new Python projects from templates."""
+    """Handles generation of new Python projects from templates.
+
+    A single instance may be shared between threads: all per-project state
+    lives in the ``ProjectPlan`` of each call, git runs with ``cwd=`` instead
+    of changing the process working directory, and the Jinja2 environment
+    and thread pool are safe for concurrent use.
+    """
 
     @staticmethod
     def sanitize_project_name(name):
@@ -31,12 +65,70 @@ class ProjectGenerator:
 
 
 
-    def __init__(self):
-        self.template_loader = TemplateLoader()
+    def __init__(self, concurrent=False, max_workers=None, git_backend='subprocess',
+                 use_icon_cache=True, tracer=None, strict=False, dedup=None,
+                 dedup_dir=None, frozen_templates=None, template_pack=None):
+        """
+        Args:
+            concurrent: Overlap template rendering, icon conversion, file
+                writes and git setup on a thread pool. The generated project
+                is identical to a sequential run.
+            max_workers: Size of the thread pool in concurrent mode
+            git_backend: ``'subprocess'`` runs git init/config/add/commit;
+                ``'fast-import'`` streams the initial commit from the rendered
+                files in one ``git fast-import`` process
+            use_icon_cache: Reuse converted icons from the user cache dir
+                instead of converting the same image again
+            tracer: ``instrumentation.Tracer`` receiving timing spans of every
+                generation (phases and rendered files); off by default
+            strict: Fail the generation with ``TemplateRenderError`` when a
+                template does not render. Otherwise the error is logged,
+                reported as a ``warning`` event and the file is left empty.
+            dedup: ``'reflink'`` or ``'hardlink'`` to write each distinct
+                file content once and clone it into every project that has
+                it (see ``dedup_store``); worthwhile for large batches
+            dedup_dir: Object directory for ``dedup`` (default: a temporary
+                directory next to the first project, removed by ``close()``)
+            frozen_templates: Load and compile every template once and never
+                check the files for changes again (see ``TemplateLoader``'s
+                ``frozen``); for long-running services and batches
+            template_pack: Template pack overriding built-in templates: an
+                installed pack's name, a ``.zip`` file or a directory (see
+                ``template_packs``)
+        """
+        if git_backend not in GIT_BACKENDS:
+            raise ValueError(f"Unknown git backend: {git_backend!r}")
+        self.git_backend = git_backend
+        self.strict = strict
+        self.template_loader = TemplateLoader(strict=strict, frozen=frozen_templates,
+                                              pack=template_pack)
+        self.icon_cache = IconCache() if use_icon_cache else None
+        self.tracer = tracer if tracer is not None else NULL_TRACER
+        self.dedup_store = None
+        if dedup:
+            from .dedup_store import DedupStore
+
+            self.dedup_store = DedupStore(dedup_dir, mode=dedup)
+        self._executor = None
+        if concurrent:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="project-generator"
+            )
+
+    def close(self):
+        """Shut down the thread pool used in concurrent mode."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.dedup_store is not None:
+            self.dedup_store.close()
 
     def create_project_structure(self, project_dir, project_name, project_desc,
                                icon_path=None, author_info=None, python_version="3.9",
-                               git_init=True, **kwargs):
+                               git_init=True, staged=False, overwrite=False,
+                               cancel=None, on_event=None, **kwargs):
         """Create the complete project structure.
 
         Args:
@@ -47,10 +139,162 @@ class ProjectGenerator:
             author_info: Dictionary with author information
             python_version: Python version requirement
             git_init: Whether to initialize a git repository
+            staged: Build the project in a temporary sibling directory and
+                publish it with a single rename, so a failure never leaves a
+                half-built project behind
+            overwrite: Replace an existing ``project_dir`` (staged mode only)
+            cancel: ``threading.Event`` that stops the generation with
+                ``GenerationCancelled`` at the next step when set. In staged
+                mode nothing is left behind.
+            on_event: Callable receiving this generation's progress events
+                as dicts, in addition to the generator's tracer: ``run_start``,
+                ``phase_start``/``phase``, ``file`` (rendered, with ``bytes``),
+                ``warning``, ``error`` and the final ``run`` record; the
+                ``write`` phase carries the total ``bytes`` written.
+                See ``instrumentation`` for the record fields.
             **kwargs: Additional template variables (features, project_type, etc.)
         """
+        if staged and os.path.exists(project_dir) and not overwrite:
+            raise FileExistsError(f"Project directory already exists: {project_dir}")
+
+        git_backend = self.git_backend if git_init else None
+        with self.tracer.run(project_name, sinks=[on_event] if on_event else (),
+                             project_dir=project_dir, staged=staged,
+                             concurrent=self._executor is not None,
+                             git_backend=git_backend) as trace:
+            # Render every file into memory before anything touches the disk.
+            # In concurrent mode the renders are still running when this returns.
+            with trace.span("plan") as span:
+                plan = self.build_plan(
+                    project_name, project_desc, icon_path=icon_path,
+                    author_info=author_info, python_version=python_version,
+                    git_init=git_init, executor=self._executor, trace=trace,
+                    cancel=cancel, **kwargs
+                )
+                span['files'] = len(plan.files)
+            plan.dedup = self.dedup_store
+
+            if staged:
+                self._write_staged(plan, project_dir, overwrite, git_init, author_info)
+                return
+
+            with trace.span("render"):
+                plan.resolve()
+            with trace.span("mkdir"):
+                os.makedirs(project_dir)
+            git_setup = None
+            if git_init:
+                git_setup = self._start_git(project_dir, author_info, trace)
+            with trace.span("write", files=len(plan.files)) as span:
+                span['bytes'] = plan.write_to(project_dir)
+
+            # Initialize git repository if requested
+            if git_init:
+                plan.check_cancelled()
+                self._finish_git(project_dir, author_info, git_setup, plan)
+
+    def generate_to(self, output, project_name, project_desc, icon_path=None,
+                    author_info=None, python_version="3.9", cancel=None,
+                    on_event=None, **kwargs):
+        """Render a project straight into an output sink.
+
+        Rendered content goes directly into the sink (an archive, memory, a
+        directory; see ``outputs``) without temporary files. No git
+        repository is created, since there is no working tree to commit. The
+        sink is not closed.
+
+        Args:
+            output: Sink such as ``outputs.TarOutput`` or ``outputs.ZipOutput``
+            project_name: Name of the project
+            project_desc: Description of the project
+            icon_path: Optional path to icon file
+            author_info: Dictionary with author information
+            python_version: Python version requirement
+            cancel: ``threading.Event`` cancelling the generation when set
+            on_event: Callable receiving progress events, as for
+                ``create_project_structure``
+            **kwargs: Additional template variables
+
+        Returns:
+            int: Number of bytes handed to the sink
+        """
+        with self.tracer.run(project_name, sinks=[on_event] if on_event else (),
+                             output=type(output).__name__,
+                             concurrent=self._executor is not None) as trace:
+            with trace.span("plan") as span:
+                plan = self.build_plan(
+                    project_name, project_desc, icon_path=icon_path,
+                    author_info=author_info, python_version=python_version,
+                    git_init=False, executor=self._executor, trace=trace,
+                    cancel=cancel, **kwargs
+                )
+                span['files'] = len(plan.files)
+            with trace.span("render"):
+                plan.resolve()
+            with trace.span("write", files=len(plan.files)) as span:
+                span['bytes'] = plan.write_to_output(output)
+            return span['bytes']
+
+    def iter_events(self, cancel=None, **kwargs):
+        """Generate a project and yield its progress events as they happen.
+
+        The generation runs on a background thread. Leaving the loop early
+        cancels it; if it fails, the exception is raised after its ``error``
+        event has been yielded.
+
+        Args:
+            cancel: Optional ``threading.Event`` to cancel from elsewhere
+            **kwargs: Arguments of ``create_project_structure``
 
+        Yields:
+            dict: Events as described for ``create_project_structure``
+        """
+        cancel = cancel or threading.Event()
+        events = queue.Queue()
+        done = object()
+        failure = []
 
+        def run():
+            try:
+                self.create_project_structure(cancel=cancel, on_event=events.put,
+                                              **kwargs)
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                events.put(done)
+
+        thread = threading.Thread(target=run, name="project-generator-events",
+                                  daemon=True)
+        thread.start()
+        try:
+            while True:
+                event = events.get()
+                if event is done:
+                    break
+                yield event
+        finally:
+            if thread.is_alive():
+                # The consumer stopped early
+                cancel.set()
+                thread.join()
+        if failure:
+            raise failure[0]
+
+    def build_plan(self, project_name, project_desc, icon_path=None,
+                   author_info=None, python_version="3.9", git_init=True,
+                   executor=None, lazy=False, trace=None, cancel=None, **kwargs):
+        """Render the complete project into an in-memory ``ProjectPlan``.
+
+        Takes the same arguments as ``create_project_structure`` minus the
+        output options. With an ``executor`` the renders run in the background,
+        with ``lazy`` they only run when a file is resolved; either way the
+        caller must ``resolve()`` the plan before reading contents. A
+        ``trace`` records how long each file took to render and a set
+        ``cancel`` event stops rendering.
+
+        Returns:
+            ProjectPlan: Directories and rendered files of the project
+        """
         # Use the static sanitizer for all technical uses
         sanitized_name = self.sanitize_project_name(project_name)
 
@@ -68,53 +312,328 @@ class ProjectGenerator:
             **kwargs  # Include any additional template variables
         }
 
-        # Create main directories
-        os.makedirs(project_dir)
-        os.makedirs(os.path.join(project_dir, "src", sanitized_name))
-        os.makedirs(os.path.join(project_dir, "src", sanitized_name, "gui"))
-        os.makedirs(os.path.join(project_dir, "src", sanitized_name, "assets"))
-        os.makedirs(os.path.join(project_dir, "tests"))
-        os.makedirs(os.path.join(project_dir, ".github"))
-        # Create dev folder for temporary/testing files (excluded from git)
-        os.makedirs(os.path.join(project_dir, "dev"))
-
-        # Create dev folder README
-        dev_readme_content = self.template_loader.load_template(
-            'dev_readme.md.template',
-            **template_context
-        )
-        dev_readme_path = os.path.join(project_dir, "dev", "README.md")
-        with open(dev_readme_path, "w", encoding="utf-8") as f:
-            f.write(dev_readme_content)
+        plan = ProjectPlan(executor=executor, lazy=lazy, trace=trace, cancel=cancel)
+        plan.context = template_context
+        plan.context_hash = hash_context(template_context)
+        plan.inputs = {
+            'project_name': project_name,
+            'project_desc': project_desc,
+            'icon_path': icon_path or None,
+            'author_info': author_info or {},
+            'python_version': python_version,
+            'git_init': git_init,
+            **kwargs
+        }
 
-        # Copy and convert icon if provided
+        # The template tree mirrors the project: one file per template
+        self._render_tree(plan, template_context)
+
+        # The icon goes into assets/, which exists even without one
+        plan.add_directory(f"src/{template_context['package_name']}/assets")
         if icon_path:
-            self._process_icon(icon_path, project_dir, sanitized_name)
-
-        # Generate all project files with enhanced context
-        self._generate_pyproject_toml(project_dir, template_context)
-        self._generate_readme(project_dir, template_context)
-        self._generate_gitignore(project_dir, template_context)
-        self._generate_license(project_dir, template_context)
-        self._generate_run_scripts(project_dir, template_context)
-        self._generate_source_files(project_dir, template_context)
-        self._generate_copilot_instructions(project_dir, template_context)
-
-        # Initialize git repository if requested
-        if git_init:
-            self._initialize_git_repository(project_dir, author_info)
-
-    def _process_icon(self, icon_path, project_dir, package_name):
-        """Process and copy the icon file."""
-        icon_filename = "icon.ico"
-        dest_path = os.path.join(
-            project_dir, "src", package_name, "assets", icon_filename
+            self._process_icon(icon_path, plan, template_context['package_name'])
+
+        # Content-hash manifest used by update_project(); rendered last since
+        # it hashes every other file
+        lock_content = DeferredContent(self._render_lockfile, plan)
+        if plan.trace.enabled:
+            lock_content = DeferredContent(plan.trace.file, LOCK_FILENAME, None,
+                                           lock_content.result)
+        plan.add_file(LOCK_FILENAME, lock_content)
+        return plan
+
+    def update_project(self, project_dir, dry_run=False, template_pack=None,
+                       **overrides):
+        """Bring an existing project up to date with the current templates.
+
+        Only files whose template source or context changed are re-rendered,
+        and a file is only rewritten if it still matches what was generated
+        last time; files edited by the user are reported and left alone.
+
+        Args:
+            project_dir: Directory of a project generated with a lock file
+            dry_run: Report what would change without writing anything
+            template_pack: Template pack to render with. Defaults to this
+                generator's pack or else the pack recorded in the lock file.
+            **overrides: Generation arguments to change (e.g. python_version)
+
+        Returns:
+            UpdateResult: What happened to each file
+
+        Raises:
+            ValueError: If the lock file is invalid or the template pack it
+                records cannot be loaded
+        """
+        lock = read_lock(project_dir)
+        pack = self._update_pack(project_dir, lock, template_pack)
+        if pack is not self.template_loader.pack:
+            # Render with a generator of its own rather than swap the loader
+            # of one that may be in use by other threads
+            generator = ProjectGenerator(strict=self.strict, template_pack=pack,
+                                         use_icon_cache=self.icon_cache is not None)
+            try:
+                return generator.update_project(project_dir, dry_run=dry_run,
+                                                template_pack=pack, **overrides)
+            finally:
+                generator.close()
+
+        inputs = {**lock['inputs'], **overrides}
+        old_entries = lock['files']
+        plan = self.build_plan(lazy=True, **inputs)
+
+        result = UpdateResult(project_dir)
+        entries = {}
+        to_write = ProjectPlan()
+        for planned in plan.files:
+            if planned.path == LOCK_FILENAME:
+                continue
+            old = old_entries.get(planned.path)
+            if old is not None and (
+                planned.input_hash is None  # e.g. the icon source is gone
+                or (old['template'] == planned.template
+                    and old['template_hash'] == planned.input_hash
+                    and old['context_hash'] == planned.context_hash)
+            ):
+                entries[planned.path] = old
+                result.unchanged.append(planned.path)
+                continue
+            if planned.input_hash is None:
+                continue
+
+            planned.resolve()
+            entry = file_entry(planned)
+            disk_hash = hash_output(
+                os.path.join(project_dir, *planned.path.split('/')),
+                binary=isinstance(planned.content, bytes)
+            )
+            if disk_hash == entry['rendered_hash']:
+                # Output identical to what is on disk already
+                entries[planned.path] = entry
+                result.unchanged.append(planned.path)
+            elif old is None:
+                if disk_hash is None:
+                    entries[planned.path] = entry
+                    to_write.files.append(planned)
+                    result.added.append(planned.path)
+                else:
+                    result.conflicts.append(planned.path)
+            elif disk_hash != old['rendered_hash']:
+                entries[planned.path] = old
+                result.modified.append(planned.path)
+            else:
+                entries[planned.path] = entry
+                to_write.files.append(planned)
+                result.updated.append(planned.path)
+
+        produced = {planned.path for planned in plan.files}
+        result.removed = sorted(path for path in old_entries if path not in produced)
+
+        if not dry_run:
+            to_write.write_to(project_dir, replace=True)
+            write_lock(project_dir, render_lock(plan.inputs, entries,
+                                                pack_entry(pack)))
+        logger.info(
+            f"Updated {project_dir}: {len(result.updated)} updated, "
+            f"{len(result.added)} added, {len(result.modified)} user-modified"
         )
+        return result
+
+    def _render_lockfile(self, plan):
+        """Render the lock file for a plan whose other files are resolved."""
+        entries = {
+            planned.path: file_entry(planned)
+            for planned in plan.files
+            if planned.path != LOCK_FILENAME
+        }
+        return render_lock(plan.inputs, entries,
+                           pack_entry(self.template_loader.pack))
+
+    def _update_pack(self, project_dir, lock, template_pack):
+        """Return the ``TemplatePack`` to update a project with, or None."""
+        if template_pack is not None:
+            return load_pack(template_pack)
+        if self.template_loader.pack is not None:
+            return self.template_loader.pack
+        recorded = lock.get('template_pack')
+        if not recorded:
+            return None
+        try:
+            pack = load_pack(recorded['spec'])
+        except ValueError as e:
+            raise ValueError(
+                f"{project_dir} was generated with template pack "
+                f"{recorded.get('name')!r} ({recorded['spec']}), which cannot be "
+                f"loaded: {e}"
+            ) from e
+        if pack.tree_hash != recorded.get('tree_hash'):
+            logger.info(
+                f"Template pack {pack.name!r} changed since {project_dir} was "
+                f"generated (version {recorded.get('version')!r} -> {pack.version!r})"
+            )
+        return pack
+
+    def _write_staged(self, plan, project_dir, overwrite, git_init, author_info):
+        """Write the plan into a temporary sibling and rename it into place."""
+        trace = plan.trace
+        project_dir = os.path.abspath(project_dir)
+        with trace.span("mkdir"):
+            staging_dir = _make_sibling_dir(project_dir, "staging")
+        git_setup = None
+        try:
+            # The staging directory exists up front, so in concurrent mode
+            # `git init` overlaps with the template renders still in flight
+            if git_init:
+                git_setup = self._start_git(staging_dir, author_info, trace)
+            with trace.span("render"):
+                plan.resolve()
+            with trace.span("write", files=len(plan.files)) as span:
+                span['bytes'] = plan.write_to(staging_dir)
+            if git_init:
+                plan.check_cancelled()
+                self._finish_git(staging_dir, author_info, git_setup, plan)
+            plan.check_cancelled()
+            with trace.span("publish"):
+                _publish_directory(staging_dir, project_dir, overwrite)
+        except BaseException:
+            if git_setup is not None and not git_setup.cancel():
+                # Let a running `git init` finish before removing its directory
+                git_setup.exception()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    def _start_git(self, project_dir, author_info, trace=NULL_TRACE):
+        """Start ``git init`` in the background when running concurrently.
+
+        Returns:
+            Future or None: Pending repository setup, None in sequential mode
+        """
+        if self._executor is None:
+            return None
+        return self._executor.submit(trace.call, "git_init",
+                                     self._git_init_repository, project_dir,
+                                     author_info, trace)
+
+    def _finish_git(self, project_dir, author_info, git_setup, plan=None):
+        """Complete git setup with the initial commit of the written files."""
+        trace = plan.trace if plan is not None else NULL_TRACE
+        if git_setup is None:
+            initialized = trace.call("git_init", self._git_init_repository,
+                                     project_dir, author_info, trace)
+        else:
+            initialized = git_setup.result()
+        if initialized:
+            trace.call("git_commit", self._git_commit_all, project_dir,
+                       author_info, plan)
+
+    def _render_tree(self, plan, template_context):
+        """Add a file to the plan for every template of the template tree.
+
+        Raises:
+            ValueError: If two templates render to the same path
+        """
+        loader = self.template_loader
+        sources = {}
+        for template_name in loader.project_templates():
+            try:
+                path = loader.render_path(template_name, template_context)
+            except TemplateRenderError as e:
+                if self.strict:
+                    raise
+                logger.error(str(e))
+                plan.trace.event('warning', template_name, template=template_name,
+                                 message=str(e))
+                continue
+            if path is None:
+                continue
+            if path in sources:
+                raise ValueError(f"Templates {sources[path]} and {template_name} "
+                                 f"both render to {path}")
+            sources[path] = template_name
+            self._render_file(plan, path, template_name, template_context,
+                              executable=path.endswith(EXECUTABLE_SUFFIXES))
+
+    def _render_file(self, plan, path, template_name, template_context,
+                     executable=False):
+        """Render a template and add the result to the plan."""
+        if plan.trace.enabled:
+            render = functools.partial(self._render_template, plan, path,
+                                       template_name, template_context)
+            content = plan.defer(plan.trace.file, path, template_name, render)
+        else:
+            content = plan.defer(self._render_template, plan, path,
+                                 template_name, template_context)
+        # Covers included templates too, so editing one re-renders on update
+        input_hash = self.template_loader.template_hash(template_name)
+        return plan.add_file(path, content, template=template_name,
+                             executable=executable, input_hash=input_hash,
+                             context_hash=plan.context_hash)
+
+    def _render_template(self, plan, path, template_name, template_context):
+        """Render one template, reporting a failure as a warning unless strict."""
+        try:
+            return self.template_loader.render_template(template_name,
+                                                        **template_context)
+        except TemplateRenderError as e:
+            if self.strict:
+                raise
+            logger.error(str(e))
+            plan.trace.event('warning', path, template=template_name, message=str(e))
+            return ""
+
+    def _process_icon(self, icon_path, plan, package_name):
+        """Process the icon file and add it to the plan."""
+        icon_filename = "icon.ico"
+        dest_path = f"src/{package_name}/assets/{icon_filename}"
+        source_hash = hash_file(icon_path) if os.path.isfile(icon_path) else None
+        planned = plan.add_file(dest_path, None, input_hash=source_hash,
+                                context_hash=hash_context(ICON_PARAMS))
+        if plan.trace.enabled:
+            load = functools.partial(self._load_icon, planned, icon_path, source_hash)
+            planned.content = plan.defer(plan.trace.file, dest_path, None, load)
+        else:
+            planned.content = plan.defer(self._load_icon, planned, icon_path,
+                                         source_hash)
+
+    def _load_icon(self, planned, icon_path, source_hash):
+        """Return the converted icon, from the icon cache when possible.
+
+        On a cache hit ``planned.source`` is pointed at the cache entry so the
+        icon is cloned into the project rather than written out again.
+        """
+        ext = os.path.splitext(icon_path)[1].lower()
+        if self.icon_cache is None or source_hash is None or ext == ".ico":
+            return self._convert_icon(icon_path)
+
+        key = self.icon_cache.key(source_hash, ICON_PARAMS)
+        cached_path = self.icon_cache.get(key)
+        if cached_path is not None:
+            try:
+                with open(cached_path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                logger.debug(f"Icon cache hit for {icon_path}")
+                planned.source = cached_path
+                return data
+
+        data = self._convert_icon(icon_path)
+        cached_path = self.icon_cache.put(key, data)
+        if cached_path is not None:
+            planned.source = cached_path
+        return data
+
+    def _convert_icon(self, icon_path):
+        """Return the icon as ICO bytes, converting other image formats."""
         ext = os.path.splitext(icon_path)[1].lower()
 
         if ext == ".ico":
-            shutil.copy2(icon_path, dest_path)
+            with open(icon_path, "rb") as f:
+                return f.read()
         else:
+            # Pillow is imported here so headless runs without an icon never load it
+            from PIL import Image
+
             # Convert to square, resize, and save as .ico
             img = Image.open(icon_path)
             # Crop to square
@@ -131,198 +650,146 @@ class ProjectGenerator:
             except AttributeError:
                 # Fall back to older PIL version
                 img = img.resize((256, 256))
-            img.save(dest_path, format="ICO")
-
-    def _generate_pyproject_toml(self, project_dir, template_context):
-        """Generate pyproject.toml file."""
-        content = self.template_loader.load_template(
-            'pyproject.toml.template',
-            **template_context
-        )
-
-        pyproject_path = os.path.join(project_dir, "pyproject.toml")
-        with open(pyproject_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _generate_readme(self, project_dir, template_context):
-        """Generate README.md file."""
-        content = self.template_loader.load_template(
-            'README.md.template',
-            **template_context
-        )
-
-        with open(os.path.join(project_dir, "README.md"), "w") as f:
-            f.write(content)
-
-    def _generate_gitignore(self, project_dir, template_context):
-        """Generate .gitignore file."""
-        content = self.template_loader.load_template(
-            '.gitignore.template',
-            **template_context
-        )
-        with open(os.path.join(project_dir, ".gitignore"), "w") as f:
-            f.write(content)
-
-    def _generate_license(self, project_dir, template_context):
-        """Generate LICENSE file."""
-        content = self.template_loader.load_template(
-            'LICENSE.template',
-            **template_context
-        )
+            buffer = io.BytesIO()
+            img.save(buffer, format="ICO")
+            return buffer.getvalue()
 
-        with open(os.path.join(project_dir, "LICENSE"), "w") as f:
-            f.write(content)
-
-    def _generate_run_scripts(self, project_dir, template_context):
-        """Generate run.bat and run.sh scripts."""
-        # Windows batch script
-        bat_content = self.template_loader.load_template(
-            'run.bat.template',
-            **template_context
-        )
-        with open(os.path.join(project_dir, "run.bat"), "w") as f:
-            f.write(bat_content)
-
-        # Unix shell script
-        sh_content = self.template_loader.load_template(
-            'run.sh.template',
-            **template_context
-        )
-        with open(os.path.join(project_dir, "run.sh"), "w") as f:
-            f.write(sh_content)
-
-    def _generate_source_files(self, project_dir, template_context):
-        """Generate all source files."""
-        package_name = template_context['package_name']
-
-        # Create __init__.py files
-        with open(
-            os.path.join(project_dir, "src", package_name, "__init__.py"), "w"
-        ) as f:
-            f.write("")
-
-        with open(
-            os.path.join(project_dir, "src", package_name, "gui", "__init__.py"), "w"
-        ) as f:
-            f.write("")
-
-        # Create config.py
-        config_content = self.template_loader.load_template(
-            'config.py.template',
-            **template_context
-        )
-        with open(
-            os.path.join(project_dir, "src", package_name, "config.py"), "w"
-        ) as f:
-            f.write(config_content)
-
-        # Create main.py
-        main_content = self.template_loader.load_template(
-            'main.py.template',
-            **template_context
-        )
-        with open(
-            os.path.join(project_dir, "src", package_name, "main.py"), "w"
-        ) as f:
-            f.write(main_content)
-
-        # Create __main__.py for module execution
-        main_module_content = self.template_loader.load_template(
-            '__main__.py.template',
-            **template_context
-        )
-        with open(
-            os.path.join(project_dir, "src", package_name, "__main__.py"), "w"
-        ) as f:
-            f.write(main_module_content)
-
-        # Create home_tab.py
-        home_tab_content = self.template_loader.load_template(
-            'home_tab.py.template',
-            **template_context
-        )
-        with open(
-            os.path.join(project_dir, "src", package_name, "gui", "home_tab.py"), "w"
-        ) as f:
-            f.write(home_tab_content)
-
-        # Create settings_tab.py
-        settings_tab_content = self.template_loader.load_template(
-            'settings_tab.py.template',
-            **template_context
-        )
-        with open(
-            os.path.join(
-                project_dir, "src", package_name, "gui", "settings_tab.py"
-            ), "w"
-        ) as f:
-            f.write(settings_tab_content)
-
-        # Create basic test file
-        test_content = self.template_loader.load_template(
-            'test_main.py.template',
-            **template_context
-        )
-        with open(os.path.join(project_dir, "tests", "test_main.py"), "w") as f:
-            f.write(test_content)
-
-    def _generate_copilot_instructions(self, project_dir, template_context):
-        """Generate GitHub Copilot instructions file in .github folder."""
-        copilot_content = self.template_loader.load_template(
-            '.copilot-instructions.md.template',
-            **template_context
-        )
-        copilot_file_path = os.path.join(
-            project_dir, ".github", ".copilot-instructions.md"
-        )
-        with open(copilot_file_path, "w", encoding="utf-8") as f:
-            f.write(copilot_content)
-
-    def _initialize_git_repository(self, project_dir, author_info=None):
+    def _initialize_git_repository(self, project_dir, author_info=None, plan=None):
         """Initialize a git repository with initial commit.
 
         Args:
             project_dir: Directory where the project is located
             author_info: Dictionary with author information for git config
+            plan: Resolved plan of the written files (used by fast-import)
         """
-        try:
-            # Change to project directory
-            original_cwd = os.getcwd()
-            os.chdir(project_dir)
+        if self._git_init_repository(project_dir, author_info):
+            self._git_commit_all(project_dir, author_info, plan)
+
+    def _git_init_repository(self, project_dir, author_info=None, trace=NULL_TRACE):
+        """Run ``git init`` and configure the author in ``project_dir``.
+
+        Git runs with ``cwd=project_dir`` instead of changing the process
+        working directory, so this is safe to call from worker threads.
 
+        Returns:
+            bool: Whether the repository was created
+        """
+        try:
             logger.info(f"Initializing git repository in {project_dir}")
 
             # Initialize git repository
-            subprocess.run(["git", "init"], check=True, capture_output=True)
+            self._run_git(project_dir, "init")
 
             # Configure git user if author info provided
-            if author_info:
+            if self.git_backend == 'fast-import':
+                git_fast_import.write_user_config(project_dir, author_info)
+            elif author_info:
                 if author_info.get("name"):
-                    subprocess.run(
-                        ["git", "config", "user.name", author_info["name"]],
-                        check=True, capture_output=True
-                    )
+                    self._run_git(project_dir, "config", "user.name",
+                                  author_info["name"])
                 if author_info.get("email"):
-                    subprocess.run(
-                        ["git", "config", "user.email", author_info["email"]],
-                        check=True, capture_output=True
-                    )
+                    self._run_git(project_dir, "config", "user.email",
+                                  author_info["email"])
+            return True
+
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Failed to initialize git repository: {e}")
+            trace.event('warning', 'git_init', message=str(e))
+        except FileNotFoundError:
+            logger.warning("Git not found in PATH. Skipping git initialization.")
+            trace.event('warning', 'git_init', message="git not found in PATH")
+        return False
+
+    def _git_commit_all(self, project_dir, author_info=None, plan=None):
+        """Stage every file in ``project_dir`` and create the initial commit."""
+        try:
+            if self.git_backend == 'fast-import' and plan is not None:
+                git_fast_import.commit_plan(project_dir, plan, author_info)
+                logger.info("Git repository initialized with fast-import commit")
+                return
 
             # Add all files to staging
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
+            self._run_git(project_dir, "add", ".")
 
             # Create initial commit
-            subprocess.run(
-                ["git", "commit", "-m", "Initial project setup from template"],
-                check=True, capture_output=True
-            )
+            self._run_git(project_dir, "commit", "-m",
+                          "Initial project setup from template")
 
             logger.info("Git repository initialized successfully with initial commit")
 
         except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to initialize git repository: {e}")
+            if plan is not None:
+                plan.trace.event('warning', 'git_commit', message=str(e))
         except FileNotFoundError:
             logger.warning("Git not found in PATH. Skipping git initialization.")
-        finally:
-            # Always return to original directory
-            os.chdir(original_cwd)
+            if plan is not None:
+                plan.trace.event('warning', 'git_commit',
+                                 message="git not found in PATH")
+
+    @staticmethod
+    def _run_git(project_dir, *args):
+        """Run a git command inside ``project_dir``."""
+        return subprocess.run(["git", *args], cwd=project_dir, check=True,
+                              capture_output=True)
+
+
+def _make_sibling_dir(path, purpose):
+    """Create a hidden, uniquely named directory next to ``path``.
+
+    The directory lives on the same filesystem as ``path`` so it can be moved
+    into place with ``os.rename``. Unlike ``tempfile.mkdtemp`` it keeps the
+    regular umask-derived permissions the published project should have.
+    """
+    parent, name = os.path.split(path)
+    os.makedirs(parent or ".", exist_ok=True)
+    while True:
+        candidate = os.path.join(
+            parent, f".{name}.{purpose}-{secrets.token_hex(4)}"
+        )
+        try:
+            os.mkdir(candidate)
+            return candidate
+        except FileExistsError:
+            continue
+
+
+def _publish_directory(staging_dir, project_dir, overwrite=False):
+    """Atomically move a fully written project into place.
+
+    Safe against other threads or processes publishing to the same path: the
+    loser gets ``FileExistsError`` (or, with ``overwrite``, retries the swap).
+
+    Args:
+        staging_dir: Directory holding the finished project
+        project_dir: Final location of the project
+        overwrite: Replace ``project_dir`` if it already exists
+    """
+    while True:
+        try:
+            os.rename(staging_dir, project_dir)
+            return
+        except OSError as e:
+            if not os.path.exists(project_dir):
+                raise
+            if not overwrite:
+                raise FileExistsError(
+                    f"Project directory already exists: {project_dir}"
+                ) from e
+
+        # Move the old project aside first so the new one appears in one rename
+        backup_dir = _make_sibling_dir(project_dir, "old")
+        os.rmdir(backup_dir)
+        try:
+            os.rename(project_dir, backup_dir)
+        except FileNotFoundError:
+            # Someone else moved it away in the meantime; try again
+            continue
+        try:
+            os.rename(staging_dir, project_dir)
+        except OSError:
+            if not os.path.exists(project_dir):
+                os.rename(backup_dir, project_dir)
+            raise
+        shutil.rmtree(backup_dir, ignore_errors=True)
+        return
@@ -0,0 +1,289 @@
+"""In-memory description of a project before it is written to disk."""
+import logging
+import os
+from concurrent.futures import Future
+
+from .fileops import clone_file
+from .instrumentation import NULL_TRACE
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+class GenerationCancelled(Exception):
+    """Raised inside a generation whose cancel event has been set."""
+
+
+class DeferredContent:
+    """File content that is only computed when first needed."""
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def result(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def cancel(self):
+        return True
+
+
+class PlannedFile:
+    """A single output file: its relative path, content and metadata."""
+
+    def __init__(self, path, content, template=None, executable=False,
+                 input_hash=None, context_hash=None):
+        """
+        Args:
+            path: Path relative to the project root, using forward slashes
+            content: Text (written as UTF-8) or bytes, or a ``Future`` /
+                ``DeferredContent`` of either until the plan is resolved
+            template: Name of the template the content was rendered from
+            executable: Whether the file should get the executable bit
+            input_hash: Hash of the source the content is produced from
+                (template source, icon image, or the literal content)
+            context_hash: Hash of the variables/parameters used to produce it
+        """
+        self.path = path
+        self.content = content
+        self.template = template
+        self.executable = executable
+        self.input_hash = input_hash
+        self.context_hash = context_hash
+        # Existing file holding exactly ``content`` (e.g. a cache entry); it
+        # is cloned instead of writing the content out again
+        self.source = None
+
+    @property
+    def pending(self):
+        """Whether the content still has to be computed."""
+        return isinstance(self.content, (Future, DeferredContent))
+
+    def resolve(self):
+        """Compute or wait for the content; returns it."""
+        if self.pending:
+            self.content = self.content.result()
+        return self.content
+
+    @property
+    def data(self):
+        """The file content as bytes."""
+        if isinstance(self.content, bytes):
+            return self.content
+        return self.content.encode("utf-8")
+
+    def __repr__(self):
+        return f"PlannedFile({self.path!r}, template={self.template!r})"
+
+
+class ProjectPlan:
+    """Ordered list of directories and files that make up a project.
+
+    ``ProjectGenerator`` renders everything into a plan first, so nothing
+    touches the disk until every template and the icon have been processed.
+
+    A plan built with an ``executor`` renders in the background: ``defer``
+    submits work to the executor and ``resolve`` waits for all of it, in plan
+    order, so the result is the same as a sequential build. A ``lazy`` plan
+    renders nothing until a file's content is actually needed.
+
+    ``trace`` is the instrumentation ``Trace`` of the generation the plan
+    belongs to; it receives the timing of every rendered file. Setting the
+    ``cancel`` event (a ``threading.Event``) makes the next render, resolve
+    or write step raise ``GenerationCancelled``.
+    """
+
+    def __init__(self, executor=None, lazy=False, trace=None, cancel=None,
+                 dedup=None):
+        self.directories = []
+        self.files = []
+        self.executor = executor
+        self.lazy = lazy
+        self.trace = trace if trace is not None else NULL_TRACE
+        self.cancel = cancel
+        # ``DedupStore`` that identical files are cloned from, if any
+        self.dedup = dedup
+        # Generation arguments and template context, recorded by the generator
+        self.inputs = {}
+        self.context = {}
+        self.context_hash = None
+
+    def defer(self, func, *args, **kwargs):
+        """Run ``func`` on the plan's executor, or immediately without one.
+
+        Returns:
+            The result of ``func``, or a ``Future``/``DeferredContent`` for it
+        """
+        if self.lazy:
+            return DeferredContent(func, *args, **kwargs)
+        self.check_cancelled()
+        if self.executor is None:
+            return func(*args, **kwargs)
+        return self.executor.submit(func, *args, **kwargs)
+
+    def check_cancelled(self):
+        """Raise ``GenerationCancelled`` if the cancel event is set."""
+        if self.cancel is not None and self.cancel.is_set():
+            raise GenerationCancelled()
+
+    def resolve(self):
+        """Compute pending contents in order; cancels the rest on an error."""
+        try:
+            for planned in self.files:
+                if planned.pending:
+                    self.check_cancelled()
+                planned.resolve()
+        except BaseException:
+            for planned in self.files:
+                if planned.pending:
+                    planned.content.cancel()
+            raise
+
+    def add_directory(self, path):
+        """Add an (possibly empty) directory relative to the project root."""
+        if path not in self.directories:
+            self.directories.append(path)
+
+    def add_file(self, path, content, template=None, executable=False,
+                 input_hash=None, context_hash=None):
+        """Add a file; returns the new ``PlannedFile``."""
+        planned = PlannedFile(path, content, template=template,
+                              executable=executable, input_hash=input_hash,
+                              context_hash=context_hash)
+        self.files.append(planned)
+        return planned
+
+    def get(self, path):
+        """Return the planned file at ``path`` or None."""
+        for planned in self.files:
+            if planned.path == path:
+                return planned
+        return None
+
+    @property
+    def total_bytes(self):
+        return sum(len(planned.data) for planned in self.files)
+
+    def all_directories(self):
+        """Return the planned directories plus every parent of a planned file."""
+        directories = list(self.directories)
+        for planned in self.files:
+            parent = planned.path.rpartition('/')[0]
+            if parent and parent not in directories:
+                directories.append(parent)
+        return directories
+
+    def write_to_output(self, output):
+        """Hand every directory and file of the plan to an output sink.
+
+        Args:
+            output: Sink from ``outputs`` (or anything with ``add_directory``
+                and ``add_file``); text is passed on UTF-8 encoded
+
+        Returns:
+            int: Number of bytes written
+        """
+        self.resolve()
+        self.check_cancelled()
+        # Archives list every directory, parents before children
+        added = set()
+        for directory in self.all_directories():
+            parts = directory.split('/')
+            for depth in range(1, len(parts) + 1):
+                path = '/'.join(parts[:depth])
+                if path not in added:
+                    added.add(path)
+                    output.add_directory(path)
+        total = 0
+        for planned in self.files:
+            self.check_cancelled()
+            data = planned.data
+            output.add_file(planned.path, data, executable=planned.executable)
+            total += len(data)
+        return total
+
+    def write_to(self, root, replace=False):
+        """Write every directory and file of the plan below ``root``.
+
+        Directories are created first; files are then written on the plan's
+        executor if it has one, which hides per-file latency on network
+        filesystems.
+
+        Args:
+            root: Existing directory the project is written into
+            replace: Unlink existing files instead of writing into them, so
+                a file hard-linked by deduplication is never changed in place
+
+        Returns:
+            int: Number of bytes written
+        """
+        self.resolve()
+        self.check_cancelled()
+        for directory in self.all_directories():
+            os.makedirs(_native_path(root, directory), exist_ok=True)
+
+        dedup = self.dedup
+        scope = dedup.usable(root) if dedup is not None else False
+        if not scope:
+            dedup = None
+        binary_only = scope == 'binary'
+        if self.executor is None:
+            return sum(_write_file(root, planned, dedup, replace, binary_only)
+                       for planned in self.files)
+        # Consume the iterator so the first write error is raised here
+        return sum(self.executor.map(
+            lambda planned: _write_file(root, planned, dedup, replace, binary_only),
+            self.files
+        ))
+
+
+def _write_file(root, planned, dedup=None, replace=False, binary_only=False):
+    """Write one planned file below ``root``; returns its size in bytes.
+
+    With ``binary_only`` only bytes content goes through ``dedup``; text is
+    written directly.
+    """
+    dest_path = _native_path(root, planned.path)
+    if replace and os.path.lexists(dest_path):
+        os.unlink(dest_path)
+    # Cached icons (``planned.source``) go through the store as well, so
+    # every project links the same object
+    if dedup is not None and planned.content and (
+            not binary_only or isinstance(planned.content, bytes)):
+        method, size = dedup.place(planned.content, dest_path, planned.executable)
+        # Hard links share the object's mode, which is already right
+        if planned.executable and method != 'hardlink':
+            make_executable(dest_path)
+        return size
+    if planned.source is not None:
+        try:
+            clone_file(planned.source, dest_path)
+        except OSError as e:
+            # The source may have been evicted meanwhile; the content is known
+            logger.debug(f"Could not clone {planned.source}: {e}")
+        else:
+            if planned.executable:
+                make_executable(dest_path)
+            return os.stat(dest_path).st_size
+    if isinstance(planned.content, bytes):
+        with open(dest_path, "wb") as f:
+            size = f.write(planned.content)
+    else:
+        with open(dest_path, "w", encoding="utf-8") as f:
+            f.write(planned.content)
+            size = f.tell()
+    if planned.executable:
+        make_executable(dest_path)
+    return size
+
+
+def make_executable(path):
+    """Add the executable bit wherever the file is readable."""
+    mode = os.stat(path).st_mode
+    os.chmod(path, mode | ((mode & 0o444) >> 2))
+
+
+def _native_path(root, path):
+    """Join a forward-slash relative path onto ``root``."""
+    return os.path.join(root, *path.split('/'))
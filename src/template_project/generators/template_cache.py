@@ -0,0 +1,168 @@
+"""On-disk caches for compiled Jinja2 templates.
+
+Two layers are provided:
+
+* a bytecode cache (``jinja2.FileSystemBytecodeCache``) whose entries are
+  validated against a checksum of each template's source, and
+* precompiled template bundles: the whole template tree compiled to Python
+  modules once (``Environment.compile_templates``) and loaded back with a
+  ``jinja2.ModuleLoader``, skipping the Jinja2 compiler entirely. Bundles
+  are never checked for edits, so only frozen loaders use them.
+
+Both live under the user cache directory. Bundles are stored in a directory
+named after a hash of the template sources, the Jinja2 version and the
+environment options, so editing a template simply selects a new bundle.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+import jinja2
+from jinja2 import FileSystemBytecodeCache
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+APP_NAME = "template_project"
+
+# Environment variable that overrides the cache location (useful for CI)
+CACHE_DIR_ENV = "TEMPLATE_PROJECT_CACHE_DIR"
+
+
+def user_cache_dir():
+    """Return the per-user cache directory for this application."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return os.path.abspath(override)
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(
+            os.path.join('~', 'AppData', 'Local')
+        )
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(
+            os.path.join('~', '.cache')
+        )
+    return os.path.join(base, APP_NAME)
+
+
+def create_bytecode_cache(cache_dir, namespace):
+    """Create a bytecode cache, or return None if the directory is unusable.
+
+    Args:
+        cache_dir: Root cache directory (see ``user_cache_dir``)
+        namespace: Subdirectory name; environments with different options
+            must use different namespaces since their bytecode differs.
+
+    Returns:
+        FileSystemBytecodeCache or None
+    """
+    directory = os.path.join(cache_dir, 'bytecode', namespace)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(directory)
+
+
+def list_template_files(template_dir, extensions=('.template',)):
+    """Return the sorted names of template files below a directory.
+
+    Subdirectories are included, so names are relative paths with '/' as
+    separator (e.g. ``'tests/test_main.py.template'``), as Jinja2 expects.
+    The tree is walked with ``os.scandir``, which reuses the file type from
+    the directory listing instead of stat-ing every entry.
+    """
+    names = []
+    pending = [(template_dir, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name != '__pycache__':
+                    pending.append((entry.path, f"{prefix}{entry.name}/"))
+            elif entry.name.endswith(extensions) and entry.is_file():
+                names.append(prefix + entry.name)
+    return sorted(names)
+
+
+def template_tree_hash(sources, namespace):
+    """Hash the template sources together with the compiler inputs.
+
+    Args:
+        sources: Mapping of template name to source text, as already read
+            by a frozen loader, so no file is read again
+        namespace: Identifies the environment options used for compiling
+
+    Returns:
+        str: Hex digest identifying a compiled bundle
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{namespace}\0{jinja2.__version__}\0".encode("utf-8"))
+    digest.update(f"{sys.version_info[0]}.{sys.version_info[1]}\0".encode("utf-8"))
+    for name in sorted(sources):
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(sources[name].encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+def bundle_dir(cache_dir, tree_hash):
+    """Return the directory a precompiled bundle for ``tree_hash`` lives in."""
+    return os.path.join(cache_dir, 'compiled', tree_hash[:32])
+
+
+def compile_template_bundle(env, template_dir, target_dir, extensions=('.template',),
+                            names=None):
+    """Precompile every template into a directory usable by ``ModuleLoader``.
+
+    The bundle is written to a temporary sibling and renamed into place, so
+    concurrent builders and readers never see a partial bundle.
+
+    Args:
+        env: Configured Jinja2 environment (filters, options)
+        template_dir: Directory holding the templates
+        target_dir: Destination directory of the bundle
+        extensions: Template file extensions to include
+        names: Template names to compile instead of the files in
+            ``template_dir`` (e.g. including a template pack's)
+
+    Returns:
+        str: ``target_dir``
+    """
+    if os.path.isdir(target_dir):
+        return target_dir
+
+    if names is None:
+        names = list_template_files(template_dir, extensions)
+    names = set(names)
+    parent = os.path.dirname(os.path.abspath(target_dir))
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".bundle-", dir=parent)
+    try:
+        env.compile_templates(
+            staging,
+            zip=None,
+            filter_func=names.__contains__,
+            ignore_errors=False,
+        )
+        try:
+            os.rename(staging, target_dir)
+        except OSError:
+            # Another process published the same bundle first
+            if not os.path.isdir(target_dir):
+                raise
+    finally:
+        if os.path.isdir(staging):
+            shutil.rmtree(staging, ignore_errors=True)
+    logger.info(f"Precompiled templates from {template_dir} into {target_dir}")
+    return target_dir
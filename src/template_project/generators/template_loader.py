@@ -1,26 +1,149 @@
 """Jinja2-based template loader with enhanced features."""
+import hashlib
+import logging
 import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+    TemplateError,
+    meta,
+    nodes,
+)
+
+from .template_cache import (
+    bundle_dir,
+    compile_template_bundle,
+    create_bytecode_cache,
+    list_template_files,
+    template_tree_hash,
+    user_cache_dir,
+)
+from .template_packs import load_pack
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Globals whose value changes from call to call; templates using them are
+# never served from the render cache
+VOLATILE_GLOBALS = frozenset({'now'})
+
+# Rendered outputs kept by default (least recently used are dropped first)
+DEFAULT_RENDER_CACHE_SIZE = 256
+
+# Environment variable making loaders frozen by default (e.g. in production)
+FROZEN_ENV = "TEMPLATE_PROJECT_FROZEN_TEMPLATES"
+
+# Suffix of template files; the rest of a template's name is its output path
+TEMPLATE_SUFFIX = '.template'
+
+_MISSING = object()
+
+
+class TemplateRenderError(Exception):
+    """A template could not be loaded or rendered."""
+
+    def __init__(self, template, error):
+        super().__init__(f"Error rendering template {template}: {error}")
+        self.template = template
+        self.error = error
 
 
 class TemplateLoader:
     """Loads and processes template files using Jinja2."""
 
-    def __init__(self, template_dir=None):
+    # Identifies this environment's options in the on-disk template caches
+    CACHE_NAMESPACE = 'template_loader'
+
+    def __init__(self, template_dir=None, cache_dir=None, use_cache=True,
+                 precompiled_dir=None, strict=False,
+                 render_cache_size=DEFAULT_RENDER_CACHE_SIZE, frozen=None,
+                 pack=None):
+        """
+        Args:
+            template_dir: Directory holding the ``.template`` files
+            cache_dir: Root of the on-disk template caches (default: user cache dir)
+            use_cache: Use the bytecode cache and, when frozen, any
+                precompiled bundle of the current sources
+            precompiled_dir: Explicit ``ModuleLoader`` directory to load from
+                (see ``compile_bundle``), bypassing the cache lookup. Only
+                frozen loaders use bundles: a bundle is never checked for
+                edits, so a reloading loader always compiles the sources.
+            strict: Raise ``TemplateRenderError`` from ``load_template``
+                instead of logging the error and returning an empty string
+            render_cache_size: Rendered outputs to memoize, keyed on the
+                values of the variables each template actually uses; 0
+                renders every call
+            frozen: Read and compile the whole template directory once, here,
+                and never look at the files again: no reload checks, no
+                source reads per render. Edits need a new loader. By default
+                templates are reloaded when they change, unless the
+                ``TEMPLATE_PROJECT_FROZEN_TEMPLATES`` environment variable is
+                set to 1.
+            pack: Template pack (name of an installed pack, ``.zip`` path,
+                directory or ``TemplatePack``) whose templates override the
+                built-in ones; see ``template_packs``
+        """
         if template_dir is None:
             # Default to templates directory relative to this file
             template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
         self.template_dir = os.path.abspath(template_dir)
+        self.cache_dir = cache_dir or user_cache_dir()
+        self.use_cache = use_cache
+        self.strict = strict
+        if frozen is None:
+            value = os.environ.get(FROZEN_ENV, "").strip().lower()
+            frozen = value in ('1', 'true', 'yes', 'on')
+        self.frozen = frozen
+        self.pack = load_pack(pack) if pack is not None else None
+
+        if frozen:
+            # Every source is read now; renders are served from memory
+            self._frozen_sources = MappingProxyType(self._read_sources())
+            loader = self._source_loader = DictLoader(self._frozen_sources)
+        else:
+            loader = self._source_loader = self._sources_loader()
+        bytecode_cache = None
+        if use_cache:
+            # Entries are validated against each template's source checksum
+            bytecode_cache = create_bytecode_cache(self.cache_dir, self.CACHE_NAMESPACE)
+
+        # A frozen loader prefers a precompiled bundle of exactly the sources
+        # it has read, falling back to them for anything the bundle lacks.
+        # Bundles are never checked for edits, so reloading loaders skip them.
+        self.precompiled_dir = None
+        if frozen:
+            self.precompiled_dir = precompiled_dir
+            if use_cache and precompiled_dir is None:
+                candidate = self._bundle_path()
+                if os.path.isdir(candidate):
+                    self.precompiled_dir = candidate
+        elif precompiled_dir is not None:
+            logger.debug(f"Not using {precompiled_dir}: "
+                         "only frozen loaders use bundles")
+        if self.precompiled_dir and os.path.isdir(self.precompiled_dir):
+            loader = ChoiceLoader([ModuleLoader(self.precompiled_dir), loader])
 
         # Configure Jinja2 environment
         self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
+            loader=loader,
+            bytecode_cache=bytecode_cache,
             trim_blocks=True,
             lstrip_blocks=True,
-            keep_trailing_newline=True
+            keep_trailing_newline=True,
+            # Frozen: never check sources for changes, never evict a template.
+            # Otherwise keep room for the whole tree, or every project of a
+            # large tree would reload each template evicted by the previous one.
+            auto_reload=not frozen,
+            cache_size=-1 if frozen else max(400, 2 * len(self.list_templates())),
         )
 
         # Add custom filters
@@ -33,6 +156,28 @@ class TemplateLoader:
         self.env.globals['now'] = datetime.now
         self.env.globals['current_year'] = datetime.now().year
 
+        # Template name -> (source hash, uptodate callable)
+        self._source_hashes = {}
+
+        # Template name -> (source hashes of the template and everything it
+        # includes/extends, those template names, input variables or None)
+        self._template_inputs = {}
+        self.render_cache_size = render_cache_size
+        self._render_cache = OrderedDict()
+        self._render_lock = threading.Lock()
+        self.render_cache_hits = 0
+        self.render_cache_misses = 0
+
+        # Output path (with its Jinja expressions) -> compiled path template
+        self._path_templates = {}
+        # Templates of the project tree, scanned once when frozen
+        self._project_templates = None
+
+        # Template name -> compiled template, for frozen loaders
+        self._frozen_templates = MappingProxyType({})
+        if frozen:
+            self._load_frozen()
+
     def load_template(self, filename, **kwargs):
         """Load and render a template with variables.
 
@@ -41,27 +186,293 @@ class TemplateLoader:
             **kwargs: Variables to substitute in the template
 
         Returns:
-            str: Processed template content with variables substituted
+            str: Processed template content with variables substituted, or an
+            empty string if the template failed and the loader is not strict
         """
-        import logging
         try:
-            template = self.env.get_template(filename)
-            return template.render(**kwargs)
-        except Exception as e:
-            logging.error(f"Error loading template {filename}: {e}")
+            return self.render_template(filename, **kwargs)
+        except TemplateRenderError as e:
+            if self.strict:
+                raise
+            logger.error(str(e))
             return ""
 
+    def render_template(self, filename, **kwargs):
+        """Like ``load_template``, but always raises ``TemplateRenderError``.
+
+        Output is memoized on the values of the variables the template (and
+        any template it includes or extends) actually reads, so a template
+        like ``.gitignore.template`` renders once for a whole batch.
+        """
+        key = None
+        if self.render_cache_size > 0:
+            try:
+                key = self._render_key(filename, kwargs)
+            except Exception:
+                # Unhashable context values, or a template that fails to
+                # parse; the render below reports the latter
+                key = None
+        if key is not None:
+            with self._render_lock:
+                content = self._render_cache.get(key)
+                if content is not None:
+                    self._render_cache.move_to_end(key)
+                    self.render_cache_hits += 1
+                    return content
+                self.render_cache_misses += 1
+        try:
+            template = self._frozen_templates.get(filename)
+            if template is None:
+                template = self.env.get_template(filename)
+            content = template.render(**kwargs)
+        except Exception as e:
+            raise TemplateRenderError(filename, e) from e
+        if key is not None:
+            with self._render_lock:
+                self._render_cache[key] = content
+                if len(self._render_cache) > self.render_cache_size:
+                    self._render_cache.popitem(last=False)
+        return content
+
+    def template_inputs(self, filename):
+        """Return the context variables a template's output depends on.
+
+        Found by static analysis of the template and every template it
+        includes, imports or extends, and cached until one of their sources
+        changes.
+
+        Args:
+            filename: Name of the template file
+
+        Returns:
+            frozenset or None: Variable names, or None if the output cannot be
+            memoized (it calls ``now()`` or includes a computed template name)
+        """
+        return self._inputs_entry(filename)[2]
+
+    def clear_render_cache(self):
+        with self._render_lock:
+            self._render_cache.clear()
+
+    def _render_key(self, filename, kwargs):
+        digests, _, inputs = self._inputs_entry(filename)
+        if inputs is None:
+            return None
+        values = tuple(_freeze(kwargs.get(name, _MISSING)) for name in sorted(inputs))
+        return (filename, digests, values)
+
+    def _inputs_entry(self, filename):
+        cached = self._template_inputs.get(filename)
+        if cached is not None and self.frozen:
+            return cached
+        if cached is not None:
+            digests, names, inputs = cached
+            if digests == tuple(self.source_hash(name) for name in names):
+                return cached
+        names = []
+        inputs = self._analyze(filename, names)
+        entry = (tuple(self.source_hash(name) for name in names), tuple(names), inputs)
+        self._template_inputs[filename] = entry
+        return entry
+
+    def _analyze(self, filename, seen):
+        """Collect the undeclared variables of a template tree into a set."""
+        if filename in seen:
+            return frozenset()
+        seen.append(filename)
+        source = self._source_loader.get_source(self.env, filename)[0]
+        ast = self.env.parse(source)
+        # Globals are not reported as undeclared, so look for these directly
+        if any(node.name in VOLATILE_GLOBALS for node in ast.find_all(nodes.Name)):
+            return None
+        inputs = set(meta.find_undeclared_variables(ast))
+        for reference in meta.find_referenced_templates(ast):
+            if reference is None:
+                # Template name computed at render time
+                return None
+            referenced = self._analyze(reference, seen)
+            if referenced is None:
+                return None
+            inputs |= referenced
+        return frozenset(inputs)
+
+    def template_hash(self, filename):
+        """Return a hash of a template and every template it depends on.
+
+        Covers the sources of the templates it includes, imports or extends,
+        so editing a shared partial changes the hash of every template using
+        it. A template without dependencies hashes to its ``source_hash``.
+
+        Args:
+            filename: Name of the template file
+
+        Returns:
+            str: Hex digest
+        """
+        try:
+            digests, names, _ = self._inputs_entry(filename)
+        except TemplateError as e:
+            # Reported when the template is rendered
+            logger.debug(f"Could not analyse {filename}: {e}")
+            return self.source_hash(filename)
+        if len(names) == 1:
+            return digests[0]
+        combined = "\n".join(f"{name}:{digest}"
+                             for name, digest in zip(names, digests))
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+    def source_hash(self, filename):
+        """Return the SHA-256 of a template's source.
+
+        The hash is cached and only recomputed when the source file changes.
+
+        Args:
+            filename: Name of the template file
+
+        Returns:
+            str: Hex digest of the UTF-8 encoded template source
+        """
+        if self.pack is not None and filename in self.pack.files:
+            # Precomputed in the pack's index
+            return self.pack.files[filename]
+        cached = self._source_hashes.get(filename)
+        if cached is not None and (cached[1] is None or cached[1]()):
+            return cached[0]
+        # The sources, not ``self.env.loader``: a precompiled bundle has none
+        source, _, uptodate = self._source_loader.get_source(self.env, filename)
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self._source_hashes[filename] = (digest, uptodate)
+        return digest
+
+    def _load_frozen(self):
+        """Compile and analyse every template up front (frozen loaders)."""
+        templates = {}
+        for name, source in self._frozen_sources.items():
+            digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+            self._source_hashes[name] = (digest, None)
+            try:
+                templates[name] = self.env.get_template(name)
+                self._inputs_entry(name)
+            except Exception as e:
+                # Reported again when the template is rendered
+                logger.debug(f"Could not compile {name}: {e}")
+        self._frozen_templates = MappingProxyType(templates)
+
+    def compile_bundle(self, target_dir=None):
+        """Precompile all templates into a ``ModuleLoader`` directory.
+
+        Args:
+            target_dir: Destination directory; defaults to the cache entry that
+                frozen ``TemplateLoader`` instances with the same sources pick
+                up automatically.
+
+        Returns:
+            str: Path of the precompiled bundle
+        """
+        target_dir = target_dir or self._bundle_path()
+        source_env = self.env.overlay(loader=self._sources_loader())
+        return compile_template_bundle(source_env, self.template_dir, target_dir,
+                                       names=self.list_templates())
+
+    def _sources_loader(self):
+        """Loader reading the template files (and pack) directly."""
+        loader = FileSystemLoader(self.template_dir)
+        if self.pack is None:
+            return loader
+        # Pack templates override the built-in ones
+        return ChoiceLoader([self.pack.jinja_loader(), loader])
+
+    def _read_sources(self):
+        """Read every template source; pack templates override built-in ones."""
+        sources = {
+            name: _read_source(self.template_dir, name)
+            for name in list_template_files(self.template_dir)
+        }
+        if self.pack is not None:
+            sources.update(
+                (name, self.pack.read_source(name)) for name in self.pack.files
+            )
+        return sources
+
+    def _bundle_path(self):
+        """Return the cache directory for a bundle of the current sources."""
+        sources = self._frozen_sources if self.frozen else self._read_sources()
+        tree_hash = template_tree_hash(sources, self.CACHE_NAMESPACE)
+        return bundle_dir(self.cache_dir, tree_hash)
+
     def list_templates(self):
-        """List all available template files.
+        """List all available template files, including those in subdirectories.
+
+        Returns:
+            list: Sorted template names, relative to the template directory
+            with '/' as separator
+        """
+        if self.frozen:
+            return sorted(self._frozen_sources)
+        names = list_template_files(self.template_dir)
+        if self.pack is not None:
+            names = sorted(set(names) | set(self.pack.files))
+        return names
+
+    def project_templates(self):
+        """Return the templates that make up a generated project.
+
+        The template tree mirrors the generated project: every template is
+        rendered to the path given by its name (see ``render_path``), except
+        those whose first path segment starts with ``_``, which hold shared
+        includes and macros. A development loader rescans the tree on every
+        call so new templates show up; a frozen one scans it once.
 
         Returns:
-            list: List of template filenames
+            tuple: Sorted template names
         """
-        if not os.path.exists(self.template_dir):
-            return []
+        if self._project_templates is not None:
+            return self._project_templates
+        names = tuple(name for name in self.list_templates()
+                      if not name.startswith('_'))
+        if self.frozen:
+            self._project_templates = names
+        return names
 
-        return [f for f in os.listdir(self.template_dir)
-                if f.endswith('.template')]
+    def render_path(self, filename, context):
+        """Return the project path a template of the tree is rendered to.
+
+        The ``.template`` suffix is dropped and Jinja expressions in the
+        directory and file names are rendered with ``context``, so
+        ``src/{{ package_name }}/main.py.template`` becomes
+        ``src/my_app/main.py``. Each name is compiled once; names without
+        expressions are not rendered at all.
+
+        Args:
+            filename: Template name, as returned by ``project_templates``
+            context: Template variables
+
+        Returns:
+            str or None: Relative path with '/' as separator, or None if a
+            segment rendered empty (e.g. ``{% if has_icon %}...{% endif %}``),
+            in which case the file is left out of the project
+
+        Raises:
+            TemplateRenderError: If the name fails to render or renders to a
+                path outside the project
+        """
+        path = filename
+        if path.endswith(TEMPLATE_SUFFIX):
+            path = path[:-len(TEMPLATE_SUFFIX)]
+        if '{' in path:
+            try:
+                template = self._path_templates.get(path)
+                if template is None:
+                    template = self._path_templates[path] = self.env.from_string(path)
+                path = template.render(**context)
+            except Exception as e:
+                raise TemplateRenderError(filename, e) from e
+        parts = path.split('/')
+        if '' in parts:
+            return None
+        if any(part in ('.', '..') or '\\' in part or ':' in part for part in parts):
+            raise TemplateRenderError(filename, f"unsafe output path {path!r}")
+        return path
 
     def _to_snake_case(self, text):
         """Convert text to snake_case."""
@@ -99,3 +510,22 @@ class TemplateLoader:
         text = re.sub(r'[-_\s]+', ' ', text)
         # Convert to title case and remove spaces
         return ''.join(word.capitalize() for word in text.split())
+
+
+def _read_source(template_dir, name):
+    """Read a template source as ``FileSystemLoader`` would."""
+    with open(os.path.join(template_dir, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _freeze(value):
+    """Turn a context value into a hashable key; raises TypeError if it cannot."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((_freeze(k), _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(item) for item in value))
+    hash(value)
+    # The type keeps e.g. True and 1 apart, which render differently
+    return (type(value), value)
@@ -0,0 +1,284 @@
+"""Installable template packs.
+
+A template pack is a set of templates shipped separately from this package:
+
+* a Python package registered under the ``template_project.template_packs``
+  entry point group (e.g. a wheel, possibly imported straight from a zip),
+* a ``.zip`` archive, or
+* a plain directory.
+
+A pack is laid out as a template tree (see ``TemplateLoader.render_path``):
+its templates override the built-in templates of the same name and add files
+at new paths; any template the pack does not provide still comes from the
+built-in set.
+
+Every pack carries ``template-pack.json``, an index of its template names
+and their SHA-256 hashes, written by ``build_index`` (or ``template_project
+packs index DIR``). Choosing and loading a pack only reads that index: the
+archive is neither unpacked nor scanned, and a template's source is read
+only when it is compiled. Sources are read through ``importlib.resources``
+for installed packages and ``zipfile.Path`` for archives.
+
+Entry point example (``pyproject.toml`` of a pack)::
+
+    [project.entry-points."template_project.template_packs"]
+    acme = "acme_templates"
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from jinja2 import BaseLoader, TemplateNotFound
+
+from .template_cache import list_template_files
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "template_project.template_packs"
+INDEX_FILENAME = "template-pack.json"
+INDEX_VERSION = 1
+
+# Loaded packs by spec; indexes are read once per process
+_packs = {}
+_packs_lock = threading.Lock()
+
+
+class TemplatePack:
+    """Templates and their index, read from a directory, archive or package."""
+
+    def __init__(self, name, root, index, location, spec=None):
+        """
+        Args:
+            name: Name of the pack
+            root: ``importlib.resources`` traversable (``pathlib.Path``,
+                ``zipfile.Path``, ...) the template names are relative to
+            index: Parsed ``template-pack.json``
+            location: Human-readable origin, used in messages
+            spec: What ``load_pack`` needs to load the pack again (default:
+                ``name``, as for installed packs)
+        """
+        self.name = name
+        self.root = root
+        self.location = location
+        self.spec = spec or name
+        self.version = str(index.get('version', ''))
+        self.description = index.get('description', '')
+        # Template name -> SHA-256 of its source
+        self.files = dict(index.get('files', {}))
+        self.tree_hash = index.get('tree_hash') or tree_hash(self.files)
+
+    @classmethod
+    def from_directory(cls, path):
+        """Open a pack directory, indexing it on the fly if it has no index yet."""
+        import pathlib
+
+        root = pathlib.Path(path)
+        index_path = root / INDEX_FILENAME
+        if index_path.is_file():
+            index = _parse_index(index_path.read_bytes(), path)
+        else:
+            logger.debug(f"{path} has no {INDEX_FILENAME}; indexing it now")
+            index = make_index(path)
+        location = os.path.abspath(path)
+        return cls(index.get('name') or root.name, root, index, location,
+                   spec=location)
+
+    @classmethod
+    def from_zip(cls, path):
+        """Open a ``.zip`` pack or a pack's wheel.
+
+        The index is expected at the top of the archive or, as in a wheel, in
+        a top-level package directory. Templates are read from the archive on
+        demand.
+        """
+        import zipfile
+
+        root = zipfile.Path(path)
+        if not root.joinpath(INDEX_FILENAME).is_file():
+            # Only the archive's directory listing is consulted
+            root = next((child for child in root.iterdir() if child.is_dir()
+                         and child.joinpath(INDEX_FILENAME).is_file()), root)
+        index = _read_index(root, path)
+        name = index.get('name') or os.path.splitext(os.path.basename(path))[0]
+        location = os.path.abspath(path)
+        return cls(name, root, index, location, spec=location)
+
+    @classmethod
+    def from_package(cls, package, name=None):
+        """Open a pack shipped as a Python package (module or dotted name)."""
+        from importlib import resources
+
+        root = resources.files(package)
+        package_name = package if isinstance(package, str) else package.__name__
+        index = _read_index(root, package_name)
+        return cls(name or index.get('name') or package_name, root, index,
+                   f"package {package_name}")
+
+    def read_source(self, name):
+        """Return a template's source."""
+        if name not in self.files:
+            raise TemplateNotFound(name)
+        return self._resource(name).read_bytes().decode("utf-8")
+
+    def verify(self):
+        """Return the names whose content no longer matches the index."""
+        return sorted(
+            name for name, digest in self.files.items()
+            if hashlib.sha256(self._resource(name).read_bytes()).hexdigest() != digest
+        )
+
+    def jinja_loader(self):
+        return PackLoader(self)
+
+    def _resource(self, name):
+        resource = self.root
+        for part in name.split('/'):
+            resource = resource.joinpath(part)
+        return resource
+
+    def __repr__(self):
+        return f"TemplatePack({self.name!r}, {self.location!r})"
+
+
+class PackLoader(BaseLoader):
+    """Jinja2 loader serving the templates of a ``TemplatePack``.
+
+    Packs are treated as immutable: a loaded template is never checked for
+    changes.
+    """
+
+    def __init__(self, pack):
+        self.pack = pack
+
+    def get_source(self, environment, template):
+        return self.pack.read_source(template), None, lambda: True
+
+    def list_templates(self):
+        return sorted(self.pack.files)
+
+
+def tree_hash(files):
+    """Hash a pack's name -> hash mapping into one digest."""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(f"{name}\0{files[name]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def make_index(directory, name=None, version=None, description=None,
+               extensions=('.template',)):
+    """Scan a pack directory and return its index (without writing it).
+
+    Args:
+        directory: Pack directory; templates may be in subdirectories
+        name: Pack name (default: the directory name)
+        version: Pack version
+        description: Short description
+        extensions: Template file extensions to index
+    """
+    files = {}
+    for template in list_template_files(directory, extensions):
+        with open(os.path.join(directory, *template.split('/')), "rb") as f:
+            files[template] = hashlib.sha256(f.read()).hexdigest()
+    return {
+        'index_version': INDEX_VERSION,
+        'name': name or os.path.basename(os.path.abspath(directory)),
+        'version': version or "",
+        'description': description or "",
+        'tree_hash': tree_hash(files),
+        'files': files,
+    }
+
+
+def build_index(directory, name=None, version=None, description=None):
+    """Write ``template-pack.json`` into a pack directory.
+
+    Run this before zipping or packaging a pack, and again after editing it.
+
+    Returns:
+        dict: The index written
+    """
+    index_path = os.path.join(directory, INDEX_FILENAME)
+    previous = {}
+    if os.path.isfile(index_path):
+        with open(index_path, "rb") as f:
+            previous = _parse_index(f.read(), index_path)
+    index = make_index(
+        directory,
+        name=name or previous.get('name'),
+        version=version or previous.get('version'),
+        description=description or previous.get('description'),
+    )
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return index
+
+
+def installed_packs():
+    """Return the installed packs as a dict of name -> entry point.
+
+    Only package metadata is read; no pack is imported.
+    """
+    from importlib.metadata import entry_points
+
+    try:
+        points = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        points = entry_points().get(ENTRY_POINT_GROUP, [])
+    return {point.name: point for point in points}
+
+
+def load_pack(spec):
+    """Return the ``TemplatePack`` for a pack name, ``.zip`` file or directory.
+
+    Installed pack names are looked up first. Packs are cached per process,
+    so loading the same pack again costs nothing.
+
+    Raises:
+        ValueError: If no such pack exists or it has no valid index
+    """
+    if isinstance(spec, TemplatePack):
+        return spec
+    with _packs_lock:
+        pack = _packs.get(spec)
+        if pack is None:
+            pack = _packs[spec] = _load(spec)
+        return pack
+
+
+def _load(spec):
+    if os.path.isdir(spec):
+        return TemplatePack.from_directory(spec)
+    if os.path.isfile(spec):
+        if not spec.lower().endswith((".zip", ".whl")):
+            raise ValueError(f"Unsupported template pack file: {spec} (use a .zip)")
+        return TemplatePack.from_zip(spec)
+    point = installed_packs().get(spec)
+    if point is None:
+        raise ValueError(f"No such template pack: {spec}")
+    return TemplatePack.from_package(point.load(), name=point.name)
+
+
+def _read_index(root, location):
+    index = root.joinpath(INDEX_FILENAME)
+    if not index.is_file():
+        raise ValueError(f"Template pack {location} has no {INDEX_FILENAME}; "
+                         f"create it with `template_project packs index`")
+    return _parse_index(index.read_bytes(), location)
+
+
+def _parse_index(data, location):
+    try:
+        index = json.loads(data.decode("utf-8"))
+    except ValueError as e:
+        raise ValueError(f"Invalid {INDEX_FILENAME} in {location}: {e}") from e
+    if not isinstance(index, dict) or not isinstance(index.get('files'), dict):
+        raise ValueError(f"Invalid {INDEX_FILENAME} in {location}: no 'files' mapping")
+    if index.get('index_version', INDEX_VERSION) > INDEX_VERSION:
+        raise ValueError(f"{location} needs a newer template_project "
+                         f"(index version {index['index_version']})")
+    return index
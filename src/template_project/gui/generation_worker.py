@@ -0,0 +1,144 @@
+"""Background project generation for the GUI.
+
+Tk is single threaded, so ``GenerationWorker`` runs generations on its own
+thread and only talks to the UI through a queue of events that the UI
+polls with ``after()``. Jobs submitted while one is running wait in line
+and run one after another.
+
+Events are ``(kind, job, payload)`` tuples:
+
+* ``('started', job, None)``
+* ``('progress', job, event)`` - a generation progress event (phase,
+  rendered file, warning; see ``create_project_structure(on_event=...)``)
+* ``('finished', job, None)``
+* ``('failed', job, exception)``
+* ``('cancelled', job, None)``
+"""
+import logging
+import queue
+import threading
+
+from ..generators import GenerationCancelled, ProjectGenerator
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+class GenerationJob:
+    """One queued call of ``create_project_structure``."""
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.project_name = kwargs.get('project_name')
+        self.project_dir = kwargs.get('project_dir')
+        self.cancel_event = threading.Event()
+        # Messages of the warning events reported while generating
+        self.warnings = []
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+class GenerationWorker:
+    """Runs queued generations on a background thread."""
+
+    def __init__(self, generator=None):
+        """
+        Args:
+            generator: ``ProjectGenerator`` to use; by default a concurrent,
+                strict one, so a broken template fails the job
+        """
+        if generator is None:
+            generator = ProjectGenerator(concurrent=True, strict=True)
+        self.generator = generator
+        self.events = queue.Queue()
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = []
+        self._current = None
+        self._thread = None
+
+    def submit(self, **kwargs):
+        """Queue a generation; returns its ``GenerationJob``."""
+        job = GenerationJob(kwargs)
+        with self._lock:
+            self._pending.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="generation-worker", daemon=True
+                )
+                self._thread.start()
+        self._jobs.put(job)
+        return job
+
+    @property
+    def current(self):
+        """The job being generated right now, or None."""
+        return self._current
+
+    @property
+    def pending(self):
+        """Jobs waiting for their turn."""
+        with self._lock:
+            return list(self._pending)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._current is not None or bool(self._pending)
+
+    def cancel_all(self):
+        """Cancel the running job and every queued one."""
+        with self._lock:
+            jobs = list(self._pending)
+            if self._current is not None:
+                jobs.append(self._current)
+        for job in jobs:
+            job.cancel()
+
+    def shutdown(self, wait=True):
+        """Cancel everything and stop the worker thread."""
+        self.cancel_all()
+        self._jobs.put(None)
+        if wait and self._thread is not None:
+            self._thread.join()
+        self.generator.close()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            with self._lock:
+                self._pending.remove(job)
+                self._current = job
+            try:
+                if job.cancelled:
+                    self.events.put(('cancelled', job, None))
+                    continue
+                self.events.put(('started', job, None))
+                self.generator.create_project_structure(
+                    cancel=job.cancel_event,
+                    on_event=lambda event, job=job: self._on_event(job, event),
+                    **job.kwargs
+                )
+            except GenerationCancelled:
+                logger.info(f"Generation of {job.project_name} cancelled")
+                self.events.put(('cancelled', job, None))
+            except Exception as e:
+                logger.error(f"Generation of {job.project_name} failed: {e}")
+                self.events.put(('failed', job, e))
+            else:
+                self.events.put(('finished', job, None))
+            finally:
+                with self._lock:
+                    self._current = None
+
+    def _on_event(self, job, event):
+        if event['kind'] == 'warning':
+            job.warnings.append(f"{event['name']}: {event['message']}")
+        self.events.put(('progress', job, event))
@@ -1,4 +1,6 @@
+import logging
 import os
+import queue
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
@@ -6,6 +8,10 @@ import ttkbootstrap as ttkb
 
 from ..generators import ProjectGenerator
 from ..utils import ConfigManager
+from .generation_worker import GenerationWorker
+
+# Configure module logger
+logger = logging.getLogger(__name__)
 
 
 class HomeTab(ttkb.Frame):
@@ -17,8 +23,9 @@ class HomeTab(ttkb.Frame):
     def __init__(self, parent, settings, config_manager=None):
         super().__init__(parent)
         self.settings = settings
-        self.project_generator = ProjectGenerator()
-        self.config_manager = config_manager or ConfigManager()
+        self.worker = GenerationWorker()
+        self._polling = False
+        self.config_manager = config_manager or ConfigManager.shared()
         self._loading_config = False
         self.create_widgets()
         self.load_config()
@@ -42,6 +49,23 @@ class HomeTab(ttkb.Frame):
         self.container = ttkb.Frame(self)
         self.container.place(relx=0.5, rely=0.5, anchor="center")
 
+        # Saved profiles (author, Python version, output dir, icon presets)
+        profile_frame = ttkb.Frame(self.container)
+        profile_frame.pack(fill="x", pady=(10, 0))
+        ttkb.Label(profile_frame, text="Profile:",
+                   font=("Helvetica", 12)).pack(side="left")
+        self.profile_var = tk.StringVar()
+        self.profile_combo = ttkb.Combobox(
+            profile_frame, textvariable=self.profile_var, font=("Helvetica", 11),
+            postcommand=self.refresh_profiles
+        )
+        self.profile_combo.pack(side="left", fill="x", expand=True, padx=(10, 0))
+        self.profile_combo.bind("<<ComboboxSelected>>", lambda e: self.load_profile())
+        ttkb.Button(profile_frame, text="Save", command=self.save_profile).pack(
+            side="left", padx=(10, 0))
+        ttkb.Button(profile_frame, text="Delete", command=self.delete_profile).pack(
+            side="left", padx=(5, 0))
+
         # Project Name
         name_frame = ttkb.Frame(self.container)
         name_frame.pack(fill="x", pady=(10, 5))
@@ -149,6 +173,15 @@ class HomeTab(ttkb.Frame):
         )
         generate_btn.pack(pady=(20, 10))
 
+        # Progress of the running generation; more projects can be queued meanwhile
+        progress_frame = ttkb.Frame(self.container)
+        progress_frame.pack(fill="x")
+        self.progress = ttkb.Progressbar(progress_frame, mode="determinate", maximum=1)
+        self.progress.pack(side="left", fill="x", expand=True)
+        self.cancel_btn = ttkb.Button(progress_frame, text="Cancel",
+                                      command=self.cancel_generation, state="disabled")
+        self.cancel_btn.pack(side="left", padx=(10, 0))
+
         # Status
         self.status_var = tk.StringVar(value=f"Ready to generate Python {self.python_version_var.get()} project")
         status_label = ttkb.Label(self.container, textvariable=self.status_var, font=("Helvetica", 10))
@@ -159,6 +192,62 @@ class HomeTab(ttkb.Frame):
             self.status_var.set(f"Ready to generate Python {self.python_version_var.get()} project")
         self.python_version_var.trace_add("write", update_status_text)
 
+    def refresh_profiles(self):
+        """Fill the profile dropdown with the saved profile names."""
+        try:
+            self.profile_combo.configure(values=self.config_manager.profiles.list_profiles())
+        except Exception as e:
+            logger.warning(f"Could not list profiles: {e}")
+
+    def load_profile(self):
+        """Apply the selected profile to the form."""
+        name = self.profile_var.get().strip()
+        if not name:
+            return
+        try:
+            fields = self.config_manager.apply_profile(name)
+        except KeyError:
+            messagebox.showerror("Error", f"No profile named '{name}'")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load profile: {str(e)}")
+            return
+        self.load_config()
+        if fields.get("theme"):
+            self.settings["theme"] = fields["theme"]
+            self.winfo_toplevel().style.theme_use(fields["theme"])
+        self.status_var.set(f"Loaded profile '{name}'")
+
+    def save_profile(self):
+        """Save the current author, Python version, output dir and icon as a profile."""
+        name = self.profile_var.get().strip()
+        if not name:
+            messagebox.showerror("Error", "Enter a profile name first")
+            return
+        if name in self.config_manager.profiles.list_profiles():
+            if not messagebox.askyesno("Profile Exists",
+                                       f"Profile '{name}' already exists. Replace it?"):
+                return
+        try:
+            self.save_config()
+            self.config_manager.save_profile(name)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save profile: {str(e)}")
+            return
+        self.refresh_profiles()
+        self.status_var.set(f"Saved profile '{name}'")
+
+    def delete_profile(self):
+        """Delete the selected profile."""
+        name = self.profile_var.get().strip()
+        if not name or not messagebox.askyesno("Delete Profile",
+                                               f"Delete profile '{name}'?"):
+            return
+        self.config_manager.profiles.delete_profile(name)
+        self.profile_var.set("")
+        self.refresh_profiles()
+        self.status_var.set(f"Deleted profile '{name}'")
+
     def browse_directory(self):
         directory = filedialog.askdirectory()
         if directory:
@@ -234,42 +323,116 @@ class HomeTab(ttkb.Frame):
         # Use sanitized name for the top-level project directory
         sanitized_name = ProjectGenerator.sanitize_project_name(project_name)
         project_dir = os.path.join(output_dir, sanitized_name)
+        queued = [job.project_dir for job in self.worker.pending]
+        if self.worker.current is not None:
+            queued.append(self.worker.current.project_dir)
+        if project_dir in queued:
+            messagebox.showerror("Error",
+                                 f"'{sanitized_name}' is already being generated")
+            return
+        overwrite = False
         if os.path.exists(project_dir):
             if not messagebox.askyesno("Directory Exists",
                                      f"Directory '{sanitized_name}' already exists. Overwrite?"):
                 return
+            overwrite = True
 
-        try:
-            self.status_var.set("Generating project...")
-            self.update()
-
-            # Use the modular project generator
-            author_info = {
-                "name": author_name,
-                "github": github,
-                "email": email,
-                "website": website,
-            }
-            self.project_generator.create_project_structure(
-                project_dir=project_dir,
-                project_name=project_name,
-                project_desc=project_desc,
-                icon_path=icon_path,
-                author_info=author_info,
-                python_version=python_version,
-                git_init=self.settings.get("git_init", True)
-            )
-
-            self.status_var.set(f"Project '{project_name}' created successfully!")
-            messagebox.showinfo("Success", f"Project created at:\n{project_dir}")
+        author_info = {
+            "name": author_name,
+            "github": github,
+            "email": email,
+            "website": website,
+        }
+        # Generation runs on the worker thread; progress comes back as events
+        self.worker.submit(
+            project_dir=project_dir,
+            project_name=project_name,
+            project_desc=project_desc,
+            icon_path=icon_path,
+            author_info=author_info,
+            python_version=python_version,
+            git_init=self.settings.get("git_init", True),
+            staged=True,
+            overwrite=overwrite
+        )
+        self.cancel_btn.configure(state="normal")
+        self._update_queue_status()
+        if not self._polling:
+            self._polling = True
+            self.after(100, self._poll_worker)
+
+    def cancel_generation(self):
+        """Cancel the running generation and drop queued ones."""
+        self.worker.cancel_all()
+        self.status_var.set("Cancelling...")
+
+    def shutdown(self):
+        """Stop the worker; a cancelled staged generation leaves nothing behind."""
+        self.worker.shutdown()
+
+    def _update_queue_status(self):
+        current = self.worker.current
+        waiting = len(self.worker.pending)
+        if current is None and not waiting:
+            return
+        name = current.project_name if current is not None else "project"
+        queued = f" ({waiting} queued)" if waiting else ""
+        self.status_var.set(f"Generating '{name}'...{queued}")
 
-        except Exception as e:
-            self.status_var.set("Error occurred during project generation")
-            messagebox.showerror("Error", f"Failed to create project: {str(e)}")
+    def _poll_worker(self):
+        """Apply worker events to the progress bar and status (Tk thread only)."""
+        while True:
+            try:
+                kind, job, payload = self.worker.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'started':
+                self.progress.configure(value=0, maximum=1)
+                self._update_queue_status()
+            elif kind == 'progress':
+                self._on_progress(job, payload)
+            elif kind == 'finished':
+                self.progress.configure(value=self.progress.cget("maximum"))
+                self.status_var.set(
+                    f"Project '{job.project_name}' created successfully!"
+                )
+                if job.warnings:
+                    messagebox.showwarning(
+                        "Warnings", f"Project created at:\n{job.project_dir}\n\n"
+                        + "\n".join(job.warnings))
+                elif not self.worker.busy:
+                    messagebox.showinfo("Success",
+                                        f"Project created at:\n{job.project_dir}")
+            elif kind == 'failed':
+                self.status_var.set("Error occurred during project generation")
+                messagebox.showerror("Error",
+                                     f"Failed to create project: {str(payload)}")
+            elif kind == 'cancelled':
+                self.progress.configure(value=0)
+                self.status_var.set(f"Generation of '{job.project_name}' cancelled")
+
+        if self.worker.busy or not self.worker.events.empty():
+            self.after(100, self._poll_worker)
+        else:
+            self._polling = False
+            self.cancel_btn.configure(state="disabled")
+
+    # Phases counted as one progress step each, after the per-file steps
+    PROGRESS_PHASES = ("write", "publish", "git_commit")
+
+    def _on_progress(self, job, event):
+        kind, name = event['kind'], event['name']
+        if kind == 'phase' and name == 'plan':
+            steps = event.get('files', 0) + 2
+            if job.kwargs.get('git_init'):
+                steps += 1
+            self.progress.configure(value=0, maximum=steps)
+        elif kind == 'file' or (kind == 'phase' and name in self.PROGRESS_PHASES):
+            self.progress.step(1)
 
     def load_config(self):
         """Load configuration and set UI values"""
-        print("[DEBUG] HomeTab.load_config called")
+        logger.debug("HomeTab.load_config called")
         self._loading_config = True
         # Remove traces to prevent save_config during set
         traces = []
@@ -288,7 +451,7 @@ class HomeTab(ttkb.Frame):
                     var.trace_remove('write', t[1])
         try:
             config = self.config_manager.load_config()
-            print(f"[DEBUG] Loaded config: {config}")
+            logger.debug(f"Loaded config: {config}")
             var_dict = {
                 'project_name': self.project_name_var,
                 'project_desc': self.project_desc_var,
@@ -326,7 +489,7 @@ class HomeTab(ttkb.Frame):
     def save_config(self):
         """Save current configuration"""
         if self._loading_config:
-            print("[DEBUG] save_config called while loading config, skipping.")
+            logger.debug("save_config called while loading config, skipping.")
             return
 
         var_dict = {
@@ -346,5 +509,5 @@ class HomeTab(ttkb.Frame):
         config['python_version'] = self.python_version_var.get()
         if self.settings.get('theme'):
             config['theme'] = self.settings['theme']
-        print(f"[DEBUG] Saving config: {config}")
+        logger.debug(f"Saving config: {config}")
         self.config_manager.save_config(config)
@@ -8,7 +8,7 @@ from .utils import ConfigManager
 class MainApplication(ttkb.Window):
     def __init__(self, title, size):
         # Load config first
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.shared()
         self.settings = self.config_manager.load_config()
 
         # Set a larger default window size and minimum size
@@ -48,8 +48,10 @@ class MainApplication(ttkb.Window):
 
     def on_closing(self):
         """Handle window closing event."""
-        # Don't save settings here - HomeTab already handles config saving
-        # self.config_manager.save_config(self.settings)
+        # Cancel running generations; staged output is cleaned up
+        self.home_frame.shutdown()
+        # HomeTab saves as the user types; write out anything still pending
+        self.config_manager.close()
         self.destroy()
 
 if __name__ == "__main__":
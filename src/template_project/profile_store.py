@@ -0,0 +1,200 @@
+"""SQLite-backed store of named generation profiles (presets).
+
+A profile holds the fields that stay the same across many projects of one
+product line: author info, Python version, theme, output directory and
+icon. Profiles are looked up by their unique name or by tag, both through
+indexes, so loading one stays instant with thousands stored.
+
+The database runs in WAL mode with a busy timeout and every write is a
+single ``BEGIN IMMEDIATE`` transaction, so the GUI and batch jobs can read
+and write the same file at the same time.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Default database, next to config.json in the working directory
+DEFAULT_DB = "profiles.db"
+PROFILES_DB_ENV = "TEMPLATE_PROJECT_PROFILES_DB"
+
+# Fields a profile stores; everything else is project specific
+PROFILE_FIELDS = (
+    "author_name", "email", "github", "website",
+    "python_version", "theme", "mode", "output_dir", "icon_path", "git_init",
+)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_tags (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (profile_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_tags_by_tag ON profile_tags(tag, profile_id);
+"""
+
+
+def default_db_path():
+    """Return the profile database path (``$TEMPLATE_PROJECT_PROFILES_DB``)."""
+    return os.path.abspath(os.environ.get(PROFILES_DB_ENV) or DEFAULT_DB)
+
+
+class ProfileStore:
+    """Named presets of generation fields, stored in SQLite."""
+
+    def __init__(self, db_path=None, timeout=10.0):
+        """
+        Args:
+            db_path: Database file (default: ``default_db_path()``)
+            timeout: Seconds to wait for another writer's lock
+        """
+        self.db_path = db_path or default_db_path()
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def _connect(self):
+        """Return this thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout,
+                               isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _write(self, func, *args):
+        """Run ``func(conn, *args)`` in one write transaction."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn, *args)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    def save_profile(self, name, data, tags=None):
+        """Create or replace a profile.
+
+        Args:
+            name: Unique profile name
+            data: Mapping of fields; only ``PROFILE_FIELDS`` are kept
+            tags: Tags to file the profile under; None keeps existing tags
+
+        Returns:
+            dict: The stored fields
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError("Profile name cannot be empty")
+        fields = {key: data[key] for key in PROFILE_FIELDS if key in data}
+        self._write(self._save, name, fields, tags)
+        logger.debug(f"Saved profile {name!r}")
+        return fields
+
+    @staticmethod
+    def _save(conn, name, fields, tags):
+        now = time.time()
+        conn.execute(
+            "INSERT INTO profiles (name, data, created, updated) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE "
+            "SET data = excluded.data, updated = excluded.updated",
+            (name, json.dumps(fields, sort_keys=True), now, now)
+        )
+        if tags is None:
+            return
+        profile_id = conn.execute(
+            "SELECT id FROM profiles WHERE name = ?", (name,)
+        ).fetchone()[0]
+        conn.execute("DELETE FROM profile_tags WHERE profile_id = ?", (profile_id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO profile_tags (profile_id, tag) VALUES (?, ?)",
+            [(profile_id, tag.strip()) for tag in tags if tag.strip()]
+        )
+
+    def get_profile(self, name):
+        """Return a profile's fields, or None if there is no such profile."""
+        row = self._connect().execute(
+            "SELECT data FROM profiles WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete_profile(self, name):
+        """Delete a profile; returns whether it existed."""
+        return self._write(
+            lambda conn: conn.execute("DELETE FROM profiles WHERE name = ?",
+                                      (name,)).rowcount > 0
+        )
+
+    def list_profiles(self, tag=None):
+        """Return profile names in alphabetical order, optionally by tag."""
+        conn = self._connect()
+        if tag is None:
+            rows = conn.execute("SELECT name FROM profiles ORDER BY name")
+        else:
+            rows = conn.execute(
+                "SELECT p.name FROM profile_tags t "
+                "JOIN profiles p ON p.id = t.profile_id "
+                "WHERE t.tag = ? ORDER BY p.name", (tag,)
+            )
+        return [row[0] for row in rows]
+
+    def get_tags(self, name):
+        """Return the tags of a profile."""
+        rows = self._connect().execute(
+            "SELECT t.tag FROM profile_tags t JOIN profiles p ON p.id = t.profile_id "
+            "WHERE p.name = ? ORDER BY t.tag", (name,)
+        )
+        return [row[0] for row in rows]
+
+    def list_tags(self):
+        """Return every tag in use."""
+        rows = self._connect().execute(
+            "SELECT DISTINCT tag FROM profile_tags ORDER BY tag"
+        )
+        return [row[0] for row in rows]
+
+    def close(self):
+        """Close the connections of every thread."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # Opened by another thread; closed when that thread ends
+                    pass
+            self._connections = []
+        self._local = threading.local()
@@ -0,0 +1,540 @@
+"""Long-lived local generation service.
+
+Every ``python -m template_project generate`` pays interpreter startup, the
+Jinja2 import and template compilation. ``GenerationServer`` keeps one warm
+``ProjectGenerator`` in memory and serves generations over plain HTTP/1.1 on
+a localhost port or a Unix socket:
+
+* ``POST /generate`` - the body is a project spec as JSON, with the
+  documented fields of a batch manifest entry (``SPEC_FIELDS``); any other
+  field is rejected. The project is streamed back as a ``.tar.gz``
+  (``?format=zip`` for a zip archive). With ``?format=dir`` it is written
+  below the server's ``output_root`` instead and a JSON summary is returned.
+  An ``icon_path`` must point to a file inside the ``output_root``.
+* ``GET /health`` - liveness check
+* ``GET /stats`` - request counters, queue depth and render cache statistics
+
+At most ``max_concurrent`` generations run at a time on a thread pool, up to
+``max_queue`` more wait for a slot and any further request is answered with
+``503 Service Unavailable``. Only the standard library is used.
+"""
+import asyncio
+import io
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from .generators.batch_generator import AUTHOR_FIELDS, BatchGenerator
+from .generators.outputs import MemoryOutput, TarOutput, ZipOutput
+from .generators.project_generator import ProjectGenerator
+from .generators.project_plan import GenerationCancelled
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+# Largest accepted request body (a project spec)
+MAX_BODY_SIZE = 1024 * 1024
+# Archive bytes are sent to the client in chunks of about this size
+CHUNK_SIZE = 64 * 1024
+
+# format -> (output sink, content type, file extension)
+ARCHIVE_FORMATS = {
+    'tar.gz': (TarOutput, 'application/gzip', '.tar.gz'),
+    'zip': (ZipOutput, 'application/zip', '.zip'),
+}
+
+# Fields a client may send: the project fields of a batch manifest entry.
+# Anything else (executor, trace, staged, ...) would reach the generator.
+SPEC_FIELDS = frozenset({
+    'project_name', 'project_desc', 'output_dir', 'project_dir', 'icon_path',
+    'python_version', 'git_init', 'author_info', *AUTHOR_FIELDS,
+})
+
+REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    403: 'Forbidden',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    409: 'Conflict',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+# Marks the end of an archive stream
+_DONE = object()
+
+
+class HTTPError(Exception):
+    """A request that is answered with an error status and a JSON message."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _ChunkStream(io.RawIOBase):
+    """Write-only file handing archive bytes from a worker thread to the loop.
+
+    Writes are buffered and only passed on after ``start()``, which is called
+    once every file has rendered, so a failing template still gets a proper
+    error response. The bounded queue makes the worker wait for slow clients.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=8)
+        self._buffer = bytearray()
+        self._started = False
+        self._aborted = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        if self._started and len(self._buffer) >= CHUNK_SIZE:
+            self._push()
+        return len(data)
+
+    def start(self):
+        self._started = True
+
+    def finish(self):
+        """Pass on the remaining bytes after the archive was closed."""
+        if self._buffer:
+            self._push()
+
+    def done(self):
+        self._put(_DONE)
+
+    def abort(self):
+        """Called on the loop when the client is gone; never blocks the worker again."""
+        self._aborted = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def _push(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        self._put(data)
+
+    def _put(self, item):
+        if not self._aborted:
+            asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop).result()
+
+
+class GenerationServer:
+    """Serves project generations from one warm ``ProjectGenerator``."""
+
+    def __init__(self, generator=None, max_concurrent=2, max_queue=16,
+                 output_root=None, defaults=None, warm=True, template_pack=None):
+        """
+        Args:
+            generator: ``ProjectGenerator`` to use; by default a strict one
+                with frozen templates and the fast-import git backend, closed
+                with the server
+            max_concurrent: Generations running at the same time
+            max_queue: Requests allowed to wait for a free slot
+            output_root: Directory ``format=dir`` requests write below;
+                directory output is refused without one
+            defaults: Values applied to every spec unless it overrides them
+            warm: Render one throwaway project on start so the first request
+                finds every template compiled and cached
+            template_pack: Template pack of the default generator
+        """
+        self._owns_generator = generator is None
+        if generator is None:
+            generator = ProjectGenerator(strict=True, git_backend='fast-import',
+                                         frozen_templates=True,
+                                         template_pack=template_pack)
+        self.generator = generator
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.output_root = os.path.abspath(output_root) if output_root else None
+        self.warm = warm
+        self._specs = BatchGenerator(output_dir=self.output_root or os.getcwd(),
+                                     defaults=defaults)
+        self.address = None
+        self.counters = {'requests': 0, 'generated': 0, 'failed': 0,
+                         'cancelled': 0, 'rejected': 0}
+        self._generation_seconds = 0.0
+        self._active = 0
+        self._waiting = 0
+        self._cancels = set()
+        self._started = time.monotonic()
+        self._loop = None
+        self._server = None
+        self._semaphore = None
+        self._executor = None
+        self._unix_socket = None
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, unix_socket=None):
+        """Warm up and start listening.
+
+        Args:
+            host: Interface to bind; keep the default to stay local
+            port: TCP port, 0 for any free port (see ``address``)
+            unix_socket: Listen on this Unix socket path instead of TCP
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent,
+                                            thread_name_prefix="generation-server")
+        if self.warm:
+            start = time.perf_counter()
+            await self._loop.run_in_executor(self._executor, self._warm_up)
+            logger.info(f"Templates warmed up in {time.perf_counter() - start:.2f}s")
+        if unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle,
+                                                           path=unix_socket)
+            self._unix_socket = unix_socket
+            self.address = unix_socket
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        self._started = time.monotonic()
+        logger.info(f"Generation server listening on {self.address}")
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening, cancel running generations and release resources."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for cancel in list(self._cancels):
+            cancel.set()
+        if self._executor is not None:
+            await self._loop.run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+        if self._owns_generator:
+            self.generator.close()
+        if self._unix_socket and os.path.exists(self._unix_socket):
+            os.unlink(self._unix_socket)
+
+    def stats(self):
+        """Return the service statistics reported by ``GET /stats``."""
+        finished = self.counters['generated'] + self.counters['failed']
+        loader = self.generator.template_loader
+        return {
+            **self.counters,
+            'active': self._active,
+            'queued': self._waiting,
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'uptime': time.monotonic() - self._started,
+            'generation_seconds': self._generation_seconds,
+            'average_seconds': self._generation_seconds / finished if finished else 0.0,
+            'render_cache': {
+                'hits': getattr(loader, 'render_cache_hits', 0),
+                'misses': getattr(loader, 'render_cache_misses', 0),
+            },
+        }
+
+    def _warm_up(self):
+        self.generator.generate_to(MemoryOutput(), "Warm Up", "")
+
+    async def _handle(self, reader, writer):
+        """Serve one request per connection."""
+        try:
+            try:
+                request = await self._read_request(reader)
+                if request is not None:
+                    self.counters['requests'] += 1
+                    await self._dispatch(writer, *request)
+            except HTTPError as e:
+                await self._send_json(writer, e.status, {'error': e.message},
+                                      [('Retry-After', 1)] if e.status == 503 else [])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.error(f"Request failed: {type(e).__name__}: {e}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader):
+        """Return ``(method, target, body)``, or None if the client sent nothing."""
+        line = await reader.readline()
+        if not line:
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise HTTPError(400, "Malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length") from None
+        if length > MAX_BODY_SIZE:
+            raise HTTPError(413, f"Request body larger than {MAX_BODY_SIZE} bytes")
+        body = await reader.readexactly(length) if length > 0 else b''
+        return parts[0].upper(), parts[1], body
+
+    async def _dispatch(self, writer, method, target, body):
+        url = urlsplit(target)
+        routes = {'/health': 'GET', '/stats': 'GET', '/generate': 'POST'}
+        if url.path not in routes:
+            raise HTTPError(404, f"No such endpoint: {url.path}")
+        if method != routes[url.path]:
+            raise HTTPError(405, f"{url.path} only accepts {routes[url.path]}")
+        if url.path == '/health':
+            await self._send_json(writer, 200, {
+                'status': 'ok', 'uptime': time.monotonic() - self._started,
+            })
+        elif url.path == '/stats':
+            await self._send_json(writer, 200, self.stats())
+        else:
+            output_format = parse_qs(url.query).get('format', ['tar.gz'])[-1]
+            try:
+                spec = json.loads(body or b'null')
+            except ValueError as e:
+                raise HTTPError(400, f"Invalid JSON: {e}") from None
+            kwargs = self._normalize(spec, output_format)
+            if output_format == 'dir':
+                await self._generate_directory(writer, kwargs)
+            else:
+                await self._stream_archive(writer, kwargs, output_format)
+
+    def _normalize(self, spec, output_format):
+        """Turn a request spec into generator arguments for ``output_format``."""
+        if not isinstance(spec, dict):
+            raise HTTPError(400, "Project spec must be a JSON object")
+        if output_format != 'dir' and output_format not in ARCHIVE_FORMATS:
+            raise HTTPError(400, f"Unknown format: {output_format!r} "
+                                 f"(use {', '.join(ARCHIVE_FORMATS)} or dir)")
+        unknown = sorted(set(spec) - SPEC_FIELDS)
+        if unknown:
+            raise HTTPError(400, f"Unknown spec field(s): {', '.join(unknown)}")
+        if not isinstance(spec.get('author_info') or {}, dict):
+            raise HTTPError(400, "'author_info' must be a JSON object")
+        if spec.get('icon_path'):
+            spec['icon_path'] = self._icon_path(spec['icon_path'])
+        if output_format == 'dir':
+            if self.output_root is None:
+                raise HTTPError(403, "Directory output is disabled; "
+                                     "start the server with an output root")
+            # Target directories are relative to the output root
+            for key in ('output_dir', 'project_dir'):
+                if spec.get(key):
+                    spec[key] = os.path.join(self.output_root, str(spec[key]))
+        try:
+            kwargs = self._specs.normalize_spec(spec)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+        if output_format == 'dir':
+            project_dir = kwargs['project_dir']
+            # Compare resolved paths so a symlink below the root cannot lead
+            # out of it; realpath() also resolves the existing part of a path
+            # that does not exist yet
+            root = os.path.realpath(self.output_root)
+            target = os.path.realpath(project_dir)
+            if os.path.commonpath([root, target]) != root or target == root:
+                raise HTTPError(403, "Project directory must be inside the output root")
+            if os.path.exists(project_dir):
+                raise HTTPError(409, f"Project directory already exists: {project_dir}")
+        else:
+            for key in ('project_dir', 'git_init', 'staged'):
+                kwargs.pop(key)
+        return kwargs
+
+    def _icon_path(self, icon_path):
+        """Resolve a requested icon below the output root.
+
+        The server must not read arbitrary files on behalf of a client, so
+        icons are only taken from inside the output root (after resolving
+        symlinks).
+        """
+        if self.output_root is None:
+            raise HTTPError(403, "Icons are disabled; "
+                                 "start the server with an output root")
+        root = os.path.realpath(self.output_root)
+        path = os.path.realpath(os.path.join(root, str(icon_path)))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            raise HTTPError(403, "Icon must be a file inside the output root")
+        return path
+
+    async def _submit(self, func, *args):
+        """Wait for a free slot and run ``func(*args, cancel)`` on the pool.
+
+        Returns:
+            tuple: The asyncio future of the call and its cancel event
+        """
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self.counters['rejected'] += 1
+            raise HTTPError(503, "Too many generations queued; try again later")
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        cancel = threading.Event()
+        self._cancels.add(cancel)
+        self._active += 1
+        start = time.perf_counter()
+
+        def finished(future):
+            # Runs on the loop once the worker thread is really done
+            self._semaphore.release()
+            self._cancels.discard(cancel)
+            self._active -= 1
+            if future.cancelled():
+                error = GenerationCancelled()
+            else:
+                error = future.exception()
+            if isinstance(error, GenerationCancelled):
+                self.counters['cancelled'] += 1
+                return
+            self.counters['failed' if error else 'generated'] += 1
+            self._generation_seconds += time.perf_counter() - start
+
+        future = self._loop.run_in_executor(self._executor, func, *args, cancel)
+        future.add_done_callback(finished)
+        return future, cancel
+
+    async def _generate_directory(self, writer, kwargs):
+        future, cancel = await self._submit(self._write_directory, kwargs)
+        try:
+            summary = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+        except Exception as e:
+            raise HTTPError(_error_status(e), f"{type(e).__name__}: {e}") from None
+        await self._send_json(writer, 200, summary)
+
+    def _write_directory(self, kwargs, cancel):
+        """Worker: generate a project below the output root."""
+        start = time.perf_counter()
+        written = {}
+
+        def on_event(event):
+            if event['kind'] == 'phase' and event['name'] == 'write':
+                written.update(files=event['files'], bytes=event['bytes'])
+
+        self.generator.create_project_structure(cancel=cancel, on_event=on_event,
+                                                **kwargs)
+        return {'project_dir': kwargs['project_dir'], **written,
+                'duration': time.perf_counter() - start}
+
+    async def _stream_archive(self, writer, kwargs, output_format):
+        output_class, content_type, extension = ARCHIVE_FORMATS[output_format]
+        prefix = ProjectGenerator.sanitize_project_name(kwargs['project_name'])
+        stream = _ChunkStream(self._loop)
+        future, cancel = await self._submit(self._write_archive, kwargs, output_class,
+                                            prefix, stream)
+        head_sent = False
+        try:
+            while True:
+                chunk = await stream.queue.get()
+                if chunk is _DONE:
+                    break
+                if not head_sent:
+                    writer.write(self._head(200, content_type, [
+                        ('Transfer-Encoding', 'chunked'),
+                        ('Content-Disposition',
+                         f'attachment; filename="{prefix}{extension}"'),
+                    ]))
+                    head_sent = True
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                await writer.drain()
+            await asyncio.shield(future)
+        except BaseException as e:
+            cancel.set()
+            stream.abort()
+            if head_sent or not isinstance(e, Exception) \
+                    or isinstance(e, ConnectionError):
+                # Dropping the connection without the last chunk marks the
+                # archive as incomplete for the client
+                raise
+            raise HTTPError(_error_status(e), f"{type(e).__name__}: {e}") from None
+        if not head_sent:
+            # An empty project: nothing was written at all
+            writer.write(self._head(200, content_type,
+                                    [('Transfer-Encoding', 'chunked')]))
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _write_archive(self, kwargs, output_class, prefix, stream, cancel):
+        """Worker: render a project into an archive streamed to the client."""
+
+        def on_event(event):
+            if event['kind'] == 'phase_start' and event['name'] == 'write':
+                stream.start()
+
+        try:
+            with output_class(stream, prefix) as output:
+                written = self.generator.generate_to(output, cancel=cancel,
+                                                     on_event=on_event, **kwargs)
+            stream.finish()
+            return written
+        finally:
+            stream.done()
+
+    async def _send_json(self, writer, status, payload, headers=()):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(self._head(status, 'application/json',
+                                [('Content-Length', len(body)), *headers]) + body)
+        await writer.drain()
+
+    @staticmethod
+    def _head(status, content_type, headers):
+        lines = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            f"Content-Type: {content_type}",
+            "Connection: close",
+            *(f"{name}: {value}" for name, value in headers),
+        ]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+
+def _error_status(error):
+    """HTTP status for an exception raised by a generation."""
+    if isinstance(error, FileExistsError):
+        return 409
+    if isinstance(error, (ValueError, FileNotFoundError)):
+        return 400
+    return 500
+
+
+def serve(host="127.0.0.1", port=DEFAULT_PORT, unix_socket=None, **options):
+    """Run a ``GenerationServer`` until interrupted.
+
+    Args:
+        host: Interface to bind
+        port: TCP port
+        unix_socket: Listen on this Unix socket path instead of TCP
+        **options: Arguments for ``GenerationServer``
+    """
+    async def main():
+        server = GenerationServer(**options)
+        await server.start(host=host, port=port, unix_socket=unix_socket)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
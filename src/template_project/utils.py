@@ -1,14 +1,59 @@
 """Configuration management utilities."""
 import json
+import logging
 import os
-import tkinter as tk
+import threading
+
+# Configure module logger
+logger = logging.getLogger(__name__)
 
 
 class ConfigManager:
-    """Manages loading and saving of user configuration."""
+    """Manages loading and saving of user configuration.
+
+    The manager keeps the authoritative copy of the configuration in memory
+    and writes it behind: ``save_config`` only updates the in-memory copy and
+    schedules a flush, so a burst of saves (one per keystroke in a text
+    field) within ``debounce`` seconds costs a single write. Writes go to a
+    temporary file that atomically replaces the config file. Call ``flush``
+    or ``close`` before exiting to write pending changes.
+
+    Reads are served from memory too. The file is only parsed again when its
+    modification time or size changed, e.g. because another process wrote
+    it; pending unsaved changes are re-applied on top. Use
+    ``ConfigManager.shared()`` so all windows and tabs share one instance.
+
+    Named presets of the non-project fields (author, Python version, theme,
+    output directory, icon) live in a ``ProfileStore`` reachable through
+    ``profiles``, ``apply_profile`` and ``save_profile``.
+    """
+
+    # Seconds saves are coalesced for before the file is written
+    DEBOUNCE_SECONDS = 0.5
 
-    def __init__(self, config_file="config.json"):
+    # Instances returned by shared(), by absolute config file path
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config_file="config.json", debounce=DEBOUNCE_SECONDS,
+                 profiles_db=None):
+        """
+        Args:
+            config_file: Path of the JSON configuration file
+            debounce: Delay before pending changes are written; 0 writes on
+                every save
+            profiles_db: Profile database (default: ``profiles.db`` in the
+                working directory, shared with the command line)
+        """
         self.config_file = config_file
+        self.debounce = debounce
+        self.profiles_db = profiles_db
+        self._profiles = None
+        self._lock = threading.RLock()
+        self._config = None
+        self._file_key = None  # (mtime_ns, size) of the file _config matches
+        self._pending = {}     # Changes not written to the file yet
+        self._timer = None
         self.default_config = {
             # Project fields
             "project_name": "",
@@ -25,8 +70,44 @@ class ConfigManager:
             "mode": "dark"
         }
 
+    @classmethod
+    def shared(cls, config_file="config.json"):
+        """Return the process-wide manager of ``config_file``."""
+        abs_path = os.path.abspath(config_file)
+        with cls._shared_lock:
+            manager = cls._shared.get(abs_path)
+            if manager is None:
+                manager = cls._shared[abs_path] = cls(config_file)
+            return manager
+
     def load_config(self):
-        """Load configuration from file or return defaults."""
+        """Return the configuration, reading the file only if it changed.
+
+        Returns:
+            dict: A copy of the configuration with all default keys present
+        """
+        with self._lock:
+            return dict(self._current())
+
+    def _current(self):
+        """Return the in-memory configuration, refreshed if the file changed."""
+        file_key = self._stat_file()
+        if self._config is None or file_key != self._file_key:
+            config = self._read_config()
+            config.update(self._pending)
+            self._config = config
+            self._file_key = file_key
+        return self._config
+
+    def _stat_file(self):
+        try:
+            stat = os.stat(os.path.abspath(self.config_file))
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_config(self):
+        """Read the config file, filling in defaults."""
         try:
             abs_path = os.path.abspath(self.config_file)
             if os.path.exists(abs_path):
@@ -39,37 +120,97 @@ class ConfigManager:
             else:
                 return self.default_config.copy()
         except Exception as e:
-            print(f"Error loading config: {e}")
+            logger.error(f"Error loading config: {e}")
             return self.default_config.copy()
 
-
-
     def get(self, key, default=None):
-        config = self.load_config()
-        return config.get(key, default)
+        with self._lock:
+            return self._current().get(key, default)
 
     def update(self, updates):
-        config = self.load_config()
-        config.update(updates)
-        self.save_config(config)
+        self.save_config(updates)
 
     def save_config(self, config):
-        """Save configuration to file, merging with any existing config to preserve all keys."""
-        try:
+        """Merge ``config`` into the configuration and schedule a write."""
+        with self._lock:
+            current = self._current()
+            changes = {key: value for key, value in config.items()
+                       if key not in current or current[key] != value}
+            if not changes:
+                return
+            current.update(changes)
+            self._pending.update(changes)
+            if self.debounce <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write pending changes to the config file now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            # Pick up changes other processes made since the last read
+            config = self._current()
             abs_path = os.path.abspath(self.config_file)
-            print(f"[DEBUG] Writing config to: {abs_path}")
-            # Merge with existing config to preserve all keys
-            existing = {}
-            if os.path.exists(abs_path):
-                with open(abs_path, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            merged = existing.copy()
-            merged.update(config)
-            with open(abs_path, "w", encoding="utf-8") as f:
-                json.dump(merged, f, indent=4)
-            print(f"[DEBUG] Config successfully written to: {abs_path}")
-        except Exception as e:
-            print(f"[DEBUG] Error saving config to {abs_path}: {e}")
+            tmp_path = f"{abs_path}.tmp-{os.getpid()}-{threading.get_ident()}"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(config, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, abs_path)
+                self._pending = {}
+                self._file_key = self._stat_file()
+                logger.debug(f"Config written to: {abs_path}")
+            except Exception as e:
+                logger.error(f"Error saving config to {abs_path}: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def close(self):
+        """Write pending changes and stop the background timer."""
+        self.flush()
+        with self._lock:
+            if self._profiles is not None:
+                self._profiles.close()
+                self._profiles = None
+
+    @property
+    def profiles(self):
+        """The ``ProfileStore`` of saved presets, opened on first use."""
+        with self._lock:
+            if self._profiles is None:
+                from .profile_store import ProfileStore
+
+                self._profiles = ProfileStore(self.profiles_db)
+            return self._profiles
+
+    def apply_profile(self, name):
+        """Copy a profile's fields into the configuration.
+
+        Returns:
+            dict: The applied fields
+
+        Raises:
+            KeyError: If there is no such profile
+        """
+        fields = self.profiles.get_profile(name)
+        if fields is None:
+            raise KeyError(name)
+        self.save_config(fields)
+        return fields
+
+    def save_profile(self, name, tags=None):
+        """Save the profile fields of the current configuration as ``name``."""
+        return self.profiles.save_profile(name, self.load_config(), tags=tags)
 
     def apply_config_to_vars(self, config, var_dict):
         """Apply loaded config to tkinter StringVar objects.
@@ -78,6 +219,8 @@ class ConfigManager:
             config: Configuration dictionary
             var_dict: Dictionary mapping config keys to StringVar objects
         """
+        import tkinter as tk
+
         for key, var in var_dict.items():
             if key in config and isinstance(var, tk.StringVar):
                 var.set(config[key])
@@ -91,6 +234,8 @@ class ConfigManager:
         Returns:
             dict: Configuration dictionary
         """
+        import tkinter as tk
+
         config = {}
         for key, var in var_dict.items():
             if isinstance(var, tk.StringVar):